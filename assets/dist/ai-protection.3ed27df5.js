@@ -0,0 +1,8 @@
+(function(){'use strict';const AI_BOTS=['GPTBot','ChatGPT-User','CCBot','anthropic-ai','Claude-Web','ClaudeBot','Bard','Gemini','Google-Extended','PerplexityBot','YouBot','Meta-ExternalAgent','Meta-ExternalFetcher','FacebookBot','Diffbot','Scrapy','python-requests','Bytespider','Applebot-Extended','OAI-SearchBot','img2dataset','ImagifyBot','DataForSeoBot','VelenPublicWebCrawler','Omgilibot','FriendlyCrawler','Timpibot'];function detectAIBot(){const userAgent=navigator.userAgent;for(const bot of AI_BOTS){if(userAgent.toLowerCase().includes(bot.toLowerCase())){return true;}}
+if(navigator.webdriver||window.navigator.webdriver||window.phantom||window._phantom||window.callPhantom){return true;}
+if(!navigator.languages||navigator.languages.length===0){return true;}
+return false;}
+function protectContent(){if(detectAIBot()){console.log('🤖 AI bot detected - Content protection activated');const contentElements=document.querySelectorAll('p, h1, h2, h3, h4, h5, h6, span');contentElements.forEach(el=>{if(el.textContent.trim().length>50){el.textContent='[Content protected from automated access]';}});const images=document.querySelectorAll('img');images.forEach(img=>{img.style.display='none';img.alt='[Image protected from automated access]';});setTimeout(()=>{window.location.href='data:text/plain,Content protected from automated access';},1000);return;}}
+function disableScrapingMethods(){document.addEventListener('contextmenu',function(e){if(e.target.tagName==='IMG'){e.preventDefault();return false;}});document.addEventListener('dragstart',function(e){if(e.target.tagName==='IMG'){e.preventDefault();return false;}});document.addEventListener('selectstart',function(e){if(e.target.closest('.protected-content')){e.preventDefault();return false;}});let rapidClicks=0;document.addEventListener('click',function(){rapidClicks++;setTimeout(()=>rapidClicks--,1000);if(rapidClicks>10){console.log('🚨 Suspicious automated activity detected');document.body.innerHTML='<p>Suspicious activity detected. Please visit manually.</p>';}});}
+function addConsoleWarning(){const styles=['color: #ff4444','font-size: 20px','font-weight: bold','text-shadow: 2px 2px 0px rgba(0,0,0,0.3)'].join(';');console.log('%c⚠️  WARNING: CONTENT PROTECTED',styles);console.log('%cThis website\'s content is protected by copyright.','color: #ff6666; font-size: 14px;');console.log('%cAutomated scraping, data mining, and AI training use is prohibited.','color: #ff6666; font-size: 14px;');console.log('%c© 2025 Pavan Kumar Dharmoju - All rights reserved','color: #666; font-size: 12px;');}
+document.addEventListener('DOMContentLoaded',function(){protectContent();disableScrapingMethods();addConsoleWarning();});if(document.readyState!=='loading'){protectContent();disableScrapingMethods();addConsoleWarning();}})();
\ No newline at end of file
@@ -307,7 +307,27 @@ class ProjectsCMSManager {
         preview.innerHTML = html;
     }
 
+    async loadProjectsEntriesFromStore() {
+        // The server's entries store is a few KB of JSON; no HTML parsing needed
+        try {
+            const response = await fetch('/api/entries?page=projects');
+            if (!response.ok) return false;
+            const data = await response.json();
+            if (!data.stored) return false;
+            
+            this.projectsEntries = data.entries;
+            this.updateProjectsEntriesDisplay();
+            this.updateProjectsPreview();
+            this.showProjectsNotification(`Loaded ${data.count} projects from the entries store`, 'success');
+            return true;
+        } catch (error) {
+            return false;
+        }
+    }
+
     async loadExistingProjectsEntries() {
+        if (await this.loadProjectsEntriesFromStore()) return;
+        
         try {
             const response = await fetch('/projects.html');
             const html = await response.text();
@@ -391,6 +411,8 @@ class ProjectsCMSManager {
         const title = document.getElementById('projects-title')?.value || 'Project Build Log';
         const description = document.getElementById('projects-description')?.value || 'Systems I\'ve architected, bugs I\'ve hunted down, and experiments that taught me something new.';
         
+        if (await this.saveProjectsToStore(title, description, autoCommit)) return;
+        
         let html = `<!DOCTYPE html>
 <html lang="en">
 <head>
@@ -499,6 +521,56 @@ class ProjectsCMSManager {
         await this.saveProjectsFile('projects.html', html, autoCommit);
     }
 
+    async commitProjectsFiles(files) {
+        console.log('Triggering git commit...');
+        const commitResponse = await fetch('http://localhost:8000/git-commit', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({
+                message: `Update ${files[0]} via Projects CMS`,
+                files: files
+            })
+        });
+        
+        const commitResponseText = await commitResponse.text();
+        console.log('Git commit response:', commitResponseText);
+        
+        let commitJob = null;
+        if (commitResponse.ok) {
+            commitJob = await this.waitForProjectsGitJob(JSON.parse(commitResponseText).job_id);
+        }
+        
+        if (commitJob && commitJob.status === 'succeeded') {
+            this.showProjectsNotification('✅ File saved and committed to Git successfully!', 'success');
+        } else {
+            this.showProjectsNotification('⚠️ File saved but Git commit failed. Check server logs.', 'warning');
+        }
+    }
+
+    async saveProjectsToStore(title, description, autoCommit = false) {
+        // The server renders projects.html from its entries store
+        try {
+            const response = await fetch('http://localhost:8000/api/entries?page=projects', {
+                method: 'PUT',
+                headers: { 'Content-Type': 'application/json' },
+                body: JSON.stringify({
+                    entries: this.projectsEntries,
+                    settings: { title, description }
+                })
+            });
+            if (!response.ok) return false;
+        } catch (error) {
+            return false;
+        }
+        
+        if (autoCommit) {
+            await this.commitProjectsFiles(['projects.html', 'cms_data.json']);
+        } else {
+            this.showProjectsNotification('✅ projects.html rebuilt from the entries store!', 'success');
+        }
+        return true;
+    }
+
     async saveProjectsFile(filename, content, autoCommit = false) {
         // Check if the Projects server is running by looking for projects server status
         const serverStatus = document.getElementById('projects-server-status');
@@ -527,25 +599,7 @@ class ProjectsCMSManager {
                     console.log(`✅ Server saved: ${filename}`);
                     
                     if (autoCommit) {
-                        // Trigger git commit
-                        console.log('Triggering git commit...');
-                        const commitResponse = await fetch('http://localhost:8000/git-commit', {
-                            method: 'POST',
-                            headers: { 'Content-Type': 'application/json' },
-                            body: JSON.stringify({
-                                message: `Update ${filename} via Projects CMS`,
-                                files: [filename]
-                            })
-                        });
-                        
-                        const commitResponseText = await commitResponse.text();
-                        console.log('Git commit response:', commitResponseText);
-                        
-                        if (commitResponse.ok) {
-                            this.showProjectsNotification('✅ File saved and committed to Git successfully!', 'success');
-                        } else {
-                            this.showProjectsNotification('⚠️ File saved but Git commit failed. Check server logs.', 'warning');
-                        }
+                        await this.commitProjectsFiles([filename]);
                     } else {
                         this.showProjectsNotification(`✅ ${filename} saved successfully to project directory!`, 'success');
                     }
@@ -600,6 +654,21 @@ class ProjectsCMSManager {
         return Math.random().toString(36).substring(2, 9);
     }
 
+    async waitForProjectsGitJob(jobId, intervalMs = 1000) {
+        // Git commits run in the background on the server; poll until done
+        while (true) {
+            const response = await fetch(`http://localhost:8000/git-jobs/${jobId}`);
+            if (!response.ok) {
+                return null;
+            }
+            const job = await response.json();
+            if (job.status === 'succeeded' || job.status === 'failed') {
+                return job;
+            }
+            await new Promise(resolve => setTimeout(resolve, intervalMs));
+        }
+    }
+
     async checkProjectsServerStatus() {
         const statusElement = document.getElementById('projects-server-status');
         if (!statusElement) return;
@@ -14,6 +14,7 @@ class CMSManager {
         this.loadExistingWorkEntries();
         this.updatePreview();
         this.checkServerStatus();
+        this.setupLiveReload();
     }
 
     async checkServerStatus() {
@@ -32,6 +33,18 @@ class CMSManager {
         }
     }
 
+    setupLiveReload() {
+        // `cms_server.py --watch` announces rebuilt pages over Server-Sent Events
+        if (!window.EventSource) return;
+        const events = new EventSource('/events');
+        events.addEventListener('rebuild', (event) => {
+            const { files } = JSON.parse(event.data);
+            if (files.includes('work.html')) {
+                this.loadExistingWorkEntries();
+            }
+        });
+    }
+
     showServerStatus(isRunning) {
         const statusDiv = document.createElement('div');
         statusDiv.id = 'server-status';
@@ -435,12 +448,46 @@ class CMSManager {
         preview.innerHTML = html;
     }
 
+    async loadWorkEntriesFromStore() {
+        // The server's entries store is a few KB of JSON; no HTML parsing needed
+        try {
+            const response = await fetch('/api/entries?page=work');
+            if (!response.ok) return false;
+            const data = await response.json();
+            if (!data.stored) return false;
+            
+            if (data.settings.title) {
+                document.getElementById('work-title').value = data.settings.title;
+            }
+            if (data.settings.description) {
+                document.getElementById('work-description').value = data.settings.description;
+            }
+            this.workEntries = data.entries.map((entry, index) => ({
+                id: Date.now() + index,
+                timestamp: new Date().toISOString(),
+                ...entry
+            }));
+            this.updateEntriesList();
+            this.updatePreview();
+            this.showNotification(`Loaded ${data.count} entries from the entries store`, 'success');
+            return true;
+        } catch (error) {
+            return false;
+        }
+    }
+
     async loadExistingWorkEntries() {
+        if (await this.loadWorkEntriesFromStore()) return;
+        
         try {
             // Fetch the actual work.html file
             const response = await fetch('./work.html');
             const htmlText = await response.text();
             
+            // Remember what we loaded so the next save can send only a delta
+            this.workHtmlBase = htmlText;
+            this.workHtmlHash = response.headers.get('ETag');
+            
             // Parse the HTML
             const parser = new DOMParser();
             const doc = parser.parseFromString(htmlText, 'text/html');
@@ -577,10 +624,32 @@ class CMSManager {
         this.showNotification('Loaded sample entries (could not fetch work.html)', 'info');
     }
 
+    async saveWorkEntriesToStore(title, description) {
+        // The server renders work.html from its entries store
+        try {
+            const response = await fetch('/api/entries?page=work', {
+                method: 'PUT',
+                headers: { 'Content-Type': 'application/json' },
+                body: JSON.stringify({
+                    entries: this.workEntries,
+                    settings: { title, description }
+                })
+            });
+            return response.ok;
+        } catch (error) {
+            return false;
+        }
+    }
+
     async exportHTML() {
         const title = document.getElementById('work-title').value;
         const description = document.getElementById('work-description').value;
         
+        if (await this.saveWorkEntriesToStore(title, description)) {
+            this.showNotification('✅ work.html rebuilt from the entries store!', 'success');
+            return true;
+        }
+        
         let entriesHTML = '';
         this.workEntries.forEach(entry => {
             entriesHTML += `
@@ -610,18 +679,12 @@ class CMSManager {
         
         try {
             // Always try server-side save first
-            const response = await fetch('/save-file', {
-                method: 'POST',
-                headers: {
-                    'Content-Type': 'application/json',
-                },
-                body: JSON.stringify({
-                    filename: 'work.html',
-                    content: completeHTML
-                })
-            });
+            const response = await this.saveWorkHTML(completeHTML);
             
             if (response.ok) {
+                const result = await response.json();
+                this.workHtmlBase = completeHTML;
+                this.workHtmlHash = result.hash;
                 this.showNotification('✅ work.html saved to project directory!', 'success');
                 return true;
             } else {
@@ -636,6 +699,47 @@ class CMSManager {
         }
     }
 
+    async saveWorkHTML(completeHTML) {
+        // Send only the changed lines when we know which version the server has
+        if (this.workHtmlHash && this.workHtmlBase !== undefined) {
+            const response = await fetch('/save-file', {
+                method: 'POST',
+                headers: { 'Content-Type': 'application/json' },
+                body: JSON.stringify({
+                    filename: 'work.html',
+                    base_hash: this.workHtmlHash,
+                    ops: this.lineDelta(this.workHtmlBase, completeHTML)
+                })
+            });
+            // 409: work.html changed on the server since we loaded it; send it whole
+            if (response.status !== 409) return response;
+        }
+        
+        return fetch('/save-file', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({
+                filename: 'work.html',
+                content: completeHTML
+            })
+        });
+    }
+
+    lineDelta(base, next) {
+        // One replace op spanning everything between the common leading and trailing lines
+        const a = base.split('\n');
+        const b = next.split('\n');
+        let start = 0;
+        while (start < a.length && start < b.length && a[start] === b[start]) start++;
+        let endA = a.length;
+        let endB = b.length;
+        while (endA > start && endB > start && a[endA - 1] === b[endB - 1]) {
+            endA--;
+            endB--;
+        }
+        return [{ start, end: endA, lines: b.slice(start, endB) }];
+    }
+
     generateCompleteWorkHTML(title, description, entriesHTML) {
         return `<!DOCTYPE html>
 <html lang="en">
@@ -845,6 +949,10 @@ class CMSManager {
                 
                 if (response.ok) {
                     const result = await response.json();
+                    const job = await this.waitForGitJob(result.job_id);
+                    if (job.status !== 'succeeded') {
+                        throw new Error(job.error || 'Git commit via server failed');
+                    }
                     this.showNotification('🎉 Changes committed and pushed successfully!', 'success');
                     
                     // Show success details
@@ -863,6 +971,21 @@ class CMSManager {
         }
     }
 
+    async waitForGitJob(jobId, intervalMs = 1000) {
+        // The server commits in the background; poll until the job finishes
+        while (true) {
+            const response = await fetch(`/git-jobs/${jobId}`);
+            if (!response.ok) {
+                throw new Error('Git job status unavailable');
+            }
+            const job = await response.json();
+            if (job.status === 'succeeded' || job.status === 'failed') {
+                return job;
+            }
+            await new Promise(resolve => setTimeout(resolve, intervalMs));
+        }
+    }
+
     showManualMoveInstructions() {
         const instruction = document.createElement('div');
         instruction.className = 'fixed top-20 right-4 bg-yellow-50 border border-yellow-300 rounded-lg shadow-lg p-4 max-w-md z-50';
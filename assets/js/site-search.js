@@ -0,0 +1,183 @@
+/**
+ * Site search client
+ * ------------------
+ * Queries the static index cms_generator.py writes to /search/. The manifest
+ * (index.json) maps each two-letter term prefix to a shard, so a query only
+ * downloads the shards for its own terms, plus the document chunks for the
+ * results it shows. Postings are stored as delta-encoded document ids with
+ * a parallel array of scores. Shard and chunk names carry the index key, so
+ * they can be cached forever.
+ *
+ * Pages with a <form data-site-search> search box get live results; see bind().
+ *
+ * Usage:
+ *   const { total, results } = await SiteSearch.search('rag pipeline', { limit: 10, page: 'work' });
+ *   // results: [{ id, page, title, url, snippet, tags, score }]
+ */
+const SiteSearch = (() => {
+  'use strict';
+
+  const BASE = '/search/';
+  // Keep in sync with STOPWORDS in cms_search.py
+  const STOPWORDS = new Set(('a an and are as at be but by for from has have i in is it its of on or so that the ' +
+    'this to was we were what when which with you my me our not no').split(' '));
+
+  let manifest = null;
+  const files = new Map();
+
+  const tokenize = text =>
+    (text.toLowerCase().match(/[a-z0-9]+/g) || []).filter(t => t.length > 1 && !STOPWORDS.has(t));
+
+  async function fetchJson(name) {
+    if (!files.has(name)) {
+      files.set(name, fetch(BASE + name).then(r => {
+        if (!r.ok) throw new Error(`${name}: HTTP ${r.status}`);
+        return r.json();
+      }));
+    }
+    return files.get(name);
+  }
+
+  async function loadManifest() {
+    if (!manifest) {
+      manifest = await (await fetch(BASE + 'index.json', { cache: 'no-cache' })).json();
+    }
+    return manifest;
+  }
+
+  // Same rule as shards_for in cms_search.py: the longest prefix that owns the
+  // term, plus every longer prefix that extends it when matching as a prefix
+  function shardsFor(term, prefixMatch) {
+    const prefixes = Object.keys(manifest.prefixes);
+    const owner = prefixes.filter(p => term.startsWith(p)).sort((a, b) => b.length - a.length)[0];
+    const ids = new Set(owner === undefined ? [] : [manifest.prefixes[owner]]);
+    if (prefixMatch || term.length < 2) {
+      prefixes.filter(p => p.startsWith(term)).forEach(p => ids.add(manifest.prefixes[p]));
+    }
+    return ids;
+  }
+
+  // Document scores for a term, or for every term starting with it
+  async function postings(term, prefixMatch) {
+    const shardIds = shardsFor(term, prefixMatch);
+    const scores = new Map();
+    for (const id of shardIds) {
+      const shard = await fetchJson(`terms-${manifest.key.slice(0, 8)}-${id}.json`);
+      const names = prefixMatch ? Object.keys(shard).filter(t => t.startsWith(term)) : [term];
+      for (const name of names) {
+        if (!shard[name]) continue;
+        const [gaps, weights] = shard[name];
+        let docId = 0;
+        gaps.forEach((gap, i) => {
+          docId += gap;
+          scores.set(docId, (scores.get(docId) || 0) + weights[i]);
+        });
+      }
+    }
+    return scores;
+  }
+
+  async function documentFor(id) {
+    const perChunk = manifest.docs_per_chunk;
+    const rows = await fetchJson(`docs-${manifest.key.slice(0, 8)}-${Math.floor(id / perChunk)}.json`);
+    const [page, title, url, snippet, tags] = rows[id % perChunk];
+    return { id, page, title, url, snippet, tags };
+  }
+
+  // Every term must match; the last one also matches as a prefix while the user is typing
+  async function search(query, { limit = 10, page = null } = {}) {
+    await loadManifest();
+    const terms = tokenize(query);
+    let scores = null;
+    for (let i = 0; i < terms.length; i++) {
+      const matches = await postings(terms[i], i === terms.length - 1 && !/\s$/.test(query));
+      if (scores === null) {
+        scores = matches;
+      } else {
+        for (const [id, score] of scores) {
+          if (matches.has(id)) scores.set(id, score + matches.get(id));
+          else scores.delete(id);
+        }
+      }
+      if (!scores.size) break;
+    }
+    let ranked = [...(scores || new Map())];
+    if (page) {
+      const [start, end] = manifest.pages[page] || [0, 0];
+      ranked = ranked.filter(([id]) => id >= start && id < end);
+    }
+    ranked.sort((a, b) => b[1] - a[1] || a[0] - b[0]);
+    const results = await Promise.all(
+      ranked.slice(0, limit).map(async ([id, score]) => ({ ...(await documentFor(id)), score }))
+    );
+    return { query, terms, total: ranked.length, results };
+  }
+
+  // Search box: <form data-site-search> with an <input type="search"> and a
+  // [data-site-search-results] list, filled as the visitor types
+  function bind(form) {
+    const input = form.querySelector('input[type="search"]');
+    const list = form.querySelector('[data-site-search-results]');
+    if (!input || !list) return;
+    let latest = 0;
+    let timer = null;
+
+    async function update() {
+      const query = input.value;
+      const ticket = ++latest;
+      if (!tokenize(query).length) {
+        list.replaceChildren();
+        list.hidden = true;
+        return;
+      }
+      let found;
+      try {
+        found = await search(query, { limit: 8 });
+      } catch (error) {
+        console.warn('Site search unavailable:', error);
+        return;
+      }
+      if (ticket !== latest) return; // a newer query is already on its way
+      list.replaceChildren(...found.results.map(result => {
+        const item = document.createElement('li');
+        const link = document.createElement('a');
+        link.href = result.url;
+        link.className = 'block px-3 py-2 hover:bg-gray-50';
+        const title = document.createElement('span');
+        title.className = 'block text-sm text-gray-900';
+        title.textContent = result.title;
+        const snippet = document.createElement('span');
+        snippet.className = 'block text-xs text-gray-500 truncate';
+        snippet.textContent = result.snippet;
+        link.append(title, snippet);
+        item.append(link);
+        return item;
+      }));
+      if (!found.results.length) {
+        const empty = document.createElement('li');
+        empty.className = 'px-3 py-2 text-sm text-gray-500';
+        empty.textContent = 'No results';
+        list.append(empty);
+      }
+      list.hidden = false;
+    }
+
+    input.addEventListener('input', () => {
+      clearTimeout(timer);
+      timer = setTimeout(update, 150);
+    });
+    form.addEventListener('submit', event => {
+      event.preventDefault();
+      const first = list.querySelector('a');
+      if (first) window.location.href = first.href;
+    });
+  }
+
+  if (typeof document !== 'undefined') {
+    const bindAll = () => document.querySelectorAll('form[data-site-search]').forEach(bind);
+    if (document.readyState === 'loading') document.addEventListener('DOMContentLoaded', bindAll);
+    else bindAll();
+  }
+
+  return { search, tokenize, bind };
+})();
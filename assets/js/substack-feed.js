@@ -2,8 +2,10 @@
  * Substack feed renderer
  * -----------------------
  * Fetches a Substack publication's RSS feed and renders post cards into a
- * container. Substack's feed sends no CORS headers, so we go through a
- * CORS-enabled RSS->JSON service (rss2json) with a raw-XML proxy as fallback.
+ * container. The site's own /feed.json (written by cms_feed.py and kept fresh
+ * by cms_server.py) is tried first; Substack's feed sends no CORS headers, so
+ * without it we go through a CORS-enabled RSS->JSON service (rss2json) with a
+ * raw-XML proxy as the last fallback.
  *
  * Usage:
  *   SubstackFeed.render({
@@ -56,6 +58,15 @@ const SubstackFeed = (() => {
 
   // --- fetch strategies -------------------------------------------------
 
+  async function viaSameOrigin(feedUrl) {
+    // Already normalized to { title, link, date, image, excerpt } by cms_feed.py
+    const res = await fetch('/feed.json');
+    if (!res.ok) throw new Error('feed.json HTTP ' + res.status);
+    const data = await res.json();
+    if (data.source !== feedUrl || !Array.isArray(data.items)) throw new Error('feed.json is for ' + data.source);
+    return data.items;
+  }
+
   async function viaRss2Json(feedUrl) {
     // Note: the keyless rss2json endpoint rejects the `count` param (422),
     // so we fetch the default set and slice client-side.
@@ -95,6 +106,11 @@ const SubstackFeed = (() => {
   }
 
   async function loadItems(feedUrl) {
+    try {
+      return await viaSameOrigin(feedUrl);
+    } catch (e) {
+      console.warn('SubstackFeed: no local feed.json, trying rss2json —', e.message);
+    }
     try {
       return await viaRss2Json(feedUrl);
     } catch (e) {
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Backup store benchmark for cms_backup
+Backs up a work.html after each of a series of small edits and compares the
+disk used with what the old full-copy backup directories would take
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, ROOT)
+sys.path.insert(0, BENCH_DIR)
+
+from cms_backup import BackupStore, format_size  # noqa: E402
+from cms_generator import HTMLGenerator  # noqa: E402
+from datasets import make_work_data  # noqa: E402
+
+
+def percentile(samples, pct):
+    """Nearest-rank percentile of a list of samples"""
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def main():
+    import argparse
+    import random
+
+    parser = argparse.ArgumentParser(description='Benchmark content-addressed backups')
+    parser.add_argument('--entries', type=int, default=5000, help='Work entries in work.html')
+    parser.add_argument('--snapshots', type=int, default=30, help='Edit-and-backup rounds')
+
+    args = parser.parse_args()
+    workdir = tempfile.mkdtemp(prefix='cms-bench-backup-')
+    try:
+        data = make_work_data(args.entries)
+        generator = HTMLGenerator(workdir, precompress=False, search=False)
+        store = BackupStore(workdir)
+        rng = random.Random(0)
+        samples = []
+        for round_number in range(args.snapshots):
+            # One edited entry and one new entry per round, like a day of CMS use
+            data['workEntries'][rng.randrange(len(data['workEntries']))]['title'] += ' (edited)'
+            data['workEntries'].insert(0, dict(data['workEntries'][-1], commitHash=f'{round_number:07x}'))
+            generator.build_one('work', data)
+            start = time.perf_counter()
+            result = store.snapshot(['work.html'])
+            samples.append((time.perf_counter() - start) * 1000)
+        stats = store.stats()
+        used = stats['stored_bytes'] + stats['manifest_bytes']
+        print(f"📁 {stats['snapshots']} snapshots of work.html ({format_size(result['size'])}, "
+              f"{args.entries}+ entries)")
+        print(f"  Full copies:      {format_size(stats['logical_bytes'])}")
+        print(f"  Backup store:     {format_size(used)} ({stats['objects']} chunks, "
+              f"{format_size(stats['manifest_bytes'])} of manifests)")
+        print(f"  Saved:            {stats['saved_ratio']:.1%}")
+        print(f"  Snapshot time:    p50 {percentile(samples, 50):.1f} ms, p99 {percentile(samples, 99):.1f} ms")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Throughput benchmark for cms_server.py --processes
+Runs the server with 1, 2, ... N processes and saturates it from separate client processes
+"""
+
+import http.client
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(BENCH_DIR)
+
+
+def percentile(samples, pct):
+    """Nearest-rank percentile of a list of samples"""
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def start_server(processes, workers, port):
+    command = [sys.executable, os.path.join(ROOT, 'cms_server.py'), '--port', str(port),
+               '--processes', str(processes), '--workers', str(workers), '--feed-url', '']
+    server = subprocess.Popen(command, cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.monotonic() + 15
+    while time.monotonic() < deadline:
+        try:
+            conn = http.client.HTTPConnection('127.0.0.1', port, timeout=1)
+            conn.request('GET', '/stats')
+            conn.getresponse().read()
+            conn.close()
+            return server
+        except OSError:
+            time.sleep(0.05)
+    server.kill()
+    raise RuntimeError(f'cms_server.py --processes {processes} did not start on port {port}')
+
+
+def stop_server(server):
+    server.send_signal(signal.SIGTERM)
+    try:
+        server.wait(timeout=30)
+    except subprocess.TimeoutExpired:
+        server.kill()
+
+
+def client(port, path, duration):
+    """Process-pool entry point: GET path in a loop for `duration` seconds"""
+    latencies = []
+    errors = 0
+    end = time.perf_counter() + duration
+    while time.perf_counter() < end:
+        start = time.perf_counter()
+        try:
+            conn = http.client.HTTPConnection('127.0.0.1', port, timeout=30)
+            conn.request('GET', path, headers={'Accept-Encoding': 'gzip'})
+            conn.getresponse().read()
+            conn.close()
+        except OSError:
+            errors += 1
+            continue
+        latencies.append(time.perf_counter() - start)
+    return latencies, errors
+
+
+def run_case(processes, workers, clients, path, duration, warmup):
+    port = free_port()
+    server = start_server(processes, workers, port)
+    try:
+        with ProcessPoolExecutor(max_workers=clients) as pool:
+            # Fill every worker's static cache before measuring
+            list(pool.map(client, [port] * clients, [path] * clients, [warmup] * clients))
+            start = time.perf_counter()
+            outcomes = list(pool.map(client, [port] * clients, [path] * clients, [duration] * clients))
+            elapsed = time.perf_counter() - start
+    finally:
+        stop_server(server)
+    latencies = [sample for samples, _ in outcomes for sample in samples]
+    return {
+        'processes': processes,
+        'requests': len(latencies),
+        'errors': sum(errors for _, errors in outcomes),
+        'rps': len(latencies) / elapsed,
+        'p50_ms': percentile(latencies, 50) * 1000,
+        'p99_ms': percentile(latencies, 99) * 1000
+    }
+
+
+def main():
+    import argparse
+
+    cpus = os.cpu_count() or 1
+    parser = argparse.ArgumentParser(description='Benchmark cms_server.py throughput from 1 to N processes')
+    parser.add_argument('--max-processes', type=int, default=cpus,
+                        help=f'Largest --processes to run (default: CPU count, {cpus})')
+    parser.add_argument('--workers', type=int, default=4, help='Worker threads per server process')
+    parser.add_argument('--clients', type=int, default=max(2, cpus * 2),
+                        help='Client processes generating load (default: 2 per CPU)')
+    parser.add_argument('--path', default='/work.html', help='Path to request')
+    parser.add_argument('--duration', type=float, default=5.0, help='Seconds to measure each case')
+    parser.add_argument('--warmup', type=float, default=1.0, help='Seconds of unmeasured load first')
+
+    args = parser.parse_args()
+    if cpus < 2:
+        print("⚠️  One CPU: the server and clients share it, so expect no speedup")
+
+    print(f"{'processes':<11}{'reqs':>8}{'errors':>8}{'req/s':>10}{'speedup':>9}{'p50 ms':>9}{'p99 ms':>9}")
+    baseline = None
+    for processes in range(1, args.max_processes + 1):
+        result = run_case(processes, args.workers, args.clients, args.path, args.duration, args.warmup)
+        baseline = baseline or result['rps']
+        print(f"{processes:<11}{result['requests']:>8}{result['errors']:>8}{result['rps']:>10.0f}"
+              f"{result['rps'] / baseline:>8.2f}x{result['p50_ms']:>9.2f}{result['p99_ms']:>9.2f}")
+
+
+if __name__ == '__main__':
+    main()
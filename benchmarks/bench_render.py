@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Render benchmark for cms_generator.HTMLGenerator
+Compares the compiled template engine with the previous f-string/str.replace
+rendering on synthetic work logs, reporting time and peak traced memory
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, ROOT)
+sys.path.insert(0, BENCH_DIR)
+
+from cms_generator import HTMLGenerator  # noqa: E402
+from datasets import make_work_data  # noqa: E402
+
+
+def legacy_render(generator, data):
+    """The pre-template renderer: f-strings, += accumulation and chained replace()"""
+    template = generator.templates['work'].source.replace('{entries_content|raw}', '{entries_content}')
+    entries_html = ''
+    for entry in data['workEntries']:
+        tags_html = ''.join([
+            f'<span class="px-2 py-1 {generator.get_tag_color_class(tag)} text-xs rounded">{tag}</span>'
+            for tag in entry['tags']
+        ])
+        entries_html += f'''
+                            <div class="border-l-2 border-gray-200 pl-6 pb-6">
+                                <div class="flex items-center gap-3 mb-3">
+                                    <div class="w-2 h-2 bg-{entry.get('statusColor', 'green')}-500 rounded-full -ml-7 border-2 border-white"></div>
+                                    <span class="font-mono text-sm text-gray-500">{entry.get('commitHash', '')}</span>
+                                    <span class="text-sm text-gray-500">•</span>
+                                    <span class="text-sm text-gray-500">{entry.get('date', '')}</span>
+                                </div>
+                                <h3 class="font-medium text-gray-900 mb-2">{entry.get('entryType', 'feat')}: {entry.get('title', '')}</h3>
+                                <p class="text-gray-700 text-sm mb-3">
+                                    {entry.get('description', '')}
+                                </p>
+                                <div class="flex gap-2">
+                                    {tags_html}
+                                </div>
+                            </div>'''
+    return (template
+            .replace('{page_title}', 'Build Log')
+            .replace('{page_description}', 'Benchmark')
+            .replace('{entries_content}', entries_html))
+
+
+def measure(func, *args):
+    """Time an untraced run, then repeat under tracemalloc for the peak"""
+    start = time.perf_counter()
+    size = len(func(*args))
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    func(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak, size
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Benchmark work.html rendering')
+    parser.add_argument('--sizes', default='10000,50000,100000', help='Comma-separated entry counts')
+
+    args = parser.parse_args()
+    generator = HTMLGenerator(ROOT)
+
+    print(f"{'renderer':<10}{'entries':>10}{'seconds':>10}{'peak MB':>10}{'output MB':>11}")
+    for count in (int(size) for size in args.sizes.split(',')):
+        data = make_work_data(count)
+        for label, func in (('legacy', legacy_render), ('compiled', None)):
+            if func is None:
+                elapsed, peak, size = measure(generator.generate_work_html, data)
+            else:
+                elapsed, peak, size = measure(func, generator, data)
+            print(f"{label:<10}{count:>10}{elapsed:>10.3f}{peak / 1e6:>10.1f}{size / 1e6:>11.1f}")
+
+
+if __name__ == '__main__':
+    main()
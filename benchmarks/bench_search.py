@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Search index benchmark for cms_search
+Builds the index for a synthetic corpus and reports its size on disk,
+what a browser downloads per query, and in-process and HTTP query latency
+"""
+
+import gzip
+import http.client
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import threading
+import time
+import urllib.parse
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, ROOT)
+sys.path.insert(0, BENCH_DIR)
+
+from cms_search import SEARCH_DIR, SearchIndex, shards_for, tokenize, write_index  # noqa: E402
+from cms_server import create_server  # noqa: E402
+from datasets import make_work_entries  # noqa: E402
+
+QUERIES = ['python', 'cache latency', 'embedding pipeline experiment', 'vec', 'rust index shard',
+           'worker', 'token parser', 'kubernetes deploy', 'zzz missing', 'sch']
+
+
+def percentile(samples, pct):
+    """Nearest-rank percentile of a list of samples"""
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def make_corpus(count):
+    """Split count entries across work, projects and blogs like the real site"""
+    entries = make_work_entries(count)
+    work, projects, blogs = (entries[:count * 3 // 5], entries[count * 3 // 5:count * 4 // 5],
+                             entries[count * 4 // 5:])
+    return {
+        'workEntries': work,
+        'projectsEntries': [dict(entry, organization='Personal') for entry in projects],
+        'blogsEntries': [{'title': entry['title'], 'excerpt': entry['description'],
+                          'link': f'https://example.com/p/{i}', 'date': entry['date']}
+                         for i, entry in enumerate(blogs)]
+    }
+
+
+def directory_size(directory):
+    raw = compressed = 0
+    for name in os.listdir(directory):
+        with open(os.path.join(directory, name), 'rb') as f:
+            data = f.read()
+        raw += len(data)
+        compressed += len(gzip.compress(data))
+    return raw, compressed
+
+
+def query_downloads(index, query):
+    """Bytes of term shards and of document chunks a browser fetches for one query"""
+    manifest = index.manifest
+    key = manifest['key'][:8]
+    terms = tokenize(query)
+    shards = set()
+    for position, term in enumerate(terms):
+        shards.update(shards_for(manifest['prefixes'], term, position == len(terms) - 1))
+    chunks = {result['id'] // manifest['docs_per_chunk'] for result in index.search(query)['results']}
+    return (sum(os.path.getsize(os.path.join(index.directory, f'terms-{key}-{n}.json')) for n in shards),
+            sum(os.path.getsize(os.path.join(index.directory, f'docs-{key}-{n}.json')) for n in chunks))
+
+
+def http_latencies(port, rounds):
+    samples = []
+    for _ in range(rounds):
+        for query in QUERIES:
+            conn = http.client.HTTPConnection('127.0.0.1', port, timeout=30)
+            start = time.perf_counter()
+            conn.request('GET', '/api/search?' + urllib.parse.urlencode({'q': query}))
+            conn.getresponse().read()
+            samples.append(time.perf_counter() - start)
+            conn.close()
+    return samples
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Benchmark the static search index')
+    parser.add_argument('--entries', type=int, default=50000, help='Corpus size')
+    parser.add_argument('--rounds', type=int, default=20, help='Times each query is repeated')
+
+    args = parser.parse_args()
+    workdir = tempfile.mkdtemp(prefix='cms-bench-search-')
+    cwd = os.getcwd()
+    os.chdir(workdir)
+    try:
+        data = make_corpus(args.entries)
+        result = write_index(data, SEARCH_DIR)
+        raw, compressed = directory_size(SEARCH_DIR)
+        print(f"🔎 {result['documents']} documents, {result['terms']} terms, {result['shards']} shards, "
+              f"built in {result['build_ms']:.0f} ms")
+        print(f"💾 Index on disk: {raw / 1e6:.2f} MB ({compressed / 1e6:.2f} MB gzipped), "
+              f"manifest {os.path.getsize(os.path.join(SEARCH_DIR, 'index.json')) / 1024:.1f} KB")
+
+        index = SearchIndex(SEARCH_DIR)
+        index.search('warm')  # load the manifest
+        print(f"\n{'query':<32}{'hits':>8}{'cold ms':>10}{'warm p50':>10}{'terms KB':>10}{'docs KB':>9}")
+        warm_samples = []
+        for query in QUERIES:
+            cold = SearchIndex(SEARCH_DIR)
+            cold_ms = cold.search(query)['ms']
+            samples = [index.search(query)['ms'] for _ in range(args.rounds)]
+            warm_samples += samples
+            terms_bytes, docs_bytes = query_downloads(index, query)
+            print(f"{query:<32}{index.search(query)['total']:>8}{cold_ms:>10.2f}"
+                  f"{statistics.median(samples):>10.2f}{terms_bytes / 1024:>10.1f}{docs_bytes / 1024:>9.1f}")
+        print(f"\nIn-process: p50 {percentile(warm_samples, 50):.2f} ms, p99 {percentile(warm_samples, 99):.2f} ms")
+
+        httpd = create_server(0, 8, host='127.0.0.1')
+        threading.Thread(target=httpd.serve_forever, daemon=True).start()
+        samples = http_latencies(httpd.server_address[1], args.rounds)
+        httpd.shutdown()
+        httpd.git_jobs.shutdown()
+        httpd.server_close()
+        print(f"GET /api/search: p50 {percentile(samples, 50) * 1000:.2f} ms, "
+              f"p99 {percentile(samples, 99) * 1000:.2f} ms")
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Load benchmark for cms_server.py
+Compares static GET latency for the single-threaded and pooled servers
+while one slow client holds a request open (like a blocking git push)
+"""
+
+import http.client
+import os
+import socket
+import statistics
+import sys
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from cms_server import create_server  # noqa: E402
+
+
+def percentile(samples, pct):
+    """Nearest-rank percentile of a list of samples"""
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def slow_client(port, stall, started):
+    """Send a request line, then stall before finishing the headers"""
+    with socket.create_connection(('127.0.0.1', port)) as sock:
+        sock.sendall(b'GET /work.html HTTP/1.1\r\n')
+        started.set()
+        time.sleep(stall)
+        sock.sendall(b'Host: localhost\r\n\r\n')
+        sock.recv(65536)
+
+
+def get_worker(port, path, requests, latencies, lock):
+    samples = []
+    for _ in range(requests):
+        conn = http.client.HTTPConnection('127.0.0.1', port, timeout=30)
+        start = time.perf_counter()
+        conn.request('GET', path)
+        conn.getresponse().read()
+        samples.append(time.perf_counter() - start)
+        conn.close()
+    with lock:
+        latencies.extend(samples)
+
+
+def run_case(workers, clients, requests, path, stall):
+    httpd = create_server(0, workers, host='127.0.0.1')
+    port = httpd.server_address[1]
+    server_thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    server_thread.start()
+
+    stall_thread = None
+    if stall > 0:
+        started = threading.Event()
+        stall_thread = threading.Thread(target=slow_client, args=(port, stall, started))
+        stall_thread.start()
+        started.wait()
+
+    latencies = []
+    lock = threading.Lock()
+    start = time.perf_counter()
+    threads = [
+        threading.Thread(target=get_worker, args=(port, path, requests, latencies, lock))
+        for _ in range(clients)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    if stall_thread:
+        stall_thread.join()
+    httpd.shutdown()
+    httpd.git_jobs.shutdown()
+    httpd.server_close()
+
+    return {
+        'workers': workers,
+        'requests': len(latencies),
+        'rps': len(latencies) / elapsed,
+        'p50_ms': percentile(latencies, 50) * 1000,
+        'p99_ms': percentile(latencies, 99) * 1000,
+        'mean_ms': statistics.mean(latencies) * 1000
+    }
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Benchmark cms_server.py GET latency')
+    parser.add_argument('--clients', type=int, default=16, help='Concurrent GET clients')
+    parser.add_argument('--requests', type=int, default=50, help='Requests per client')
+    parser.add_argument('--workers', type=int, default=8, help='Worker threads for the pooled run')
+    parser.add_argument('--path', default='/work.html', help='Path to request')
+    parser.add_argument('--stall', type=float, default=1.0,
+                        help='Seconds the slow client holds its request open (0 to disable)')
+
+    args = parser.parse_args()
+    os.chdir(ROOT)
+
+    print(f"{'mode':<16}{'reqs':>8}{'req/s':>10}{'p50 ms':>10}{'p99 ms':>10}")
+    for label, workers in (('single-thread', 1), (f'pool x{args.workers}', args.workers)):
+        result = run_case(workers, args.clients, args.requests, args.path, args.stall)
+        print(f"{label:<16}{result['requests']:>8}{result['rps']:>10.0f}"
+              f"{result['p50_ms']:>10.2f}{result['p99_ms']:>10.2f}")
+
+
+if __name__ == '__main__':
+    main()
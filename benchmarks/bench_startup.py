@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Startup benchmark for the CLI tools
+Reports module import time (python -X importtime) and the wall time of
+common commands, direct and through the generator daemon, against a budget
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, BENCH_DIR)
+
+from datasets import make_work_data  # noqa: E402
+
+IMPORT_MODULES = ('cms_client', 'git_commit', 'cms_generator')
+# Import rows are absolute; command rows are over a bare `python -c pass` on the same machine
+STARTUP_BUDGET_MS = {
+    'import cms_client': 6,
+    'import git_commit': 40,
+    'import cms_generator': 70,
+    'cms_generator.py --help': 100,
+    'no-op build': 170,
+    'no-op build via daemon': 60,
+}
+
+
+def percentile(samples, pct):
+    """Nearest-rank percentile of a list of samples"""
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def import_ms(module, env):
+    """Cumulative import time of module in ms, from -X importtime's last matching line"""
+    output = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                            cwd=ROOT, env=env, capture_output=True, text=True, check=True).stderr
+    for line in reversed(output.splitlines()):
+        parts = [part.strip() for part in line.split('|')]
+        if len(parts) == 3 and parts[2] == module:
+            return int(parts[1]) / 1000
+    raise RuntimeError(f'no importtime line for {module}')
+
+
+def wall_ms(command, cwd, env, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run(command, cwd=cwd, env=env, stdout=subprocess.DEVNULL, check=True)
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def wait_for_socket(path, timeout=10):
+    deadline = time.monotonic() + timeout
+    while not os.path.exists(path):
+        if time.monotonic() > deadline:
+            raise RuntimeError(f'daemon did not create {path}')
+        time.sleep(0.05)
+
+
+def main():
+    import argparse
+    import json
+
+    parser = argparse.ArgumentParser(description='Benchmark CLI startup time')
+    parser.add_argument('--repeat', type=int, default=10, help='Runs per command')
+    parser.add_argument('--entries', type=int, default=300, help='Work entries in the build dataset')
+
+    args = parser.parse_args()
+    workdir = tempfile.mkdtemp(prefix='cms-bench-startup-')
+    env = dict(os.environ, PYTHONPATH=ROOT, CMS_GENERATOR_SOCKET=os.path.join(workdir, 'generator.sock'))
+    generator = os.path.join(ROOT, 'cms_generator.py')
+    client = os.path.join(ROOT, 'cms_client.py')
+    daemon = None
+    try:
+        shutil.copytree(os.path.join(ROOT, '_templates'), os.path.join(workdir, '_templates'))
+        with open(os.path.join(workdir, 'data.json'), 'w', encoding='utf-8') as f:
+            json.dump(make_work_data(args.entries), f)
+        build = [sys.executable, generator, 'data.json', '--no-precompress']
+        subprocess.run(build, cwd=workdir, env=env, stdout=subprocess.DEVNULL, check=True)
+
+        results = {}
+        for module in IMPORT_MODULES:
+            # Best of several runs: importtime is noisy and the minimum is the stable part
+            results[f'import {module}'] = [min(import_ms(module, env) for _ in range(args.repeat))]
+        baseline = percentile(wall_ms([sys.executable, '-c', 'pass'], workdir, env, args.repeat), 50)
+        results['cms_generator.py --help'] = wall_ms([sys.executable, generator, '--help'], workdir, env, args.repeat)
+        results['no-op build'] = wall_ms(build, workdir, env, args.repeat)
+
+        daemon = subprocess.Popen([sys.executable, generator, '--daemon'], cwd=workdir, env=env,
+                                  stdout=subprocess.DEVNULL)
+        wait_for_socket(env['CMS_GENERATOR_SOCKET'])
+        client_build = [sys.executable, client, 'data.json', '--no-precompress']
+        results['no-op build via daemon'] = wall_ms(client_build, workdir, env, args.repeat)
+
+        print(f"🐍 python -c pass: {baseline:.1f} ms (wall times below are over this)\n")
+        print(f"{'measurement':<28}{'p50 ms':>9}{'budget':>9}")
+        over = []
+        for name, samples in results.items():
+            value = percentile(samples, 50)
+            if not name.startswith('import '):
+                value -= baseline
+            budget = STARTUP_BUDGET_MS[name]
+            flag = '' if value <= budget else '  ⚠️  over budget'
+            if flag:
+                over.append(name)
+            print(f"{name:<28}{value:>9.1f}{budget:>9}{flag}")
+        if over:
+            print(f"\n❌ {len(over)} measurement(s) over budget")
+            sys.exit(1)
+        print("\n✅ All measurements within budget")
+    finally:
+        if daemon:
+            daemon.terminate()
+            daemon.wait()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
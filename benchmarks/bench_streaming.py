@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Peak-memory benchmark for large static downloads from cms_server.py
+Serves files of growing size and records the server's peak RSS (Linux only)
+"""
+
+import http.client
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SERVER = os.path.join(ROOT, 'cms_server.py')
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def peak_rss_mb(pid):
+    with open(f'/proc/{pid}/status') as f:
+        for line in f:
+            if line.startswith('VmHWM:'):
+                return int(line.split()[1]) / 1024
+    return 0.0
+
+
+def wait_for_server(port, timeout=10):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            socket.create_connection(('127.0.0.1', port), timeout=0.2).close()
+            return
+        except OSError:
+            time.sleep(0.05)
+    raise RuntimeError('server did not start')
+
+
+def download(port, path):
+    conn = http.client.HTTPConnection('127.0.0.1', port)
+    conn.request('GET', path)
+    response = conn.getresponse()
+    total = 0
+    while True:
+        chunk = response.read(1024 * 1024)
+        if not chunk:
+            break
+        total += len(chunk)
+    conn.close()
+    return total
+
+
+def run_case(directory, sizes_mb, threshold_kb):
+    port = free_port()
+    proc = subprocess.Popen(
+        [sys.executable, SERVER, '--port', str(port), '--workers', '1',
+         '--cache-mb', '0', '--stream-threshold-kb', str(threshold_kb)],
+        cwd=directory, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        wait_for_server(port)
+        results = []
+        for size in sizes_mb:
+            start = time.perf_counter()
+            download(port, f'/file_{size}mb.bin')
+            elapsed = time.perf_counter() - start
+            results.append((size, elapsed, peak_rss_mb(proc.pid)))
+        return results
+    finally:
+        proc.terminate()
+        proc.wait()
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Measure server peak RSS while serving large files')
+    parser.add_argument('--sizes', default='1,16,64,256', help='Comma-separated file sizes in MB')
+
+    args = parser.parse_args()
+    sizes = [int(size) for size in args.sizes.split(',')]
+
+    with tempfile.TemporaryDirectory() as directory:
+        for size in sizes:
+            with open(os.path.join(directory, f'file_{size}mb.bin'), 'wb') as f:
+                f.truncate(size * 1024 * 1024)
+
+        print(f"{'mode':<12}{'file MB':>10}{'MB/s':>10}{'peak RSS MB':>14}")
+        for label, threshold_kb in (('read-all', 1 << 30), ('streaming', 256)):
+            for size, elapsed, rss in run_case(directory, sizes, threshold_kb):
+                print(f"{label:<12}{size:>10}{size / elapsed:>10.0f}{rss:>14.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Synthetic datasets for the benchmarks
+Seeded work logs and static site trees, so every run measures the same input
+"""
+
+import os
+import random
+
+TAGS = ['Python', 'JavaScript', 'Rust', 'RAG', 'Learning', 'Kubernetes', 'Data Viz', 'Automation',
+        'Machine Learning', 'API', 'CLI Tool', 'Web Scraping', 'PyTorch', 'Failed Experiment']
+WORDS = ('model pipeline cache latency embedding parser token search index prompt dataset schema '
+         'deploy worker queue shard vector server render template commit benchmark profile').split()
+SYLLABLES = 'ka lo mi ne ru ta vi so pe da li mo ze fu ri na te go'.split()
+VOCABULARY_SIZE = 8000
+# (size in bytes, count): many small pages and assets, a few large downloads
+STATIC_MIX = ((1024, 40), (16 * 1024, 20), (128 * 1024, 6), (1024 * 1024, 2), (4 * 1024 * 1024, 1))
+
+
+def make_vocabulary(size=VOCABULARY_SIZE, seed=0):
+    """WORDS followed by made-up words, most common first"""
+    rng = random.Random(seed)
+    words = list(WORDS)
+    seen = set(words)
+    while len(words) < size:
+        word = ''.join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4)))
+        if word not in seen:
+            seen.add(word)
+            words.append(word)
+    return words
+
+
+def make_work_entries(count, seed=0):
+    """`count` work log entries in the CMS export format.
+
+    Descriptions draw from a Zipf-distributed vocabulary, so a few words are
+    everywhere and most are rare, as in real text.
+    """
+    rng = random.Random(seed)
+    vocabulary = make_vocabulary(seed=seed)
+    weights = [1 / rank for rank in range(1, len(vocabulary) + 1)]
+    entries = []
+    for i in range(count):
+        words = ' '.join(rng.choices(vocabulary, weights, k=rng.randint(15, 45)))
+        entries.append({
+            'commitHash': f'{rng.getrandbits(28):07x}',
+            'date': f'Sep {i % 28 + 1}, 2025',
+            'statusColor': rng.choice(['green', 'blue', 'yellow', 'red', 'purple']),
+            'entryType': rng.choice(['feat', 'build', 'fix', 'docs']),
+            'title': f'{rng.choice(WORDS)} {rng.choice(WORDS)} experiment {i}',
+            'description': words.capitalize() + '.',
+            'tags': rng.sample(TAGS, rng.randint(1, 4))
+        })
+    return entries
+
+
+def make_work_data(count, seed=0):
+    return {'workEntries': make_work_entries(count, seed),
+            'pageSettings': {'title': 'Build Log', 'description': 'Benchmark'}}
+
+
+def make_static_tree(root, mix=STATIC_MIX, seed=0):
+    """Write a static site of mixed file sizes under root and return the URL paths"""
+    rng = random.Random(seed)
+    paths = []
+    for size, count in mix:
+        for i in range(count):
+            if size < 128 * 1024:
+                name = f'page-{size // 1024}k-{i}.html'
+                line = '<p>' + ' '.join(rng.choice(WORDS) for _ in range(12)) + '</p>\n'
+                body = (line * (size // len(line) + 1))[:size].encode('utf-8')
+            else:
+                name = f'asset-{size // 1024}k-{i}.bin'
+                body = rng.randbytes(size)
+            with open(os.path.join(root, name), 'wb') as f:
+                f.write(body)
+            paths.append('/' + name)
+    return paths
@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for the generator, server and git paths
+Writes machine-readable JSON and compares a run against a saved baseline
+
+    python benchmarks/suite.py run --out baseline.json
+    python benchmarks/suite.py run --out current.json
+    python benchmarks/suite.py compare baseline.json current.json
+"""
+
+import contextlib
+import http.client
+import io
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, ROOT)
+sys.path.insert(0, BENCH_DIR)
+
+from cms_generator import HTMLGenerator  # noqa: E402
+from cms_git import GitService  # noqa: E402
+from cms_server import create_server  # noqa: E402
+from datasets import make_static_tree, make_work_data  # noqa: E402
+
+BENCHMARKS = ('render', 'static', 'save', 'git')
+DEFAULT_THRESHOLD = 0.10
+# Metrics where a bigger number is better; every other metric is a time or a size
+HIGHER_IS_BETTER = ('_per_s', 'rps')
+
+
+def percentile(samples, pct):
+    """Nearest-rank percentile of a list of samples"""
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def latency_summary(samples):
+    return {
+        'p50_ms': percentile(samples, 50) * 1000,
+        'p95_ms': percentile(samples, 95) * 1000,
+        'p99_ms': percentile(samples, 99) * 1000,
+        'mean_ms': statistics.mean(samples) * 1000
+    }
+
+
+def bench_render(sizes, repeat):
+    """Render work.html for each entry count; best-of-repeat time and peak traced memory"""
+    generator = HTMLGenerator(ROOT)
+    results = {}
+    for count in sizes:
+        data = make_work_data(count)
+        times = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            html = generator.generate_work_html(data)
+            times.append(time.perf_counter() - start)
+        tracemalloc.start()
+        generator.generate_work_html(data)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        best = min(times)
+        results[f'render entries={count}'] = {
+            'seconds': best,
+            'entries_per_s': count / best,
+            'peak_mb': peak / 1e6,
+            'output_mb': len(html) / 1e6
+        }
+    return results
+
+
+def start_server(workers):
+    httpd = create_server(0, workers, host='127.0.0.1')
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    return httpd
+
+
+def stop_server(httpd):
+    httpd.shutdown()
+    httpd.git_jobs.shutdown()
+    httpd.server_close()
+
+
+def request(port, method, path, body=None, headers=None):
+    conn = http.client.HTTPConnection('127.0.0.1', port, timeout=60)
+    start = time.perf_counter()
+    conn.request(method, path, body=body, headers=headers or {})
+    response = conn.getresponse()
+    response.read()
+    elapsed = time.perf_counter() - start
+    conn.close()
+    return response.status, elapsed
+
+
+def bench_static(client_counts, requests, workers):
+    """GET a mixed-size static tree from N concurrent clients"""
+    results = {}
+    paths = make_static_tree('.')
+    for clients in client_counts:
+        httpd = start_server(workers)
+        port = httpd.server_address[1]
+        latencies = []
+        errors = []
+        lock = threading.Lock()
+
+        def client(seed):
+            rng = random.Random(seed)
+            samples = []
+            for _ in range(requests):
+                status, elapsed = request(port, 'GET', rng.choice(paths))
+                if status != 200:
+                    errors.append(status)
+                samples.append(elapsed)
+            with lock:
+                latencies.extend(samples)
+
+        threads = [threading.Thread(target=client, args=(seed,)) for seed in range(clients)]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+        stop_server(httpd)
+        if errors:
+            raise RuntimeError(f'static GET returned {sorted(set(errors))}')
+        results[f'static clients={clients}'] = {'rps': len(latencies) / elapsed, **latency_summary(latencies)}
+    return results
+
+
+def bench_save(entry_counts, requests, workers):
+    """POST full work.html saves of growing size to /save-file"""
+    results = {}
+    generator = HTMLGenerator(ROOT)
+    httpd = start_server(workers)
+    port = httpd.server_address[1]
+    try:
+        for count in entry_counts:
+            content = generator.generate_work_html(make_work_data(count))
+            body = json.dumps({'filename': 'work.html', 'content': content}).encode('utf-8')
+            headers = {'Content-Type': 'application/json'}
+            latencies = []
+            with contextlib.redirect_stdout(io.StringIO()):  # the server logs every save
+                for _ in range(requests):
+                    status, elapsed = request(port, 'POST', '/save-file', body, headers)
+                    if status != 200:
+                        raise RuntimeError(f'/save-file returned {status}')
+                    latencies.append(elapsed)
+            results[f'save entries={count}'] = {'body_kb': len(body) / 1024, **latency_summary(latencies)}
+    finally:
+        stop_server(httpd)
+    return results
+
+
+def git(repo_dir, *args):
+    subprocess.run(['git', *args], cwd=repo_dir, check=True, capture_output=True)
+
+
+def bench_git(commits, files_per_commit):
+    """Commit and push through GitService against a throwaway repo and bare remote"""
+    workdir = tempfile.mkdtemp(prefix='cms-bench-git-')
+    try:
+        remote = os.path.join(workdir, 'remote.git')
+        repo = os.path.join(workdir, 'site')
+        git(workdir, 'init', '-q', '--bare', remote)
+        git(workdir, 'init', '-q', repo)
+        git(repo, 'config', 'user.email', 'bench@example.com')
+        git(repo, 'config', 'user.name', 'bench')
+        git(repo, 'remote', 'add', 'origin', remote)
+        service = GitService(repo)
+        names = [f'page-{i}.html' for i in range(files_per_commit)]
+
+        phases = {}
+        totals = []
+        for i in range(commits + 1):
+            for name in names:
+                with open(os.path.join(repo, name), 'w', encoding='utf-8') as f:
+                    f.write(f'<p>revision {i} of {name}</p>\n')
+            result = service.commit(f'Benchmark revision {i}', paths=names)
+            if not result['success']:
+                raise RuntimeError(f"git commit failed: {result['error']}")
+            if i == 0:
+                git(repo, 'branch', '--set-upstream-to', f"origin/{result['branch']}")
+                continue  # the first commit creates the branch on the remote
+            totals.append(result['timings_ms']['total'])
+            for phase, ms in result['timings_ms'].items():
+                phases.setdefault(phase, []).append(ms)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    metrics = {'p50_ms': percentile(totals, 50), 'p95_ms': percentile(totals, 95),
+               'mean_ms': statistics.mean(totals)}
+    for phase, samples in phases.items():
+        if phase != 'total':
+            metrics[f'{phase}_ms'] = statistics.median(samples)
+    return {f'git files={files_per_commit}': metrics}
+
+
+def git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, check=True,
+                              capture_output=True, text=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(args):
+    selected = args.only.split(',') if args.only else BENCHMARKS
+    unknown = set(selected) - set(BENCHMARKS)
+    if unknown:
+        sys.exit(f"Unknown benchmark(s): {', '.join(sorted(unknown))}")
+    sizes = [int(size) for size in args.sizes.split(',')]
+    clients = [int(count) for count in args.clients.split(',')]
+
+    results = {}
+    workdir = tempfile.mkdtemp(prefix='cms-bench-')
+    cwd = os.getcwd()
+    os.chdir(workdir)  # the server serves and saves relative to the working directory
+    try:
+        if 'render' in selected:
+            print("🏗️  render")
+            results.update(bench_render(sizes, args.repeat))
+        if 'static' in selected:
+            print("📄 static GET")
+            results.update(bench_static(clients, args.requests, args.workers))
+        if 'save' in selected:
+            print("💾 /save-file")
+            results.update(bench_save([size for size in sizes if size <= 10000], args.requests, args.workers))
+        if 'git' in selected:
+            print("📦 git commit")
+            results.update(bench_git(args.commits, 1))
+            results.update(bench_git(args.commits, 10))
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    report = {
+        'meta': {
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+            'revision': git_revision(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpus': os.cpu_count()
+        },
+        'results': results
+    }
+    print_results(results)
+    if args.out:
+        with open(args.out, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+            f.write('\n')
+        print(f"✅ Results written to {args.out}")
+    else:
+        print(json.dumps(report, indent=2))
+
+
+def print_results(results):
+    for name, metrics in results.items():
+        print(f"  {name:<24}" + '  '.join(f"{key} {value:.2f}" for key, value in metrics.items()))
+
+
+def compare_reports(baseline, current, threshold=DEFAULT_THRESHOLD):
+    """Return (rows, regressions) for every metric present in both reports"""
+    rows = []
+    regressions = []
+    for name, metrics in current['results'].items():
+        before = baseline['results'].get(name)
+        if before is None:
+            continue
+        for key, value in metrics.items():
+            old = before.get(key)
+            if not old:
+                continue
+            change = (value - old) / old
+            higher_is_better = key.endswith(HIGHER_IS_BETTER)
+            worse = -change if higher_is_better else change
+            row = (name, key, old, value, change, worse > threshold)
+            rows.append(row)
+            if worse > threshold:
+                regressions.append(row)
+    return rows, regressions
+
+
+def compare(args):
+    with open(args.baseline, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+    with open(args.current, 'r', encoding='utf-8') as f:
+        current = json.load(f)
+
+    rows, regressions = compare_reports(baseline, current, args.threshold)
+    print(f"{'benchmark':<24}{'metric':<16}{'baseline':>12}{'current':>12}{'change':>9}")
+    for name, key, old, value, change, regressed in rows:
+        flag = '  ❌ regression' if regressed else ''
+        print(f"{name:<24}{key:<16}{old:>12.2f}{value:>12.2f}{change:>+9.1%}{flag}")
+
+    if regressions:
+        print(f"\n❌ {len(regressions)} metric(s) regressed by more than {args.threshold:.0%}")
+        sys.exit(1)
+    print(f"\n✅ No regressions beyond {args.threshold:.0%}")
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Benchmark the CMS generator, server and git paths')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = subparsers.add_parser('run', help='Run the benchmarks')
+    run_parser.add_argument('--out', help='Write the JSON report here (default: print it)')
+    run_parser.add_argument('--only', help=f"Comma-separated subset of {', '.join(BENCHMARKS)}")
+    run_parser.add_argument('--sizes', default='100,1000,10000,100000',
+                            help='Work entry counts to render (saves use those up to 10000)')
+    run_parser.add_argument('--clients', default='1,8,32', help='Concurrent clients for static GET')
+    run_parser.add_argument('--requests', type=int, default=50, help='Requests per client or per save size')
+    run_parser.add_argument('--workers', type=int, default=8, help='Server worker threads')
+    run_parser.add_argument('--repeat', type=int, default=3, help='Render repetitions (best is kept)')
+    run_parser.add_argument('--commits', type=int, default=10, help='Commits per git benchmark')
+
+    compare_parser = subparsers.add_parser('compare', help='Flag regressions against a baseline report')
+    compare_parser.add_argument('baseline', help='Saved baseline JSON report')
+    compare_parser.add_argument('current', help='JSON report to check')
+    compare_parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                                help=f'Relative change that counts as a regression (default {DEFAULT_THRESHOLD})')
+
+    args = parser.parse_args()
+    if args.command == 'run':
+        run(args)
+    else:
+        compare(args)
+
+
+if __name__ == '__main__':
+    main()
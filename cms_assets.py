@@ -0,0 +1,538 @@
+#!/usr/bin/env python3
+"""
+Asset fingerprinting and minification for the site
+Minifies the JS, CSS and HTML the site serves and copies assets to content-hashed names
+"""
+
+import glob
+import hashlib
+import json
+import os
+import re
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from cms_generator import atomic_write_bytes, content_hash, write_if_changed, write_precompressed
+
+SOURCE_DIRS = ('assets/js', 'assets/css')
+DIST_DIR = 'assets/dist'
+MANIFEST_NAME = 'assets.json'
+# Per-checkout size and mtime of each source and page, so unchanged files are not hashed; not committed
+STAT_CACHE_FILE = '.cms_assets.json'
+PIPELINE_VERSION = 1
+SOURCE_EXTENSIONS = ('.js', '.css')
+HASH_LENGTH = 8
+DIST_RE = re.compile(r'.+\.[0-9a-f]{%d}\.(js|css)(\.gz|\.br)?$' % HASH_LENGTH)
+# src/href values naming an asset, either by its source path or an earlier fingerprinted name
+REFERENCE_RE = re.compile(
+    r'''(?P<attr>\b(?:src|href)=["'])(?P<prefix>/|(?:\.\./)*)'''
+    r'''(?P<path>assets/(?:js|css)/[\w.-]+\.(?:js|css)|%s/[\w.-]+\.[0-9a-f]{%d}\.(?:js|css))'''
+    r'''(?:\?[^"'#]*)?(?=["'#])''' % (DIST_DIR, HASH_LENGTH))
+
+# JavaScript -----------------------------------------------------------------
+
+JS_TOKEN_RE = re.compile(r'''
+    (?P<space>\s+)
+  | (?P<comment>//[^\n\r\u2028\u2029]*|/\*.*?\*/)
+  | (?P<string>"(?:[^"\\\n]|\\.)*"|'(?:[^'\\\n]|\\.)*')
+  | (?P<word>[\w$\\]+)
+  | (?P<punct>>>>=|\.\.\.|===|!==|\*\*=|<<=|>>=|>>>|\?\?=|&&=|\|\|=|=>|==|!=|<=|>=|&&|\|\||\?\?|\?\.
+      |\+\+|--|\+=|-=|\*=|/=|%=|&=|\|=|\^=|\*\*|<<|>>|[{}()\[\];,<>+\-*/%&|^!~?:=.@\#`])
+''', re.X | re.S)
+# \w matches Unicode letters and digits, which covers non-ASCII identifiers
+JS_WORD_CHAR = re.compile(r'[\w$\\]')
+# After these a `/` starts a regular expression rather than a division
+JS_KEYWORDS_BEFORE_EXPRESSION = frozenset((
+    'return', 'typeof', 'instanceof', 'in', 'of', 'new', 'delete', 'void', 'throw',
+    'case', 'do', 'else', 'yield', 'await'))
+# A line break after these ends the statement (automatic semicolon insertion)
+JS_RESTRICTED = frozenset(('return', 'break', 'continue', 'throw', 'yield', 'async', 'await'))
+JS_CLOSERS = frozenset((')', ']', '}', '++', '--'))
+
+
+def _scan_regex(text: str, pos: int) -> int:
+    """End of the regular expression literal starting at text[pos] == '/'"""
+    in_class = False
+    pos += 1
+    while pos < len(text):
+        char = text[pos]
+        if char == '\\':
+            pos += 2
+            continue
+        if char == '\n':
+            break
+        if in_class:
+            in_class = char != ']'
+        elif char == '[':
+            in_class = True
+        elif char == '/':
+            pos += 1
+            while pos < len(text) and JS_WORD_CHAR.match(text[pos]):
+                pos += 1
+            return pos
+        pos += 1
+    raise ValueError(f'unterminated regular expression at offset {pos}')
+
+
+def _scan_template(text: str, pos: int) -> Tuple[int, bool]:
+    """End of a template literal chunk starting after '`' or '}' at pos.
+
+    Returns the offset just past the closing '`' (False) or past a '${' (True).
+    """
+    while pos < len(text):
+        char = text[pos]
+        if char == '\\':
+            pos += 2
+        elif char == '`':
+            return pos + 1, False
+        elif char == '$' and text.startswith('${', pos):
+            return pos + 2, True
+        else:
+            pos += 1
+    raise ValueError('unterminated template literal')
+
+
+def minify_js(text: str) -> str:
+    """Drop comments and the whitespace JavaScript does not need.
+
+    Tokens are never reordered or rewritten, and a line break is only removed
+    where automatic semicolon insertion could not have applied, so scripts
+    written without semicolons keep their meaning. `/*!` comments are kept.
+    """
+    out: List[str] = []
+    prev_kind, prev = '', ''
+    space = newline = False
+    # One open-brace count per template literal we are inside a ${...} of
+    templates: List[int] = []
+    pos = 0
+    while pos < len(text):
+        match = JS_TOKEN_RE.match(text, pos)
+        if match is None:
+            raise ValueError(f'unexpected character {text[pos]!r} at offset {pos}')
+        kind, value = match.lastgroup, match.group()
+        end = match.end()
+        if kind == 'space':
+            space = True
+            newline = newline or '\n' in value or '\r' in value
+            pos = end
+            continue
+        if kind == 'comment':
+            if not value.startswith('/*!'):
+                space = True
+                newline = newline or value.startswith('//') or '\n' in value
+                pos = end
+                continue
+            kind = 'string'
+        elif kind == 'punct' and value in ('/', '/=') and (
+                not prev_kind or (prev_kind == 'punct' and prev not in (')', ']', '++', '--'))
+                or (prev_kind == 'template' and prev.endswith('${'))
+                or prev in JS_KEYWORDS_BEFORE_EXPRESSION):
+            end = _scan_regex(text, pos)
+            kind, value = 'regex', text[pos:end]
+        elif kind == 'punct' and value == '`':
+            end, opened = _scan_template(text, end)
+            kind, value = 'template', text[pos:end]
+            if opened:
+                templates.append(0)
+        elif kind == 'punct' and templates and value in '{}':
+            if value == '{':
+                templates[-1] += 1
+            elif templates[-1]:
+                templates[-1] -= 1
+            else:
+                end, opened = _scan_template(text, end)
+                kind, value = 'template', text[pos:end]
+                if not opened:
+                    templates.pop()
+
+        if out and (space or newline):
+            if newline and not (prev not in JS_RESTRICTED and (
+                    (prev_kind == 'punct' and prev not in JS_CLOSERS)
+                    or (kind == 'punct' and value not in ('++', '--')))):
+                out.append('\n')
+            elif ((JS_WORD_CHAR.match(prev[-1]) or prev_kind == 'regex') and JS_WORD_CHAR.match(value[0])
+                  or prev[-1] in '+-' and value[0] == prev[-1]
+                  or prev[-1] == '/' and value[0] in '/*'
+                  or prev.isdigit() and value[0] == '.'):
+                out.append(' ')
+        out.append(value)
+        prev_kind, prev = kind, value
+        space = newline = False
+        pos = end
+    return ''.join(out)
+
+
+# CSS ------------------------------------------------------------------------
+
+CSS_TOKEN_RE = re.compile(r'''
+    (?P<comment>/\*.*?\*/)
+  | (?P<string>"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*')
+  | (?P<space>\s+)
+  | (?P<punct>[{};,>:])
+  | (?P<other>[^\s"'/{};,>:]+|/)
+''', re.X | re.S)
+# No whitespace is needed on either side of these
+CSS_SEPARATORS = '{};,>'
+
+
+def minify_css(text: str) -> str:
+    """Drop comments, collapse whitespace and remove it around braces, semicolons,
+    commas, child combinators and after colons. `/*!` comments are kept."""
+    out: List[str] = []
+    space = False
+    for match in CSS_TOKEN_RE.finditer(text):
+        kind, value = match.lastgroup, match.group()
+        if kind == 'space' or (kind == 'comment' and not value.startswith('/*!')):
+            space = True
+            continue
+        if value == '}' and out and out[-1] == ';':
+            out.pop()
+        if (space and out and out[-1][-1] not in CSS_SEPARATORS + ':'
+                and value[0] not in CSS_SEPARATORS):
+            out.append(' ')
+        out.append(value)
+        space = False
+    return ''.join(out)
+
+
+# HTML -----------------------------------------------------------------------
+
+# Comments and elements whose contents are not markup; everything else splits on tags
+HTML_PROTECTED_RE = re.compile(r'''<!--.*?-->|<(script|style|pre|textarea)\b(?:[^>"']|"[^"]*"|'[^']*')*>.*?</\1\s*>''',
+                               re.S | re.I)
+HTML_TAG_SPLIT_RE = re.compile(r'''(</?[A-Za-z][\w-]*(?:[^>"']|"[^"]*"|'[^']*')*>|<![^>]*>)''')
+HTML_TAG_NAME_RE = re.compile(r'</?([A-Za-z][\w-]*)')
+HTML_TAG_SPACE_NEEDED_RE = re.compile(r'[\t\n\r\f]|  | >$')
+HTML_OPEN_TAG_RE = re.compile(r'''<(?:[^>"']|"[^"]*"|'[^']*')*>''')
+HTML_TAG_SPACE_RE = re.compile(r'''("[^"]*"|'[^']*')|\s+''')
+HTML_SPACE_RE = re.compile(r'[ \t\n\r\f]+')
+SCRIPT_TYPE_RE = re.compile(r'''(?<![\w-])type=["']?([\w/+-]*)''', re.I)
+# Whitespace next to these never renders, so it can go entirely
+HTML_BLOCK_TAGS = frozenset((
+    'html', 'head', 'body', 'title', 'meta', 'link', 'base', 'script', 'style', 'noscript',
+    'div', 'p', 'ul', 'ol', 'li', 'dl', 'dt', 'dd', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6',
+    'header', 'footer', 'main', 'nav', 'section', 'article', 'aside', 'figure', 'figcaption',
+    'table', 'thead', 'tbody', 'tfoot', 'tr', 'td', 'th', 'caption', 'form', 'fieldset',
+    'legend', 'hr', 'br', 'pre', 'blockquote', 'address', 'details', 'summary', 'option'))
+
+
+def _minify_raw(element: str, name: str) -> str:
+    """Minify the contents of an inline <script> or <style>; keep <pre>/<textarea> as-is"""
+    open_end = HTML_OPEN_TAG_RE.match(element).end()
+    close_start = element.rindex('<')
+    open_tag, body, close_tag = element[:open_end], element[open_end:close_start], element[close_start:]
+    if name in ('pre', 'textarea'):
+        return element
+    if not body.strip():
+        return open_tag + close_tag
+    if name == 'style':
+        return open_tag + minify_css(body) + close_tag
+    script_type = SCRIPT_TYPE_RE.search(open_tag)
+    script_type = script_type.group(1).lower() if script_type else ''
+    if script_type in ('', 'text/javascript', 'module'):
+        try:
+            return open_tag + minify_js(body) + close_tag
+        except ValueError:
+            return element  # something the tokenizer does not follow: leave it alone
+    if script_type.endswith('json'):
+        return open_tag + body.strip() + close_tag
+    return element
+
+
+def minify_html(text: str) -> str:
+    """Drop comments and collapse whitespace, removing it next to block-level tags.
+
+    Whitespace between inline elements is kept as a single space so text never
+    runs together; <pre> and <textarea> are untouched and inline scripts and
+    styles are minified. Conditional comments (`<!--[if`) are kept.
+    """
+    # parts alternates text and tags: text at even positions, tags at odd ones
+    parts = ['']
+    # tag -> (minified tag, whether whitespace next to it can go); pages repeat most tags
+    tags: Dict[str, Tuple[str, bool]] = {}
+
+    def split(chunk: str):
+        pieces = HTML_TAG_SPLIT_RE.split(chunk)
+        parts[-1] += pieces[0]
+        parts.extend(pieces[1:])
+
+    pos = 0
+    for match in HTML_PROTECTED_RE.finditer(text):
+        split(text[pos:match.start()])
+        pos = match.end()
+        value, name = match.group(), (match.group(1) or '').lower()
+        if name:
+            value = _minify_raw(value, name)
+            tags[value] = (value, name in HTML_BLOCK_TAGS)
+        elif value.startswith('<!--[if'):
+            tags[value] = (value, False)
+        else:
+            continue
+        parts += [value, '']
+    split(text[pos:])
+
+    for index in range(1, len(parts), 2):
+        tag = parts[index]
+        known = tags.get(tag)
+        if known is None:
+            minified = tag
+            if HTML_TAG_SPACE_NEEDED_RE.search(tag):
+                minified = HTML_TAG_SPACE_RE.sub(lambda m: m.group(1) or ' ', tag)
+                if minified.endswith(' >'):
+                    minified = minified[:-2] + '>'
+            name = HTML_TAG_NAME_RE.match(tag)
+            known = tags[tag] = (minified, name is not None and name.group(1).lower() in HTML_BLOCK_TAGS)
+        parts[index] = known
+
+    last = len(parts) - 1
+    for index in range(0, len(parts), 2):
+        value = parts[index]
+        if not value:
+            continue
+        value = HTML_SPACE_RE.sub(' ', value)
+        # The document edges count as block boundaries
+        if value[0] == ' ' and (index == 0 or parts[index - 1][1]):
+            value = value[1:]
+        if value[-1:] == ' ' and (index == last or parts[index + 1][1]):
+            value = value[:-1]
+        parts[index] = value
+    for index in range(1, len(parts), 2):
+        parts[index] = parts[index][0]
+    return ''.join(parts)
+
+
+MINIFIERS = {'.js': minify_js, '.css': minify_css}
+
+
+class AssetPipeline:
+    """Minified, fingerprinted copies of assets/js and assets/css, and the manifest.
+
+    ``assets/js/cms.js`` is minified to ``assets/dist/cms.<hash>.js``, named by
+    a hash of its minified bytes so it never changes once written and can be
+    cached forever. ``assets/dist/assets.json`` maps each source to its
+    content hash, fingerprinted name and sizes, and holds nothing specific to
+    a checkout. A source or page whose hash matches the manifest is skipped;
+    the untracked ``.cms_assets.json`` keeps sizes and mtimes so unchanged
+    files are not even hashed. rewrite() points an HTML page's references at the
+    current names, whether the page names the source or an older fingerprint.
+    """
+
+    def __init__(self, base_dir: str = '.'):
+        self.base_dir = base_dir
+        self.dist_dir = os.path.join(base_dir, DIST_DIR)
+        self.manifest_path = os.path.join(self.dist_dir, MANIFEST_NAME)
+        self.assets: Dict[str, Dict[str, Any]] = {}
+        self.pages: Dict[str, Dict[str, Any]] = {}
+        self.dist_names: Dict[str, str] = {}
+        self.stat_cache_path = os.path.join(base_dir, STAT_CACHE_FILE)
+        self.stats: Dict[str, Dict[str, Any]] = {}
+        self._saved_stats: Dict[str, Dict[str, Any]] = {}
+        self.load()
+
+    def load(self):
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+            if manifest.get('version') == PIPELINE_VERSION:
+                self.assets, self.pages = manifest['assets'], manifest.get('pages', {})
+            else:
+                self.assets, self.pages = {}, {}
+        except (OSError, ValueError, KeyError):
+            self.assets, self.pages = {}, {}
+        try:
+            with open(self.stat_cache_path, 'r', encoding='utf-8') as f:
+                self.stats = json.load(f)
+        except (OSError, ValueError):
+            self.stats = {}
+        self._saved_stats = dict(self.stats)
+        self._index()
+
+    def _file_hash(self, name: str, path: str, st: os.stat_result) -> str:
+        """SHA-256 of a source or page, read again only when its size or mtime changed"""
+        cached = self.stats.get(name)
+        if cached and cached['size'] == st.st_size and cached['mtime_ns'] == st.st_mtime_ns:
+            return cached['sha256']
+        with open(path, 'rb') as f:
+            digest = hashlib.sha256(f.read()).hexdigest()
+        self.stats[name] = {'size': st.st_size, 'mtime_ns': st.st_mtime_ns, 'sha256': digest}
+        return digest
+
+    def _index(self):
+        # cms.<hash>.js -> assets/js/cms.js, for pages that still name an older fingerprint
+        self.dist_names = {}
+        for src, record in self.assets.items():
+            stem, ext = os.path.splitext(os.path.basename(record['dist']))
+            self.dist_names[os.path.splitext(stem)[0] + ext] = src
+
+    def key(self) -> str:
+        """Hash of every fingerprinted name; changes whenever rewritten pages would"""
+        return content_hash({src: record['dist'] for src, record in self.assets.items()})
+
+    def sources(self) -> List[str]:
+        """Site-relative paths of the source assets, e.g. assets/js/cms.js"""
+        found = []
+        for directory in SOURCE_DIRS:
+            try:
+                names = sorted(os.listdir(os.path.join(self.base_dir, directory)))
+            except OSError:
+                continue
+            found += [f'{directory}/{name}' for name in names
+                      if name.endswith(SOURCE_EXTENSIONS) and not name.endswith(('.min.js', '.min.css'))
+                      and os.path.isfile(os.path.join(self.base_dir, directory, name))]
+        return found
+
+    def source_for(self, path: str) -> Optional[str]:
+        """The source asset a referenced path stands for, or None if it is not in the manifest"""
+        if path.startswith(DIST_DIR + '/'):
+            stem, ext = os.path.splitext(path[len(DIST_DIR) + 1:])
+            return self.dist_names.get(os.path.splitext(stem)[0] + ext)
+        return path if path in self.assets else None
+
+    def rewrite(self, html: str) -> str:
+        """Point every src/href naming a known asset at its fingerprinted file"""
+        if not self.assets:
+            return html
+
+        def replace(match):
+            src = self.source_for(match.group('path'))
+            if src is None:
+                return match.group()
+            return match.group('attr') + match.group('prefix') + self.assets[src]['dist']
+
+        return REFERENCE_RE.sub(replace, html)
+
+    def referenced(self, html: str) -> List[str]:
+        """Source assets a page loads, once each"""
+        found = {}
+        for match in REFERENCE_RE.finditer(html):
+            src = self.source_for(match.group('path'))
+            if src is not None:
+                found[src] = True
+        return list(found)
+
+    def page_weight(self, before_html: str, after_html: str) -> Tuple[int, int]:
+        """Bytes of a page and its assets: sources as written, then minified and fingerprinted"""
+        srcs = self.referenced(after_html)
+        return (len(before_html.encode('utf-8')) + sum(self.assets[src]['size'] for src in srcs),
+                len(after_html.encode('utf-8')) + sum(self.assets[src]['dist_size'] for src in srcs))
+
+    def static_pages(self, exclude: Tuple[str, ...] = ()) -> List[str]:
+        """The top-level .html files not produced by the generator"""
+        return [path for path in sorted(glob.glob(os.path.join(self.base_dir, '*.html')))
+                if os.path.basename(path) not in exclude]
+
+    def _write_dist(self, src: str, record: Dict[str, Any], precompress: bool) -> List[str]:
+        with open(os.path.join(self.base_dir, src), 'r', encoding='utf-8') as f:
+            source = f.read()
+        minified = MINIFIERS[os.path.splitext(src)[1]](source)
+        data = minified.encode('utf-8')
+        stem, ext = os.path.splitext(os.path.basename(src))
+        record['dist'] = f'{DIST_DIR}/{stem}.{content_hash([PIPELINE_VERSION, minified])[:HASH_LENGTH]}{ext}'
+        record['dist_size'] = len(data)
+        path = os.path.join(self.base_dir, record['dist'])
+        written = []
+        if not os.path.exists(path):
+            atomic_write_bytes(path, data)
+            written.append(path)
+        if precompress and not os.path.exists(path + '.gz'):
+            written += write_precompressed(path)
+        return written
+
+    def build(self, precompress: bool = True, force: bool = False,
+              exclude_pages: Tuple[str, ...] = ()) -> Dict[str, Any]:
+        """Write missing fingerprinted assets and the manifest, drop stale ones, then
+        update asset references in the hand-written pages.
+
+        Shaped like a page build result ('page', 'file', 'written', 'files')
+        so watchers and the server can publish it alongside pages.
+        """
+        start = time.perf_counter()
+        sources = self.sources()
+        result = {'page': 'assets', 'file': self.manifest_path, 'written': False, 'files': [],
+                  'sources': len(sources), 'minified': 0, 'source_bytes': 0, 'dist_bytes': 0,
+                  'pages': [], 'errors': {}}
+
+        assets: Dict[str, Dict[str, Any]] = {}
+        for src in sources:
+            path = os.path.join(self.base_dir, src)
+            previous = self.assets.get(src)
+            try:
+                st = os.stat(path)
+                digest = self._file_hash(src, path, st)
+                dist = os.path.join(self.base_dir, previous['dist']) if previous is not None else ''
+                if not force and previous is not None and previous.get('sha256') == digest and os.path.exists(dist):
+                    # Sidecars are not committed; a fresh clone writes them here
+                    if precompress and not os.path.exists(dist + '.gz'):
+                        result['files'] += write_precompressed(dist)
+                    assets[src] = previous
+                    continue
+                record = {'size': st.st_size, 'sha256': digest}
+                os.makedirs(self.dist_dir, exist_ok=True)
+                result['files'] += self._write_dist(src, record, precompress)
+            except (OSError, UnicodeDecodeError, ValueError) as e:
+                # A file caught mid-save or a script the tokenizer cannot read keeps its old copy
+                result['errors'][src] = str(e)
+                if previous is not None:
+                    assets[src] = previous
+                continue
+            assets[src] = record
+            result['minified'] += 1
+        result['source_bytes'] = sum(record['size'] for record in assets.values())
+        result['dist_bytes'] = sum(record['dist_size'] for record in assets.values())
+
+        if assets != self.assets:
+            self.assets = assets
+            self._index()
+        current = {os.path.basename(record['dist']) for record in assets.values()}
+        if os.path.isdir(self.dist_dir):
+            for name in sorted(os.listdir(self.dist_dir)):
+                match = DIST_RE.match(name)
+                if match and name[:len(name) - len(match.group(2) or '')] not in current:
+                    os.remove(os.path.join(self.dist_dir, name))
+                    result['files'].append(os.path.join(self.dist_dir, name))
+
+        # Hand-written pages: rewrite references only when the page or the names changed
+        key = self.key()
+        pages = {}
+        for path in self.static_pages(exclude_pages):
+            name = os.path.relpath(path, self.base_dir)
+            previous = self.pages.get(name)
+            try:
+                st = os.stat(path)
+                digest = self._file_hash(name, path, st)
+                if (not force and previous is not None and previous['key'] == key
+                        and previous.get('sha256') == digest):
+                    pages[name] = previous
+                    continue
+                with open(path, 'r', encoding='utf-8') as f:
+                    html = f.read()
+                rewritten = self.rewrite(html)
+                if write_if_changed(path, rewritten):
+                    result['files'].append(path)
+                    result['pages'].append(path)
+                    st = os.stat(path)
+                    digest = self._file_hash(name, path, st)
+            except (OSError, UnicodeDecodeError) as e:
+                result['errors'][name] = str(e)
+                continue
+            srcs = self.referenced(rewritten)
+            pages[name] = {'sha256': digest, 'key': key,
+                           'bytes': [st.st_size + sum(assets[src]['size'] for src in srcs),
+                                     st.st_size + sum(assets[src]['dist_size'] for src in srcs)]}
+
+        if result['files'] or pages != self.pages or not os.path.exists(self.manifest_path):
+            self.pages = pages
+            if assets or os.path.isdir(self.dist_dir):
+                os.makedirs(self.dist_dir, exist_ok=True)
+                body = json.dumps({'version': PIPELINE_VERSION, 'assets': assets, 'pages': pages},
+                                  indent=1, sort_keys=True) + '\n'
+                if write_if_changed(self.manifest_path, body):
+                    result['files'].append(self.manifest_path)
+        stats = {name: self.stats[name] for name in sorted(set(assets) | set(pages)) if name in self.stats}
+        if stats != self._saved_stats:
+            atomic_write_bytes(self.stat_cache_path, json.dumps(stats, indent=1).encode('utf-8'))
+            self._saved_stats = stats
+        self.stats = stats
+        result['written'] = bool(result['files'])
+        result['ms'] = (time.perf_counter() - start) * 1000
+        return result
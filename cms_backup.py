@@ -0,0 +1,558 @@
+#!/usr/bin/env python3
+"""
+Content-addressed backups of the generated pages
+Stores files as deduplicated chunks under .cms_backups/ and each snapshot as a small manifest
+"""
+
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+import zlib
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from cms_generator import PAGES, atomic_write_bytes
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+BACKUP_DIR = '.cms_backups'
+SNAPSHOT_VERSION = 1
+# Chunks end on a line whose CRC matches CHUNK_MASK, so an edit only changes
+# the chunks around it and everything after it deduplicates against the last snapshot
+MIN_CHUNK_SIZE = 4 * 1024
+MAX_CHUNK_SIZE = 64 * 1024
+CHUNK_MASK = 0x3f
+COMPRESS_LEVEL = 6
+# prune without options: the last 10 snapshots, plus the newest of each of the
+# last 7 days, 4 weeks and 12 months
+DEFAULT_RETENTION = {'last': 10, 'daily': 7, 'weekly': 4, 'monthly': 12}
+LEGACY_BACKUP_RE = re.compile(r'backup_(\d{8}_\d{6})$')
+
+
+def iter_chunks(f) -> Iterator[bytes]:
+    """Content-defined chunks of a binary file, cut on line boundaries"""
+    lines: List[bytes] = []
+    size = 0
+    while True:
+        line = f.readline(MAX_CHUNK_SIZE)
+        if not line:
+            break
+        lines.append(line)
+        size += len(line)
+        if size >= MAX_CHUNK_SIZE or (size >= MIN_CHUNK_SIZE and zlib.crc32(line) & CHUNK_MASK == 0):
+            yield b''.join(lines)
+            lines = []
+            size = 0
+    if lines:
+        yield b''.join(lines)
+
+
+def period_key(created: str, period: str) -> str:
+    """The day, ISO week or month an ISO timestamp falls in"""
+    if period == 'week':
+        from datetime import date
+        year, week, _ = date.fromisoformat(created[:10]).isocalendar()
+        return f'{year}-W{week:02d}'
+    return created[:10] if period == 'day' else created[:7]
+
+
+def format_size(size: float) -> str:
+    for unit in ('B', 'KB', 'MB'):
+        if abs(size) < 1024:
+            return f'{size:.0f} {unit}' if unit == 'B' else f'{size:.1f} {unit}'
+        size /= 1024
+    return f'{size:.1f} GB'
+
+
+class BackupStore:
+    """Snapshots of files under base_dir, stored as zlib-compressed chunks.
+
+    Layout of .cms_backups/:
+        objects/<2 hex>/<62 hex>   one chunk, named by the SHA-256 of its bytes
+        snapshots/<id>.json        file -> size, mtime, SHA-256 and chunk list
+
+    A chunk is written once no matter how many files or snapshots contain it,
+    so an unchanged page costs only its line in the manifest. Objects are
+    deleted only by gc(), once no snapshot refers to them.
+    """
+
+    def __init__(self, base_dir: str = '.', directory: Optional[str] = None):
+        self.base_dir = base_dir
+        self.directory = directory or os.path.join(base_dir, BACKUP_DIR)
+        self.objects_dir = os.path.join(self.directory, 'objects')
+        self.snapshots_dir = os.path.join(self.directory, 'snapshots')
+
+    # --- objects ---
+
+    def object_path(self, digest: str) -> str:
+        return os.path.join(self.objects_dir, digest[:2], digest[2:])
+
+    def put_chunk(self, chunk: bytes) -> Tuple[str, int]:
+        """Store a chunk unless it exists; returns its id and the bytes added to disk"""
+        digest = hashlib.sha256(chunk).hexdigest()
+        path = self.object_path(digest)
+        if os.path.exists(path):
+            return digest, 0
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        data = zlib.compress(chunk, COMPRESS_LEVEL)
+        atomic_write_bytes(path, data)
+        return digest, len(data)
+
+    def get_chunk(self, digest: str) -> bytes:
+        with open(self.object_path(digest), 'rb') as f:
+            try:
+                chunk = zlib.decompress(f.read())
+            except zlib.error:
+                chunk = b''
+        if hashlib.sha256(chunk).hexdigest() != digest:
+            raise ValueError(f"Backup object {digest[:12]} is corrupt")
+        return chunk
+
+    def iter_objects(self) -> Iterator[Tuple[str, str]]:
+        """(id, path) of every stored chunk"""
+        if not os.path.isdir(self.objects_dir):
+            return
+        for prefix in sorted(os.listdir(self.objects_dir)):
+            folder = os.path.join(self.objects_dir, prefix)
+            for name in sorted(os.listdir(folder)):
+                if not name.endswith('.tmp'):
+                    yield prefix + name, os.path.join(folder, name)
+
+    def lock(self):
+        """Exclusive lock for the duration of a snapshot, restore or prune, so gc()
+        never deletes a chunk a concurrent snapshot has just reused"""
+        os.makedirs(self.directory, exist_ok=True)
+        handle = open(os.path.join(self.directory, 'lock'), 'w')
+        if fcntl is not None:
+            fcntl.flock(handle, fcntl.LOCK_EX)
+        return handle
+
+    # --- snapshots ---
+
+    def snapshots(self) -> List[Dict[str, Any]]:
+        """Every snapshot manifest, oldest first"""
+        if not os.path.isdir(self.snapshots_dir):
+            return []
+        result = []
+        for name in os.listdir(self.snapshots_dir):
+            if name.endswith('.json'):
+                with open(os.path.join(self.snapshots_dir, name), 'r', encoding='utf-8') as f:
+                    result.append(json.load(f))
+        return sorted(result, key=lambda snapshot: (snapshot['created'], snapshot['id']))
+
+    def resolve(self, ref: str) -> Dict[str, Any]:
+        """A snapshot by id, unique id prefix, 'latest' or 'latest~N'"""
+        snapshots = self.snapshots()
+        match = re.fullmatch(r'latest(?:~(\d+))?', ref)
+        if match:
+            back = int(match.group(1) or 0)
+            if back >= len(snapshots):
+                raise KeyError(f"Only {len(snapshots)} snapshot(s) exist")
+            return snapshots[-1 - back]
+        found = [snapshot for snapshot in snapshots if snapshot['id'].startswith(ref)]
+        if len(found) != 1:
+            raise KeyError(f"No snapshot matches '{ref}'" if not found
+                           else f"'{ref}' matches {len(found)} snapshots")
+        return found[0]
+
+    def default_paths(self) -> List[str]:
+        """The generated pages that exist in base_dir"""
+        return [spec.output for spec in PAGES.values()
+                if os.path.isfile(os.path.join(self.base_dir, spec.output))]
+
+    def scan_file(self, path: str, store: bool, previous: Optional[Dict[str, Any]] = None,
+                  source_dir: Optional[str] = None) -> Tuple[Dict[str, Any], int, int]:
+        """Manifest record for one file, plus the chunks and bytes newly stored.
+
+        A file whose size and mtime match its record in the previous snapshot is
+        not read again, the same shortcut git uses for its index.
+        """
+        full_path = os.path.join(source_dir or self.base_dir, path)
+        stat = os.stat(full_path)
+        if (previous and previous['size'] == stat.st_size and previous['mtime_ns'] == stat.st_mtime_ns
+                and all(os.path.exists(self.object_path(digest)) for digest, _ in previous['chunks'])):
+            return previous, 0, 0
+        digest = hashlib.sha256()
+        chunks = []
+        new_chunks = new_bytes = 0
+        with open(full_path, 'rb') as f:
+            for chunk in iter_chunks(f):
+                digest.update(chunk)
+                if store:
+                    chunk_id, added = self.put_chunk(chunk)
+                    new_chunks += added > 0
+                    new_bytes += added
+                else:
+                    chunk_id = hashlib.sha256(chunk).hexdigest()
+                chunks.append([chunk_id, len(chunk)])
+        record = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns,
+                  'sha256': digest.hexdigest(), 'chunks': chunks}
+        return record, new_chunks, new_bytes
+
+    def snapshot(self, paths: Optional[List[str]] = None, label: str = '',
+                 created: Optional[float] = None, source_dir: Optional[str] = None) -> Dict[str, Any]:
+        """Record paths (relative to base_dir, or to source_dir) as a new snapshot.
+
+        Nothing is written when every file matches the latest snapshot; the
+        result then has written False and that snapshot's id.
+        """
+        start = time.perf_counter()
+        paths = paths if paths is not None else self.default_paths()
+        with self.lock():
+            snapshots = self.snapshots()
+            latest = snapshots[-1] if snapshots else None
+            previous_files = latest['files'] if latest and source_dir is None else {}
+            files = {}
+            new_chunks = new_bytes = 0
+            for path in paths:
+                path = os.path.normpath(path)
+                record, chunk_count, byte_count = self.scan_file(path, True, previous_files.get(path),
+                                                                 source_dir)
+                files[path] = record
+                new_chunks += chunk_count
+                new_bytes += byte_count
+
+            result = {'written': False, 'files': len(files), 'size': sum(r['size'] for r in files.values()),
+                      'new_chunks': new_chunks, 'new_bytes': new_bytes}
+            if latest and not label and self._same_content(latest['files'], files):
+                result['id'] = latest['id']
+                return result
+
+            created = time.time() if created is None else created
+            snapshot_id = time.strftime('%Y%m%d-%H%M%S', time.localtime(created))
+            existing = {snapshot['id'] for snapshot in snapshots}
+            suffix = 2
+            while snapshot_id in existing:
+                snapshot_id = f"{time.strftime('%Y%m%d-%H%M%S', time.localtime(created))}-{suffix}"
+                suffix += 1
+            manifest = {
+                'version': SNAPSHOT_VERSION,
+                'id': snapshot_id,
+                'created': time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(created)),
+                'label': label,
+                'files': files
+            }
+            os.makedirs(self.snapshots_dir, exist_ok=True)
+            body = json.dumps(manifest, separators=(',', ':')).encode('utf-8')
+            atomic_write_bytes(os.path.join(self.snapshots_dir, f'{snapshot_id}.json'), body, fsync=True)
+        result.update(written=True, id=snapshot_id, manifest_bytes=len(body),
+                      ms=(time.perf_counter() - start) * 1000)
+        return result
+
+    @staticmethod
+    def _same_content(old: Dict[str, Any], new: Dict[str, Any]) -> bool:
+        return old.keys() == new.keys() and all(old[path]['sha256'] == new[path]['sha256'] for path in new)
+
+    def working_files(self, paths: List[str]) -> Dict[str, Any]:
+        """Records for files as they are now, without storing anything"""
+        return {os.path.normpath(path): self.scan_file(path, False)[0] for path in paths
+                if os.path.isfile(os.path.join(self.base_dir, path))}
+
+    def read_file(self, record: Dict[str, Any]) -> bytes:
+        return b''.join(self.get_chunk(digest) for digest, _ in record['chunks'])
+
+    def diff(self, old: Dict[str, Any], new: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Per-file changes between two file maps, in path order"""
+        changes = []
+        for path in sorted(old.keys() | new.keys()):
+            before, after = old.get(path), new.get(path)
+            if before and after and before['sha256'] == after['sha256']:
+                continue
+            change = {'path': path, 'status': 'added' if not before else 'removed' if not after else 'modified',
+                      'old_size': before['size'] if before else 0, 'new_size': after['size'] if after else 0}
+            if before and after:
+                old_chunks = {digest for digest, _ in before['chunks']}
+                change['changed_chunks'] = sum(digest not in old_chunks for digest, _ in after['chunks'])
+                change['chunks'] = len(after['chunks'])
+            changes.append(change)
+        return changes
+
+    def restore(self, snapshot: Dict[str, Any], paths: Optional[List[str]] = None,
+                target_dir: Optional[str] = None) -> List[str]:
+        """Write a snapshot's files (or just paths) into target_dir, base_dir by default.
+
+        Each file is assembled in a temp file, checked against its SHA-256 and
+        then renamed into place with its original mtime.
+        """
+        target_dir = target_dir or self.base_dir
+        files = snapshot['files']
+        wanted = [os.path.normpath(path) for path in paths] if paths else sorted(files)
+        missing = [path for path in wanted if path not in files]
+        if missing:
+            raise KeyError(f"Not in snapshot {snapshot['id']}: {', '.join(missing)}")
+        restored = []
+        with self.lock():
+            for path in wanted:
+                record = files[path]
+                destination = os.path.join(target_dir, path)
+                os.makedirs(os.path.dirname(os.path.abspath(destination)), exist_ok=True)
+                tmp_path = f'{destination}.{os.getpid()}.tmp'
+                digest = hashlib.sha256()
+                try:
+                    with open(tmp_path, 'wb') as f:
+                        for chunk_id, _ in record['chunks']:
+                            chunk = self.get_chunk(chunk_id)
+                            digest.update(chunk)
+                            f.write(chunk)
+                    if digest.hexdigest() != record['sha256']:
+                        raise ValueError(f"{path}: restored content does not match the snapshot")
+                    os.utime(tmp_path, ns=(record['mtime_ns'], record['mtime_ns']))
+                    os.replace(tmp_path, destination)
+                except BaseException:
+                    if os.path.exists(tmp_path):
+                        os.remove(tmp_path)
+                    raise
+                restored.append(destination)
+        return restored
+
+    # --- retention ---
+
+    @staticmethod
+    def select_kept(snapshots: List[Dict[str, Any]], last: int = 0, daily: int = 0,
+                    weekly: int = 0, monthly: int = 0) -> List[Dict[str, Any]]:
+        """Snapshots a retention policy keeps: the newest `last`, plus the newest
+        snapshot of each of the most recent `daily` days, `weekly` ISO weeks and
+        `monthly` months that have one"""
+        newest_first = snapshots[::-1]
+        keep = {snapshot['id'] for snapshot in newest_first[:last]}
+        for count, period in ((daily, 'day'), (weekly, 'week'), (monthly, 'month')):
+            seen: List[str] = []
+            for snapshot in newest_first:
+                key = period_key(snapshot['created'], period)
+                if key not in seen:
+                    if len(seen) == count:
+                        break
+                    seen.append(key)
+                    keep.add(snapshot['id'])
+        return [snapshot for snapshot in snapshots if snapshot['id'] in keep]
+
+    def prune(self, dry_run: bool = False, **policy: int) -> Dict[str, Any]:
+        """Delete snapshots outside the retention policy, then the chunks nothing refers to"""
+        policy = {**DEFAULT_RETENTION, **{k: v for k, v in policy.items() if v is not None}}
+        with self.lock():
+            snapshots = self.snapshots()
+            kept = self.select_kept(snapshots, **policy)
+            kept_ids = {snapshot['id'] for snapshot in kept}
+            removed = [snapshot['id'] for snapshot in snapshots if snapshot['id'] not in kept_ids]
+            if not dry_run:
+                for snapshot_id in removed:
+                    os.remove(os.path.join(self.snapshots_dir, f'{snapshot_id}.json'))
+            result = self.gc(kept, dry_run)
+        result.update(removed=removed, kept=len(kept), policy=policy)
+        return result
+
+    def gc(self, snapshots: List[Dict[str, Any]], dry_run: bool = False) -> Dict[str, Any]:
+        """Delete objects no snapshot in snapshots refers to (call with the lock held)"""
+        referenced = {digest for snapshot in snapshots
+                      for record in snapshot['files'].values() for digest, _ in record['chunks']}
+        deleted = freed = 0
+        for digest, path in self.iter_objects():
+            if digest not in referenced:
+                deleted += 1
+                freed += os.path.getsize(path)
+                if not dry_run:
+                    os.remove(path)
+        if not dry_run and os.path.isdir(self.objects_dir):
+            for prefix in os.listdir(self.objects_dir):
+                if not os.listdir(os.path.join(self.objects_dir, prefix)):
+                    os.rmdir(os.path.join(self.objects_dir, prefix))
+        return {'deleted_objects': deleted, 'freed_bytes': freed}
+
+    # --- reporting ---
+
+    def stats(self) -> Dict[str, Any]:
+        """Space used versus what full copies of every snapshot would take"""
+        snapshots = self.snapshots()
+        logical = sum(record['size'] for snapshot in snapshots for record in snapshot['files'].values())
+        unique = {}
+        for snapshot in snapshots:
+            for record in snapshot['files'].values():
+                unique.update(record['chunks'])
+        objects = stored = 0
+        for _, path in self.iter_objects():
+            objects += 1
+            stored += os.path.getsize(path)
+        manifests = sum(os.path.getsize(os.path.join(self.snapshots_dir, f"{snapshot['id']}.json"))
+                        for snapshot in snapshots)
+        used = stored + manifests
+        return {
+            'snapshots': len(snapshots),
+            'logical_bytes': logical,
+            'unique_bytes': sum(unique.values()),
+            'objects': objects,
+            'stored_bytes': stored,
+            'manifest_bytes': manifests,
+            'saved_ratio': 1 - used / logical if logical else 0.0
+        }
+
+    def import_legacy(self, remove: bool = False) -> List[Dict[str, Any]]:
+        """Turn backup_YYYYmmdd_HHMMSS directories from older versions into snapshots"""
+        import shutil
+
+        results = []
+        for name in sorted(os.listdir(self.base_dir)):
+            match = LEGACY_BACKUP_RE.match(name)
+            folder = os.path.join(self.base_dir, name)
+            if not match or not os.path.isdir(folder):
+                continue
+            paths = [os.path.relpath(os.path.join(root, file), folder)
+                     for root, _, names in os.walk(folder) for file in sorted(names)]
+            created = time.mktime(time.strptime(match.group(1), '%Y%m%d_%H%M%S'))
+            result = self.snapshot(paths, label=name, created=created, source_dir=folder)
+            result['source'] = name
+            results.append(result)
+            if remove:
+                shutil.rmtree(folder)
+        return results
+
+
+def print_snapshot_result(result: Dict[str, Any]):
+    if not result['written']:
+        print(f"⏭️  Files unchanged since snapshot {result['id']}, nothing to back up")
+        return
+    saved = 1 - (result['new_bytes'] + result['manifest_bytes']) / result['size'] if result['size'] else 0
+    print(f"📁 Snapshot {result['id']}: {result['files']} file(s), {format_size(result['size'])}; "
+          f"{result['new_chunks']} new chunk(s), {format_size(result['new_bytes'] + result['manifest_bytes'])} "
+          f"added ({saved:.1%} saved by deduplication and compression)")
+
+
+def print_diff(store: BackupStore, old: Dict[str, Any], new: Dict[str, Any], patch: bool):
+    import difflib
+
+    changes = store.diff(old['files'], new['files'])
+    if not changes:
+        print(f"✅ No differences between {old['id']} and {new['id']}")
+        return
+    symbols = {'added': '+', 'removed': '-', 'modified': 'M'}
+    for change in changes:
+        detail = f"{format_size(change['old_size'])} → {format_size(change['new_size'])}"
+        if change['status'] == 'modified':
+            detail += f", {change['changed_chunks']} of {change['chunks']} chunks changed"
+        print(f"{symbols[change['status']]} {change['path']} ({detail})")
+        if patch and change['status'] == 'modified':
+            before = store.read_file(old['files'][change['path']]).decode('utf-8', 'replace')
+            if new['id'] == 'working files':
+                with open(os.path.join(store.base_dir, change['path']), 'r', encoding='utf-8',
+                          errors='replace') as f:
+                    after = f.read()
+            else:
+                after = store.read_file(new['files'][change['path']]).decode('utf-8', 'replace')
+            sys.stdout.writelines(difflib.unified_diff(
+                before.splitlines(True), after.splitlines(True),
+                f"{old['id']}/{change['path']}", f"{new['id']}/{change['path']}"))
+
+
+def main(argv: Optional[List[str]] = None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Content-addressed backups of the generated pages')
+    parser.add_argument('--base-dir', default='.', help='Directory holding the pages and .cms_backups/')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    snapshot_parser = subparsers.add_parser('snapshot', help='Back up the generated pages (or the given files)')
+    snapshot_parser.add_argument('paths', nargs='*', help='Files relative to --base-dir (default: every page)')
+    snapshot_parser.add_argument('--label', default='', help='Note stored with the snapshot; '
+                                                              'a labelled snapshot is recorded even if nothing changed')
+
+    subparsers.add_parser('list', help='List snapshots, oldest first')
+
+    diff_parser = subparsers.add_parser('diff', help='Compare two snapshots, or a snapshot with the working files')
+    diff_parser.add_argument('old', help="Snapshot id, unique prefix, 'latest' or 'latest~N'")
+    diff_parser.add_argument('new', nargs='?', help='Second snapshot (default: the files as they are now)')
+    diff_parser.add_argument('--patch', '-p', action='store_true', help='Print a unified diff of modified files')
+
+    restore_parser = subparsers.add_parser('restore', help="Restore a snapshot's files")
+    restore_parser.add_argument('snapshot', help="Snapshot id, unique prefix, 'latest' or 'latest~N'")
+    restore_parser.add_argument('paths', nargs='*', help='Only these files (default: all)')
+    restore_parser.add_argument('--to', help='Restore into this directory instead of --base-dir')
+
+    prune_parser = subparsers.add_parser('prune', help='Apply the retention policy and delete unreferenced chunks')
+    for name, default in DEFAULT_RETENTION.items():
+        prune_parser.add_argument(f'--keep-{name}', type=int, dest=name,
+                                  help=f'default: {default}')
+    prune_parser.add_argument('--dry-run', action='store_true', help='Report what would be deleted')
+
+    subparsers.add_parser('stats', help='Report space used and saved by deduplication')
+
+    import_parser = subparsers.add_parser('import-legacy', help='Turn backup_YYYYmmdd_HHMMSS directories into snapshots')
+    import_parser.add_argument('--remove', action='store_true', help='Delete each directory once imported')
+
+    args = parser.parse_args(argv)
+    store = BackupStore(args.base_dir)
+
+    try:
+        if args.command == 'snapshot':
+            print_snapshot_result(store.snapshot(args.paths or None, label=args.label))
+        elif args.command == 'list':
+            snapshots = store.snapshots()
+            if not snapshots:
+                print(f"📭 No snapshots in {store.directory}")
+                return
+            print(f"{'id':<20}{'created':<21}{'files':>6}{'size':>11}{'new':>11}  label")
+            seen = set()
+            for snapshot in snapshots:
+                new = {}
+                for record in snapshot['files'].values():
+                    new.update((digest, size) for digest, size in record['chunks'] if digest not in seen)
+                seen.update(new)
+                size = sum(record['size'] for record in snapshot['files'].values())
+                print(f"{snapshot['id']:<20}{snapshot['created']:<21}{len(snapshot['files']):>6}"
+                      f"{format_size(size):>11}{format_size(sum(new.values())):>11}  {snapshot['label']}")
+        elif args.command == 'diff':
+            old = store.resolve(args.old)
+            if args.new:
+                new = store.resolve(args.new)
+            else:
+                new = {'id': 'working files', 'files': store.working_files(sorted(old['files']))}
+            print_diff(store, old, new, args.patch)
+        elif args.command == 'restore':
+            snapshot = store.resolve(args.snapshot)
+            if not args.to:
+                # Overwriting the working files: keep what is there now first
+                current = [path for path in (args.paths or sorted(snapshot['files']))
+                           if os.path.isfile(os.path.join(store.base_dir, path))]
+                if current:
+                    print_snapshot_result(store.snapshot(current))
+            for path in store.restore(snapshot, args.paths, args.to):
+                print(f"♻️  Restored {path} from {snapshot['id']}")
+        elif args.command == 'prune':
+            policy = {name: getattr(args, name) for name in DEFAULT_RETENTION}
+            result = store.prune(dry_run=args.dry_run, **policy)
+            verb = 'Would remove' if args.dry_run else 'Removed'
+            print(f"🧹 {verb} {len(result['removed'])} snapshot(s), kept {result['kept']} "
+                  f"(last {result['policy']['last']}, daily {result['policy']['daily']}, "
+                  f"weekly {result['policy']['weekly']}, monthly {result['policy']['monthly']})")
+            for snapshot_id in result['removed'][:10]:
+                print(f"  - {snapshot_id}")
+            if len(result['removed']) > 10:
+                print(f"  … and {len(result['removed']) - 10} more")
+            print(f"🗑️  {verb} {result['deleted_objects']} unreferenced chunk(s), "
+                  f"{format_size(result['freed_bytes'])}")
+        elif args.command == 'stats':
+            stats = store.stats()
+            print(f"📦 {stats['snapshots']} snapshot(s) in {store.directory}")
+            print(f"  Full copies would take:  {format_size(stats['logical_bytes'])}")
+            print(f"  Unique content:          {format_size(stats['unique_bytes'])}")
+            print(f"  Stored ({stats['objects']} chunks):  {format_size(stats['stored_bytes'])} "
+                  f"+ {format_size(stats['manifest_bytes'])} of manifests")
+            print(f"  Saved by deduplication and compression: {stats['saved_ratio']:.1%}")
+        elif args.command == 'import-legacy':
+            results = store.import_legacy(remove=args.remove)
+            if not results:
+                print("📭 No backup_YYYYmmdd_HHMMSS directories found")
+            for result in results:
+                print(f"📥 {result['source']}", end=': ')
+                print_snapshot_result(result)
+    except (KeyError, ValueError, OSError) as e:
+        message = e.args[0] if isinstance(e, KeyError) else e
+        print(f"❌ {message}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
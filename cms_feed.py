@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+"""
+Substack feed ingestion for the site
+Fetches the publication's RSS feed, parses it as a stream and writes feed.json for the blog pages
+"""
+
+import html
+import json
+import os
+import re
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from cms_generator import atomic_write_bytes, write_if_changed
+
+FEED_FILE = 'feed.json'
+STATE_FILE = '.cms_feed.json'
+FEED_VERSION = 1
+DEFAULT_PUBLICATION = 'pixelsbypavan'
+DEFAULT_FEED_URL = f'https://{DEFAULT_PUBLICATION}.substack.com/feed'
+DEFAULT_LIMIT = 50
+# A feed checked within this many seconds is fresh; older ones are served while a refresh runs
+DEFAULT_MAX_AGE = 15 * 60
+STALE_WHILE_REVALIDATE = 7 * 24 * 3600
+FETCH_TIMEOUT = 10
+EXCERPT_LENGTH = 300
+USER_AGENT = 'cms-feed/1.0 (+https://pavankumardharmoju.github.io)'
+CONTENT_NS = '{http://purl.org/rss/1.0/modules/content/}'
+MEDIA_NS = '{http://search.yahoo.com/mrss/}'
+ATOM_NS = '{http://www.w3.org/2005/Atom}'
+IMG_RE = re.compile(r'''<img[^>]+src=["']([^"']+)["']''', re.I)
+# Block-level tags become spaces so paragraphs do not run together; other tags just go
+BLOCK_TAG_RE = re.compile(r'<(?:/?(?:p|div|li|ul|ol|h[1-6]|blockquote|figure|figcaption|table|tr|td)\b|br\b)[^>]*>',
+                          re.I)
+TAG_RE = re.compile(r'<[^>]*>')
+SPACE_RE = re.compile(r'\s+')
+
+
+def strip_html(text: str) -> str:
+    """Plain text of an HTML fragment, whitespace collapsed"""
+    text = TAG_RE.sub('', BLOCK_TAG_RE.sub(' ', text))
+    return SPACE_RE.sub(' ', html.unescape(text)).strip()
+
+
+def excerpt(text: str, length: int = EXCERPT_LENGTH) -> str:
+    """The first `length` characters of text, cut at a word boundary"""
+    if len(text) <= length:
+        return text
+    cut = text[:length].rsplit(' ', 1)[0].rstrip(' ,;:.')
+    return cut + '…'
+
+
+def iso_date(value: str) -> str:
+    """An RSS (RFC 822) or Atom (ISO 8601) date as ISO 8601 UTC, or '' if unparsable"""
+    from datetime import datetime, timezone
+    from email.utils import parsedate_to_datetime
+
+    value = value.strip()
+    if not value:
+        return ''
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        try:
+            parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except ValueError:
+            return ''
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+def _text(element, tag: str) -> str:
+    child = element.find(tag)
+    return (child.text or '').strip() if child is not None else ''
+
+
+def normalize_item(element) -> Dict[str, str]:
+    """An RSS <item> or Atom <entry> as {title, link, date, image, excerpt}"""
+    if element.tag == ATOM_NS + 'entry':
+        link = next((child.get('href', '') for child in element.findall(ATOM_NS + 'link')
+                     if child.get('rel', 'alternate') == 'alternate'), '')
+        content = _text(element, ATOM_NS + 'content')
+        summary = _text(element, ATOM_NS + 'summary') or content
+        title = _text(element, ATOM_NS + 'title')
+        date = _text(element, ATOM_NS + 'published') or _text(element, ATOM_NS + 'updated')
+        image = ''
+    else:
+        content = _text(element, CONTENT_NS + 'encoded')
+        summary = _text(element, 'description') or content
+        title = _text(element, 'title')
+        link = _text(element, 'link')
+        date = _text(element, 'pubDate')
+        image = ''
+        enclosure = element.find('enclosure')
+        if enclosure is not None and enclosure.get('type', 'image/').startswith('image/'):
+            image = enclosure.get('url', '')
+        if not image:
+            media = element.find(MEDIA_NS + 'content')
+            if media is not None and media.get('medium', 'image') == 'image':
+                image = media.get('url', '')
+    if not image:
+        match = IMG_RE.search(content or summary)
+        image = html.unescape(match.group(1)) if match else ''
+    return {
+        'title': strip_html(title),
+        'link': link,
+        'date': iso_date(date),
+        'image': image,
+        'excerpt': excerpt(strip_html(summary))
+    }
+
+
+def iter_feed(stream) -> Iterator[Dict[str, str]]:
+    """Normalized items from an RSS 2.0 or Atom document, parsed incrementally.
+
+    Each item is dropped from the tree once yielded, so memory stays bounded
+    by the largest single item rather than the whole feed.
+    """
+    import xml.etree.ElementTree as ET
+
+    try:
+        for _, element in ET.iterparse(stream, events=('end',)):
+            if element.tag in ('item', ATOM_NS + 'entry'):
+                yield normalize_item(element)
+                element.clear()
+    except ET.ParseError as e:
+        raise ValueError(f'malformed feed: {e}') from e
+
+
+def open_feed(source: str, state: Dict[str, Any]):
+    """Open a feed URL or local file; returns (stream, response headers), or (None, headers)
+    when the server answers 304 to the validators in state"""
+    if '://' not in source:
+        return open(source, 'rb'), {}
+    import urllib.error
+    import urllib.request
+
+    request = urllib.request.Request(source, headers={'User-Agent': USER_AGENT,
+                                                      'Accept': 'application/rss+xml, application/xml'})
+    if state.get('source') == source:
+        if state.get('etag'):
+            request.add_header('If-None-Match', state['etag'])
+        if state.get('last_modified'):
+            request.add_header('If-Modified-Since', state['last_modified'])
+    try:
+        response = urllib.request.urlopen(request, timeout=FETCH_TIMEOUT)
+    except urllib.error.HTTPError as e:
+        if e.code == 304:
+            return None, e.headers
+        raise OSError(f'HTTP {e.code} from {source}') from e
+    except urllib.error.URLError as e:
+        raise OSError(f'{source}: {e.reason}') from e
+    return response, response.headers
+
+
+def load_json(path: str) -> Dict[str, Any]:
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+class FeedStore:
+    """feed.json and the fetch state behind it.
+
+    feed.json holds only what the pages read (the source URL and the items),
+    so it changes, and gets committed, only when the feed's posts do. The
+    HTTP validators and the time of the last successful check live in the
+    untracked .cms_feed.json next to it.
+    """
+
+    def __init__(self, base_dir: str = '.', url: str = DEFAULT_FEED_URL, limit: int = DEFAULT_LIMIT):
+        self.base_dir = base_dir
+        self.url = url
+        self.limit = limit
+        self.path = os.path.join(base_dir, FEED_FILE)
+        self.state_path = os.path.join(base_dir, STATE_FILE)
+
+    def checked_at(self) -> float:
+        """When the feed was last fetched successfully (epoch seconds), 0 if never"""
+        state = load_json(self.state_path)
+        if state.get('source') == self.url:
+            return state.get('checked', 0)
+        return 0
+
+    def age(self) -> Optional[float]:
+        """Seconds since the last successful check, or None if feed.json is missing"""
+        if not os.path.exists(self.path):
+            return None
+        return time.time() - self.checked_at()
+
+    def refresh(self, force: bool = False) -> Dict[str, Any]:
+        """Fetch the feed and rewrite feed.json if its items changed.
+
+        Shaped like a page build result ('page', 'file', 'written', 'files')
+        so the server can publish it alongside pages. Raises OSError when the
+        feed cannot be fetched and ValueError when it cannot be parsed; the
+        previous feed.json is kept either way.
+        """
+        start = time.perf_counter()
+        state = {} if force or not os.path.exists(self.path) else load_json(self.state_path)
+        result = {'page': 'feed', 'file': self.path, 'written': False, 'files': [],
+                  'source': self.url, 'items': 0, 'not_modified': False}
+        stream, headers = open_feed(self.url, state)
+        if stream is None:
+            result['not_modified'] = True
+            result['items'] = len(load_json(self.path).get('items', []))
+        else:
+            with stream:
+                items = []
+                for item in iter_feed(stream):
+                    items.append(item)
+                    if len(items) == self.limit:
+                        break
+            result['items'] = len(items)
+            body = json.dumps({'version': FEED_VERSION, 'source': self.url, 'items': items},
+                              ensure_ascii=False, indent=1) + '\n'
+            if write_if_changed(self.path, body):
+                result['files'].append(self.path)
+                result['written'] = True
+            state = {'source': self.url, 'etag': headers.get('ETag'),
+                     'last_modified': headers.get('Last-Modified')}
+        state['checked'] = time.time()
+        atomic_write_bytes(self.state_path, json.dumps(state).encode('utf-8'))
+        result['ms'] = (time.perf_counter() - start) * 1000
+        return result
+
+
+class FeedRefresher:
+    """Stale-while-revalidate for feed.json in a long-running server.
+
+    maybe_refresh() returns at once when the feed is fresh. When it is older
+    than max_age it starts one background refresh (never more than one at a
+    time) and the stale copy keeps being served meanwhile; only a missing
+    feed.json makes the caller wait for the fetch. A failed fetch is not
+    retried until max_age has passed again.
+    """
+
+    def __init__(self, store: FeedStore, max_age: float = DEFAULT_MAX_AGE,
+                 on_update: Optional[Callable[[Dict[str, Any]], None]] = None):
+        self.store = store
+        self.max_age = max_age
+        self.on_update = on_update
+        self.checked = store.checked_at()
+        self.last_attempt = 0.0
+        self.refreshes = 0
+        self.failures = 0
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def maybe_refresh(self):
+        missing = not os.path.exists(self.store.path)
+        now = time.time()
+        if not missing and now - self.checked < self.max_age:
+            return
+        with self._lock:
+            thread = self._thread
+            if thread is None or not thread.is_alive():
+                # Another server process or a cron run may have fetched it meanwhile
+                self.checked = max(self.checked, self.store.checked_at())
+                if not missing and now - self.checked < self.max_age:
+                    return
+                if now - self.last_attempt < self.max_age:
+                    return
+                self.last_attempt = now
+                thread = self._thread = threading.Thread(target=self._run, name='cms-feed', daemon=True)
+                thread.start()
+        if missing:
+            thread.join(FETCH_TIMEOUT + 1)
+
+    def _run(self):
+        try:
+            result = self.store.refresh()
+        except (OSError, ValueError) as e:
+            self.failures += 1
+            print(f"⚠️  Feed refresh failed, serving the previous {FEED_FILE}: {e}")
+            return
+        self.checked = time.time()
+        self.refreshes += 1
+        if result['written'] and self.on_update:
+            self.on_update(result)
+
+    def stats(self) -> Dict[str, Any]:
+        age = round(time.time() - self.checked, 1) if self.checked else None
+        return {'source': self.store.url, 'age_seconds': age, 'max_age': self.max_age,
+                'refreshes': self.refreshes, 'failures': self.failures}
+
+
+def print_feed_result(result: Dict[str, Any]):
+    if result['not_modified']:
+        print(f"⏭️  Feed not modified ({result['items']} items in {result['file']})")
+    elif result['written']:
+        print(f"📰 Feed: {result['items']} items written to {result['file']} in {result['ms']:.0f} ms")
+    else:
+        print(f"⏭️  Feed unchanged ({result['items']} items)")
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description=f'Fetch the Substack feed into {FEED_FILE}')
+    parser.add_argument('--url', default=DEFAULT_FEED_URL,
+                        help=f'Feed URL or local RSS/Atom file (default: {DEFAULT_FEED_URL})')
+    parser.add_argument('--base-dir', default='.', help=f'Directory to write {FEED_FILE} in')
+    parser.add_argument('--limit', type=int, default=DEFAULT_LIMIT,
+                        help=f'Most recent items to keep (default: {DEFAULT_LIMIT})')
+    parser.add_argument('--max-age', type=int, default=DEFAULT_MAX_AGE,
+                        help='With --if-stale, seconds a fetched feed stays fresh '
+                             f'(default: {DEFAULT_MAX_AGE})')
+    parser.add_argument('--if-stale', action='store_true',
+                        help='Only fetch when the last check is older than --max-age (for cron)')
+    parser.add_argument('--force', action='store_true',
+                        help='Fetch without If-None-Match/If-Modified-Since')
+
+    args = parser.parse_args()
+    store = FeedStore(args.base_dir, args.url, args.limit)
+    age = store.age()
+    if args.if_stale and age is not None and age < args.max_age:
+        print(f"⏭️  {store.path} checked {age:.0f}s ago, still fresh")
+        return
+    try:
+        print_feed_result(store.refresh(force=args.force))
+    except (OSError, ValueError) as e:
+        print(f"❌ Could not refresh {store.path}: {e}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
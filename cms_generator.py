@@ -4,257 +4,1078 @@ Content Management System HTML Generator
 Generates and updates HTML files based on CMS data
 """
 
+import hashlib
 import json
 import os
-import shutil
-from datetime import datetime
-from typing import Dict, Any
+import sys
+import time
+from typing import Dict, Any, List, Optional, Tuple
+
+# gzip, shutil, tempfile, filecmp, concurrent.futures, cms_stream and cms_backup
+# are imported where they are used: together they are most of the import time
+# of a run that has nothing to rebuild.
+from cms_tags import TAGS_FILE, TagIndex, TagRegistry, tag_slug
+from cms_templates import TEMPLATE_DIR, TemplateLoader, escape
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+COMPRESS_CHUNK_SIZE = 256 * 1024
+
+
+def write_precompressed(path: str) -> List[str]:
+    """Write .gz (and .br when brotli is installed) sidecars next to a generated file"""
+    import gzip
+    import shutil
+    
+    written = []
+    
+    # Compress in chunks so streamed multi-megabyte pages never sit in memory
+    with open(path, 'rb') as src, open(path + '.gz.tmp', 'wb') as raw:
+        with gzip.GzipFile(filename='', mode='wb', compresslevel=9, fileobj=raw, mtime=0) as gz:
+            shutil.copyfileobj(src, gz, COMPRESS_CHUNK_SIZE)
+    os.replace(path + '.gz.tmp', path + '.gz')
+    written.append(path + '.gz')
+    
+    if brotli is not None:
+        compressor = brotli.Compressor(quality=11)
+        with open(path, 'rb') as src, open(path + '.br.tmp', 'wb') as out:
+            for chunk in iter(lambda: src.read(COMPRESS_CHUNK_SIZE), b''):
+                out.write(compressor.process(chunk))
+            out.write(compressor.finish())
+        os.replace(path + '.br.tmp', path + '.br')
+        written.append(path + '.br')
+    return written
+
+
+MANIFEST_FILE = '.cms_manifest.json'
+TAG_INDEX_FILE = 'index.json'
+MANIFEST_VERSION = 1
+DEFAULT_WORK_DESCRIPTION = 'My day job is confidential (marketing attribution stuff), so here\'s what I\'m actually excited to share—the random projects I build because they seem fun, experiments that went nowhere, and side quests that turned into something cool.'
+
+
+def content_hash(value: Any) -> str:
+    """Stable short hash of a string or any JSON-serialisable value"""
+    if not isinstance(value, str):
+        value = json.dumps(value, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(value.encode('utf-8')).hexdigest()[:16]
+
+
+class BuildManifest:
+    """Content hashes and rendered entry fragments from the previous build"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.pages: Dict[str, Dict[str, Any]] = {}
+        self.fragments: Dict[str, str] = {}
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == MANIFEST_VERSION:
+                self.pages = data.get('pages', {})
+                self.fragments = data.get('fragments', {})
+        except (OSError, ValueError):
+            pass
+
+    def save(self):
+        """Atomically write the manifest, dropping fragments no page references"""
+        used = {key for page in self.pages.values() for key in page.get('entries', [])}
+        self.fragments = {key: html for key, html in self.fragments.items() if key in used}
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': MANIFEST_VERSION, 'pages': self.pages,
+                       'fragments': self.fragments}, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+
+def atomic_write_bytes(path: str, data: bytes, fsync: bool = False):
+    """Write via a temp file and rename so readers never see a half-written file.
+
+    With fsync the data and the rename are flushed to disk before returning,
+    so a crash cannot leave an empty or truncated file behind.
+    """
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+        if fsync:
+            dir_fd = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def write_if_changed(path: str, content: str) -> bool:
+    """Write content unless the file already holds exactly these bytes"""
+    data = content.encode('utf-8')
+    try:
+        with open(path, 'rb') as f:
+            if f.read() == data:
+                return False
+    except OSError:
+        pass
+    atomic_write_bytes(path, data)
+    return True
+
+
+NAV_LINKS = [
+    ('About', '/', 'index'),
+    ('Work', '/work', 'work'),
+    ('Blogs', '/blogs', 'blogs'),
+    ('Projects', '/projects', 'projects'),
+    ('Publications', '/publications', 'publications'),
+    ('Photography', '/photography', 'photography'),
+    ('Contact', '/contact', 'contact')
+]
+# The sidebar photo: shown at 80x80 CSS px, above the fold so not lazy-loaded
+AVATAR = {'src': '/assets/img/pavan.jpg', 'alt': 'Pavan Kumar Dharmoju',
+          'css_class': 'w-20 h-20 rounded-full object-cover transform hover:rotate-12 transition-all duration-300',
+          'sizes': '80px', 'width': 80, 'height': 80, 'loading': 'eager'}
+# Photography is two columns in a 672 px container from the sm breakpoint, full width below it
+PHOTO_SIZES = '(min-width: 640px) 324px, calc(100vw - 2rem)'
+
+
+class PageSpec:
+    """How one site page is built: its output file, templates and where its data lives.
+
+    Pages are rendered from ``_templates/<name>.html`` with one
+    ``_templates/<name>_entry.html`` fragment per entry in ``data[entries_key]``.
+    Layout pages are additionally wrapped in ``_templates/layout.html``.
+    Pages with a tag_dir also get ``<tag_dir>/<slug>.html`` per tag and a JSON
+    tag index there, and their tag badges link to those pages.
+    """
+
+    def __init__(self, name: str, output: str, entries_key: str, settings_key: str,
+                 title: str, description: str, canonical_path: str,
+                 layout: bool = True, head_template: Optional[str] = None, tag_dir: Optional[str] = None):
+        self.name = name
+        self.output = output
+        self.entries_key = entries_key
+        self.settings_key = settings_key
+        self.title = title
+        self.description = description
+        self.canonical_path = canonical_path
+        self.layout = layout
+        self.head_template = head_template
+        self.tag_dir = tag_dir
+        self.tag_pages = tag_dir is not None
+
+    def html_title(self, settings: Dict[str, str]) -> str:
+        if self.name == 'index':
+            return f"{settings['title']} - {settings['description']}"
+        return f"{settings['title']} - Pavan Kumar Dharmoju"
+
+    def template_names(self) -> List[str]:
+        names = [self.name, self.name + '_entry', 'tag', 'image', 'picture', 'picture_source']
+        if self.tag_pages:
+            names.append('tag_link')
+        if self.layout:
+            names += ['layout', 'nav_link']
+        if self.head_template:
+            names.append(self.head_template)
+        return names
+
+
+PAGES = {spec.name: spec for spec in (
+    # work.html predates the shared layout and keeps its own full-page template
+    PageSpec('work', 'work.html', 'workEntries', 'pageSettings',
+             'Build Log', DEFAULT_WORK_DESCRIPTION, '/work', layout=False, tag_dir='tags'),
+    PageSpec('projects', 'projects.html', 'projectsEntries', 'projectsPageSettings',
+             'Project Build Log',
+             'Systems I\'ve architected, bugs I\'ve hunted down, and experiments that taught me something new. '
+             'Each commit represents real problems solved with real code that runs in production.',
+             '/projects'),
+    PageSpec('publications', 'publications.html', 'publicationsEntries', 'publicationsPageSettings',
+             'Research Publications',
+             'Peer-reviewed research contributions that made it through the academic gauntlet. '
+             'Each paper represents months of experiments, failed hypotheses, and eventual breakthroughs.',
+             '/publications', head_template='publications_head'),
+    PageSpec('photography', 'photography.html', 'photographyEntries', 'photographyPageSettings',
+             'Visual Commit Log',
+             'Capturing moments between building systems. Street scenes, landscapes, and life through the lens '
+             'of a developer who sees the world in frames and functions.',
+             '/photography'),
+    PageSpec('blogs', 'blogs.html', 'blogsEntries', 'blogsPageSettings',
+             'Technical Articles',
+             'Deep dives into problems I\'ve solved, mistakes I\'ve made, and lessons learned along the way. '
+             'No fluff, just honest technical insights from building real systems.',
+             '/blogs'),
+    PageSpec('index', 'index.html', 'indexParagraphs', 'indexPageSettings',
+             'Pavan Kumar Dharmoju', 'Building AI that works', '/')
+)}
+
+
+def split_page_data(data: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """Split an export into the slice of data each registered page reads"""
+    page_data = {}
+    for name, spec in PAGES.items():
+        if spec.entries_key in data or spec.settings_key in data:
+            page_data[name] = {key: data[key] for key in (spec.entries_key, spec.settings_key)
+                               if key in data}
+    return page_data
+
+def _build_page_worker(base_dir: str, template_dir: str, precompress: bool, force: bool, assets: bool,
+                       name: str, page_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Process-pool entry point: build one page in a fresh generator"""
+    generator = HTMLGenerator(base_dir, precompress=precompress, force=force, template_dir=template_dir,
+                              assets=assets)
+    return generator.build_one(name, page_data)
+
 
 class HTMLGenerator:
-    def __init__(self, base_dir: str = "."):
+    def __init__(self, base_dir: str = ".", precompress: bool = True, force: bool = False,
+                 template_dir: str = TEMPLATE_DIR, search: bool = True, images: bool = True,
+                 assets: bool = True):
+        from cms_assets import AssetPipeline  # cms_assets imports this module
+        from cms_images import ImagePipeline  # cms_images imports this module
+        
         self.base_dir = base_dir
-        self.templates = {
-            'work': self._load_work_template()
-        }
+        self.precompress = precompress
+        self.force = force
+        self.search = search
+        self.resize_images = images
+        self.images = ImagePipeline(base_dir)
+        self.minify = assets
+        self.assets = AssetPipeline(base_dir)
+        self.templates = TemplateLoader(template_dir)
+        self.tags = TagRegistry(os.path.join(template_dir, TAGS_FILE))
+        self._tag_html_cache: Dict[Tuple[str, Optional[str], Optional[str]], str] = {}
+        self.manifest = BuildManifest(os.path.join(base_dir, MANIFEST_FILE))
+        self.build_stats = {'rendered': 0, 'reused': 0}
+        self.new_fragments: Dict[str, str] = {}
+        # Off while streaming: stream_page writes no tag pages to link to
+        self.link_tags = True
     
-    def _load_work_template(self) -> str:
-        """Load the work.html template structure"""
-        return '''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Build Diary - Pavan Kumar Dharmoju | Side Projects & Experiments</title>
-    <meta name="description" content="Personal projects and side experiments by Pavan Kumar Dharmoju. Real stories about building tools, learning new tech, and creative coding projects outside of work.">
-    <meta name="keywords" content="Side Projects, Personal Projects, Build Diary, Tech Experiments, Creative Coding, Open Source, Learning Journey, Developer Life">
-    <meta name="author" content="Pavan Kumar Dharmoju">
-    <link rel="canonical" href="https://pavankumardharmoju.github.io/work">
-    <script src="https://cdn.tailwindcss.com"></script>
-    <style>
-        @import url('https://fonts.googleapis.com/css2?family=DM+Sans:ital,opsz,wght@0,9..40,100..1000;1,9..40,100..1000&display=swap');
-        body {
-            font-family: 'DM Sans', -apple-system, BlinkMacSystemFont, 'Segoe UI', system-ui, sans-serif;
-            font-feature-settings: 'kern' 1, 'liga' 1, 'calt' 1;
-            -webkit-font-smoothing: antialiased;
-            -moz-osx-font-smoothing: grayscale;
-            font-optical-sizing: auto;
-            letter-spacing: -0.01em;
-            font-size: 16px;
-        }
-        .company-title {
-            font-size: 22px;
-            font-weight: 700;
-        }
-        .role-title {
-            font-size: 17px;
-            font-weight: 600;
-        }
-        .description-text {
-            font-size: 15px;
-            line-height: 1.6;
-        }
-        .date-text {
-            font-size: 14px;
-        }
-    </style>
-</head>
-<body class="bg-white">
-    <div class="max-w-4xl mx-auto px-4 sm:px-8">
-        <div class="flex flex-col sm:flex-row gap-8 pt-12">
-            <!-- Sidebar -->
-            <aside class="sm:w-24 shrink-0">
-                <div class="flex sm:flex-col justify-between sm:space-y-4 sm:sticky sm:top-12">
-                    <div class="flex items-center sm:block">
-                        <a href="/">
-                            <img src="assets/img/pavan.jpg" alt="Pavan Kumar Dharmoju" 
-                                 class="w-20 h-20 rounded-full object-cover transform hover:rotate-12 transition-all duration-300">
-                        </a>
-                    </div>
-                    <div>
-                        <nav class="flex sm:flex-col sm:space-y-1 sm:text-right text-sm sm:text-base">
-                            <a class="mr-4 text-gray-400 hover:text-gray-900" href="/">About</a>
-                            <a class="mr-4 text-gray-800" href="/work">Work</a>
-                            <a class="mr-4 text-gray-400 hover:text-gray-900" href="/blogs">Blogs</a>
-                            <a class="mr-4 text-gray-400 hover:text-gray-900" href="/projects">Projects</a>
-                            <a class="mr-4 text-gray-400 hover:text-gray-900" href="/publications">Publications</a>
-                            <a class="mr-4 text-gray-400 hover:text-gray-900" href="/photography">Photography</a>
-                            <a class="mr-4 text-gray-400 hover:text-gray-900" href="/contact">Contact</a>
-                        </nav>
-                    </div>
-                </div>
-            </aside>
-
-            <!-- Main Content -->
-            <main class="flex-1 min-h-screen">
-                <div class="max-w-2xl">
-                    <div class="space-y-12 my-2">
-                        
-                        <!-- Build Diary Header -->
-                        <div class="mb-8">
-                            <h1 class="text-2xl font-semibold text-gray-900 mb-3">{page_title}</h1>
-                            <p class="text-gray-600 text-base leading-relaxed">
-                                {page_description}
-                            </p>
-                        </div>
-                        
-                        <!-- Commit-style Entries -->
-                        <div class="space-y-6">
-                            {entries_content}
-                        </div>
-                    </div>
-                </div>
-            </main>
-        </div>
-    </div>
+    def reload_templates(self):
+        """Drop compiled templates and anything rendered from them"""
+        self.templates.clear()
+        self.tags.reload()
+        self._tag_html_cache.clear()
     
-    <!-- Copyright Footer -->
-    <footer class="mt-16 py-6 border-t border-gray-200">
-        <div class="max-w-4xl mx-auto px-4 sm:px-8">
-            <p class="text-center text-sm text-gray-500">
-                © 2025 Pavan Kumar Dharmoju. All rights reserved.
-            </p>
-        </div>
-    </footer>
-</body>
-</html>'''
-
     def get_tag_color_class(self, tag: str) -> str:
         """Get the appropriate color class for a tag"""
-        color_map = {
-            'Python': 'bg-blue-100 text-blue-700',
-            'JavaScript': 'bg-yellow-100 text-yellow-700',
-            'React': 'bg-cyan-100 text-cyan-700',
-            'Machine Learning': 'bg-purple-100 text-purple-700',
-            'API': 'bg-green-100 text-green-700',
-            'CLI Tool': 'bg-gray-100 text-gray-700',
-            'Web Scraping': 'bg-orange-100 text-orange-700',
-            'Data Viz': 'bg-pink-100 text-pink-700',
-            'OpenAI API': 'bg-green-100 text-green-700',
-            'PyTorch': 'bg-red-100 text-red-700',
-            'TensorFlow': 'bg-orange-100 text-orange-700',
-            'Chrome Extension': 'bg-yellow-100 text-yellow-700',
-            'Content Filtering': 'bg-green-100 text-green-700',
-            'Web APIs': 'bg-purple-100 text-purple-700',
-            'Failed Experiment': 'bg-red-100 text-red-700',
-            'File Management': 'bg-green-100 text-green-700',
-            'Automation': 'bg-purple-100 text-purple-700',
-            'Product': 'bg-blue-100 text-blue-700',
-            'User Acquisition': 'bg-purple-100 text-purple-700',
-            'Rust': 'bg-orange-100 text-orange-700',
-            'Performance': 'bg-blue-100 text-blue-700',
-            'Learning': 'bg-yellow-100 text-yellow-700',
-            'Data Pipeline': 'bg-purple-100 text-purple-700',
-            'Analytics': 'bg-green-100 text-green-700',
-            'Self-Tracking': 'bg-blue-100 text-blue-700',
-            'LLaMA 3.1': 'bg-blue-100 text-blue-700',
-            'RAG': 'bg-purple-100 text-purple-700',
-            'Research': 'bg-green-100 text-green-700',
-            'Publication': 'bg-green-100 text-green-700',
-            'CRISPR': 'bg-blue-100 text-blue-700',
-            'Kubernetes': 'bg-blue-100 text-blue-700',
-            'PostgreSQL': 'bg-green-100 text-green-700'
-        }
-        return color_map.get(tag, 'bg-gray-100 text-gray-700')
+        return self.tags.color_class(tag)
+
+    def _tag_html(self, tag: str, color_class: Optional[str] = None, href: Optional[str] = None) -> str:
+        """Render a tag badge, linked when href is given; the same few tags repeat across every entry"""
+        key = (tag, color_class, href)
+        html = self._tag_html_cache.get(key)
+        if html is None:
+            html = self._tag_html_cache[key] = self.templates['tag_link' if href else 'tag'].render({
+                'color_class': color_class or self.get_tag_color_class(tag),
+                'tag': tag,
+                'href': href
+            })
+        return html
+
+    def tag_url(self, spec: PageSpec, tag: str) -> Optional[str]:
+        if not (spec.tag_pages and self.link_tags):
+            return None
+        return f'/{spec.tag_dir}/{tag_slug(tag)}.html'
 
     def generate_work_entry_html(self, entry: Dict[str, Any]) -> str:
         """Generate HTML for a single work entry"""
-        tags_html = ''
-        if entry.get('tags'):
-            tags_html = ''.join([
-                f'<span class="px-2 py-1 {self.get_tag_color_class(tag)} text-xs rounded">{tag}</span>'
-                for tag in entry['tags']
-            ])
-
-        return f'''
-                            <div class="border-l-2 border-gray-200 pl-6 pb-6">
-                                <div class="flex items-center gap-3 mb-3">
-                                    <div class="w-2 h-2 bg-{entry.get('statusColor', 'green')}-500 rounded-full -ml-7 border-2 border-white"></div>
-                                    <span class="font-mono text-sm text-gray-500">{entry.get('commitHash', '')}</span>
-                                    <span class="text-sm text-gray-500">•</span>
-                                    <span class="text-sm text-gray-500">{entry.get('date', '')}</span>
-                                </div>
-                                <h3 class="font-medium text-gray-900 mb-2">{entry.get('entryType', 'feat')}: {entry.get('title', '')}</h3>
-                                <p class="text-gray-700 text-sm mb-3">
-                                    {entry.get('description', '')}
-                                </p>
-                                <div class="flex gap-2">
-                                    {tags_html}
-                                </div>
-                            </div>'''
+        spec = PAGES['work']
+        tags_html = ''.join(self._tag_html(tag, href=self.tag_url(spec, tag)) for tag in entry.get('tags') or [])
+
+        return self.templates['work_entry'].render({
+            'status_color': entry.get('statusColor', 'green'),
+            'commit_hash': entry.get('commitHash', ''),
+            'date': entry.get('date', ''),
+            'entry_type': entry.get('entryType', 'feat'),
+            'title': entry.get('title', ''),
+            'description': entry.get('description', ''),
+            'tags_html': tags_html
+        })
+
+    def generate_projects_entry_html(self, entry: Dict[str, Any]) -> str:
+        """Generate HTML for a single project entry; tags follow the status color"""
+        color = entry.get('statusColor', 'blue')
+        color_class = f'bg-{color}-100 text-{color}-700'
+        tags_html = ''.join(self._tag_html(tag, color_class) for tag in entry.get('tags') or [])
+
+        return self.templates['projects_entry'].render({
+            'status_color': color,
+            'commit_hash': entry.get('commitHash', ''),
+            'date': entry.get('date', ''),
+            'organization': entry.get('organization', ''),
+            'entry_type': entry.get('entryType', 'feat'),
+            'title': entry.get('title', ''),
+            'description': entry.get('description', ''),
+            'tags_html': tags_html
+        })
+
+    def generate_publications_entry_html(self, entry: Dict[str, Any]) -> str:
+        """Generate HTML for a single publication, bolding the site owner in the author list"""
+        authors_html = escape(entry.get('authors', ''))
+        highlight = escape(entry.get('highlightAuthor', 'P Dharmoju'))
+        if highlight:
+            authors_html = authors_html.replace(highlight, f'<strong>{highlight}</strong>')
+
+        link_template = self.templates['publications_link']
+        links_html = ''.join(
+            link_template.render({'href': entry[key], 'button_class': button_class, 'label': label})
+            for key, label, button_class in (
+                ('url', '🔗 Open in New Tab', 'action-btn-primary'),
+                ('pdf', '📄 PDF', 'action-btn-secondary'),
+                ('citations', '📊 Citations', 'action-btn-secondary')
+            )
+            if entry.get(key)
+        )
+
+        return self.templates['publications_entry'].render({
+            'status_color': entry.get('statusColor', 'green'),
+            'commit_hash': entry.get('commitHash', ''),
+            'year': entry.get('year', ''),
+            'venue': entry.get('venue', ''),
+            'entry_type': entry.get('entryType', 'feat'),
+            'title': entry.get('title', ''),
+            'authors_html': authors_html,
+            'description': entry.get('description', ''),
+            'links_html': links_html
+        })
+
+    def image_html(self, src: str, alt: str, css_class: str = '', sizes: str = '100vw',
+                   width: Optional[int] = None, height: Optional[int] = None, loading: str = 'lazy') -> str:
+        """An image as <picture> with AVIF/WebP sources and a srcset when it has variants,
+        otherwise a plain <img>"""
+        from cms_images import FORMAT_TYPES, MODERN_FORMATS, VARIANT_DIR
+        
+        record = self.images.lookup(src) if src else None
+        fallback_width = width
+        if record is not None:
+            width, height = width or record['width'], height or record['height']
+        context = {
+            'src': src,
+            'dimensions': f' width="{width}" height="{height}"' if width and height else '',
+            'alt': alt,
+            'css_class': css_class,
+            'loading': loading
+        }
+        if record is None:
+            return self.templates['image'].render(context)
+        
+        context['sources_html'] = ''.join(
+            self.templates['picture_source'].render({
+                'type': FORMAT_TYPES[image_format],
+                'srcset': self.images.srcset(record, image_format),
+                'sizes': sizes
+            })
+            for image_format in MODERN_FORMATS if image_format in record['formats']
+        )
+        context['src'] = f"/{VARIANT_DIR}/{self.images.fallback_variant(record, fallback_width)[2]}"
+        context['srcset'] = self.images.srcset(record, record['fallback'])
+        context['sizes'] = sizes
+        return self.templates['picture'].render(context)
+
+    def generate_photography_entry_html(self, entry: Dict[str, Any]) -> str:
+        """Generate HTML for a single photo"""
+        return self.templates['photography_entry'].render({
+            'image_html': self.image_html(entry.get('image', ''), entry.get('title', ''),
+                                          'w-full rounded-lg object-cover', PHOTO_SIZES),
+            'link': entry.get('link') or entry.get('image', ''),
+            'title': entry.get('title', ''),
+            'date': entry.get('date', '')
+        })
+
+    def generate_blogs_entry_html(self, entry: Dict[str, Any]) -> str:
+        """Generate HTML for a single blog post"""
+        return self.templates['blogs_entry'].render({
+            'status_color': entry.get('statusColor', 'blue'),
+            'date': entry.get('date', ''),
+            'link': entry.get('link', ''),
+            'title': entry.get('title', ''),
+            'excerpt': entry.get('excerpt', '')
+        })
+
+    def generate_index_entry_html(self, entry: Any) -> str:
+        """Generate one About paragraph; paragraphs are trusted HTML so links survive"""
+        paragraph = entry.get('html', '') if isinstance(entry, dict) else entry
+        return self.templates['index_entry'].render({'paragraph_html': paragraph})
+
+    def nav_html(self, active: str) -> str:
+        link_template = self.templates['nav_link']
+        return ''.join(
+            link_template.render({
+                'link_class': 'text-gray-800' if page == active else 'text-gray-400 hover:text-gray-900',
+                'href': href,
+                'label': label
+            })
+            for label, href, page in NAV_LINKS
+        )
+
+    def page_settings(self, spec: PageSpec, data: Dict[str, Any]) -> Dict[str, str]:
+        settings = {'title': spec.title, 'description': spec.description}
+        settings.update(data.get(spec.settings_key) or {})
+        return settings
+
+    def page_shell(self, spec: PageSpec, settings: Dict[str, str]) -> Tuple[str, str]:
+        """Render a page around its entries slot, returning the HTML before and after it"""
+        avatar_html = self.image_html(**AVATAR)
+        before, after = self.templates[spec.name].render_around('entries_content', {
+            'page_title': settings['title'],
+            'page_description': settings['description'],
+            'avatar_html': avatar_html
+        })
+        if not spec.layout:
+            return before, after
+        
+        layout_before, layout_after = self.templates['layout'].render_around('content', {
+            'html_title': spec.html_title(settings),
+            'meta_description': settings['description'],
+            'canonical_path': spec.canonical_path,
+            'head_extra': self.templates[spec.head_template].render({}) if spec.head_template else '',
+            'nav_html': self.nav_html(spec.name),
+            'avatar_html': avatar_html
+        })
+        return layout_before + before, after + layout_after
+
+    def template_key(self, spec: PageSpec) -> str:
+        """Hash of every template, the tag colors, the image variants and the asset
+        fingerprints and minification that contribute to a page"""
+        return content_hash([self.templates[name].source for name in spec.template_names()]
+                            + [self.tags.config_key(), self.images.key(), self.finish_key(), spec.tag_dir])
+
+    def finish_key(self) -> str:
+        """Hash of everything finish_html does to a page besides its content"""
+        return content_hash([self.minify, self.assets.key() if self.minify else ''])
+
+    def finish_html(self, html: str) -> str:
+        """Point asset references at their fingerprinted files and minify, unless assets are off"""
+        if not self.minify:
+            return html
+        from cms_assets import minify_html
+        return minify_html(self.assets.rewrite(html))
+
+    def render_entry(self, spec: PageSpec, entry: Any) -> str:
+        return getattr(self, f'generate_{spec.name}_entry_html')(entry)
+
+    def generate_page_html(self, spec: PageSpec, data: Dict[str, Any]) -> str:
+        """Generate a complete page from scratch"""
+        prefix, suffix = self.page_shell(spec, self.page_settings(spec, data))
+        
+        # Join once over every piece so the entries are never copied twice
+        parts = [prefix]
+        parts.extend(self.render_entry(spec, entry) for entry in data.get(spec.entries_key, []))
+        parts.append(suffix)
+        return ''.join(parts)
 
     def generate_work_html(self, data: Dict[str, Any]) -> str:
         """Generate complete work.html content"""
-        page_settings = data.get('pageSettings', {})
-        title = page_settings.get('title', 'Build Log')
-        description = page_settings.get('description', 
-            'My day job is confidential (marketing attribution stuff), so here\'s what I\'m actually excited to share—the random projects I build because they seem fun, experiments that went nowhere, and side quests that turned into something cool.')
+        return self.generate_page_html(PAGES['work'], data)
+
+    def build_page(self, spec: PageSpec, data: Dict[str, Any]) -> Optional[str]:
+        """Incrementally build a page, reusing entry fragments from the manifest.
+
+        Returns None when the templates, page settings and entries all match the
+        previous build and the file on disk is still that build's output.
+        """
+        settings = self.page_settings(spec, data)
+        entries = data.get(spec.entries_key, [])
+        template_key = self.template_key(spec)
+        settings_key = content_hash(settings)
+        entry_keys = [content_hash([template_key, entry]) for entry in entries]
+        
+        previous = self.manifest.pages.get(spec.name, {})
+        page_file = os.path.join(self.base_dir, spec.output)
+        if (not self.force
+                and previous.get('template') == template_key
+                and previous.get('settings') == settings_key
+                and previous.get('entries') == entry_keys
+                and previous.get('output') == self._file_hash(page_file)):
+            self.build_stats['reused'] += len(entries)
+            return None
+        
+        # Fragments are stored minified; the rendered sizes are kept for the weight report
+        previous_sizes = dict(zip(previous.get('entries', []), previous.get('sizes', [])))
+        parts = []
+        sizes = []
+        for key, entry in zip(entry_keys, entries):
+            html = None if self.force else self.manifest.fragments.get(key)
+            if html is None:
+                raw_html = self.render_entry(spec, entry)
+                html = self.finish_html(raw_html)
+                previous_sizes[key] = len(raw_html.encode('utf-8'))
+                self.manifest.fragments[key] = self.new_fragments[key] = html
+                self.build_stats['rendered'] += 1
+            else:
+                self.build_stats['reused'] += 1
+            parts.append(html)
+            sizes.append(previous_sizes.get(key) or len(html.encode('utf-8')))
+        
+        # Shell and fragments are finished separately so an edit never re-minifies the whole page
+        raw_prefix, raw_suffix = self.page_shell(spec, settings)
+        prefix, suffix = self.finish_html(raw_prefix), self.finish_html(raw_suffix)
+        page_html = prefix + ''.join(parts) + suffix
+        shell_weight = self.assets.page_weight(raw_prefix + raw_suffix, prefix + suffix)
+        self.manifest.pages[spec.name] = {
+            'template': template_key,
+            'settings': settings_key,
+            'entries': entry_keys,
+            'sizes': sizes,
+            'output': content_hash(page_html),
+            'bytes': [shell_weight[0] + sum(sizes),
+                      shell_weight[1] + sum(len(html.encode('utf-8')) for html in parts)]
+        }
+        return page_html
+
+    @staticmethod
+    def _file_hash(path: str) -> Optional[str]:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return content_hash(f.read())
+        except (OSError, UnicodeDecodeError):
+            return None
+
+    def build_one(self, name: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Build and write a single page, timing the render and write phases"""
+        spec = PAGES[name]
+        stats_before = dict(self.build_stats)
+        self.new_fragments = {}
+        
+        start = time.perf_counter()
+        page_html = self.build_page(spec, data)
+        rendered_at = time.perf_counter()
+        
+        page_file = os.path.join(self.base_dir, spec.output)
+        written = page_html is not None and write_if_changed(page_file, page_html)
+        if self.precompress and (written or not os.path.exists(page_file + '.gz')):
+            write_precompressed(page_file)
+        tag_files = self.build_tag_pages(spec, data) if spec.tag_pages else []
+        finished = time.perf_counter()
+        
+        return {
+            'page': name,
+            'file': page_file,
+            'written': written,
+            'entries': len(data.get(spec.entries_key, [])),
+            'rendered': self.build_stats['rendered'] - stats_before['rendered'],
+            'reused': self.build_stats['reused'] - stats_before['reused'],
+            'render_ms': (rendered_at - start) * 1000,
+            'write_ms': (finished - rendered_at) * 1000,
+            'total_ms': (finished - start) * 1000,
+            'tag_files': tag_files,
+            # Every file this build wrote or removed, for the next commit
+            'files': ([page_file] if written else []) + tag_files,
+            'bytes': self.manifest.pages.get(name, {}).get('bytes'),
+            'manifest': self.manifest.pages.get(name, {}),
+            'fragments': self.new_fragments
+        }
+
+    def tag_dir(self, spec: PageSpec) -> str:
+        return os.path.join(self.base_dir, spec.tag_dir)
+
+    def build_tag_pages(self, spec: PageSpec, data: Dict[str, Any]) -> List[str]:
+        """Write one page per tag and a compact JSON tag index next to the full page.
+
+        Tag pages reuse the entry fragments build_page just rendered or kept.
+        Returns the files written or removed; nothing is touched when neither
+        the full page nor the index changed since the last build.
+        """
+        entries = data.get(spec.entries_key, [])
+        index = TagIndex.from_entries(entries)
+        tag_dir = self.tag_dir(spec)
+        index_path = os.path.join(tag_dir, TAG_INDEX_FILE)
+        index_json = json.dumps(index.to_json(self.tags, f'/{spec.tag_dir}'),
+                                separators=(',', ':'), ensure_ascii=False)
+        
+        page_manifest = self.manifest.pages.setdefault(spec.name, {})
+        tags_key = content_hash([page_manifest.get('output'), index_json])
+        if not self.force and page_manifest.get('tags') == tags_key and os.path.exists(index_path):
+            return []
         
-        entries = data.get('workEntries', [])
-        entries_html = ''
+        keys = page_manifest.get('entries', [])
         
-        for entry in entries:
-            entries_html += self.generate_work_entry_html(entry)
+        def fragment(position: int) -> str:
+            html = self.manifest.fragments.get(keys[position]) if position < len(keys) else None
+            if html is None:
+                html = self.finish_html(self.render_entry(spec, entries[position]))
+            return html
+        
+        os.makedirs(tag_dir, exist_ok=True)
+        settings = self.page_settings(spec, data)
+        changed = []
+        for slug in index.slugs():
+            tag, positions = index.names[slug], index.postings[slug]
+            prefix, suffix = self.page_shell(spec, {
+                'title': f"{settings['title']}: {tag}",
+                'description': f"{len(positions)} entr{'y' if len(positions) == 1 else 'ies'} tagged {tag}."
+            })
+            path = os.path.join(tag_dir, slug + '.html')
+            body = ''.join(fragment(p) for p in positions)
+            if write_if_changed(path, self.finish_html(prefix) + body + self.finish_html(suffix)):
+                changed.append(path)
+            if self.precompress and (path in changed or not os.path.exists(path + '.gz')):
+                write_precompressed(path)
+        if write_if_changed(index_path, index_json + '\n'):
+            changed.append(index_path)
+        
+        # Drop pages for tags no entry uses any more
+        for name in sorted(os.listdir(tag_dir)):
+            if name.endswith('.html') and name[:-len('.html')] not in index.postings:
+                path = os.path.join(tag_dir, name)
+                for stale in (path, path + '.gz', path + '.br'):
+                    if os.path.exists(stale):
+                        os.remove(stale)
+                changed.append(path)
+        
+        page_manifest['tags'] = tags_key
+        return changed
+
+    def build_site(self, data: Dict[str, Any], jobs: int = 1) -> List[Dict[str, Any]]:
+        """Build every registered page present in data, optionally across processes"""
+        page_data = split_page_data(data)
+        
+        if jobs <= 1 or len(page_data) <= 1:
+            results = [self.build_one(name, subset) for name, subset in page_data.items()]
+        else:
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor(max_workers=min(jobs, len(page_data))) as pool:
+                futures = [
+                    pool.submit(_build_page_worker, self.base_dir, self.templates.directory,
+                                self.precompress, self.force, self.minify, name, subset)
+                    for name, subset in page_data.items()
+                ]
+                results = [future.result() for future in futures]
+            # Workers cannot share the manifest; fold their updates back in here
+            for result in results:
+                self.manifest.pages[result['page']] = result['manifest']
+                self.manifest.fragments.update(result['fragments'])
+                self.build_stats['rendered'] += result['rendered']
+                self.build_stats['reused'] += result['reused']
+        
+        self.manifest.save()
+        return results
+
+    def build_from_store(self, store, names: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """Build pages from a cms_store.EntryStore, every stored page by default"""
+        results = [self.build_one(name, store.page_data(name)) for name in names or store.pages()]
+        self.manifest.save()
+        return results
+
+    def build_images(self, jobs: Optional[int] = None) -> Dict[str, Any]:
+        """Write missing image variants (across `jobs` processes, default one per CPU)"""
+        return self.images.build(jobs, force=self.force)
+
+    def build_assets(self) -> Dict[str, Any]:
+        """Minify and fingerprint assets/js and assets/css, and update references to them in
+        the hand-written pages (pages the generator builds are rewritten as they are built)"""
+        built = tuple(PAGES[name].output for name in self.manifest.pages if name in PAGES)
+        return self.assets.build(self.precompress, force=self.force, exclude_pages=built)
+
+    def build_search_index(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Rebuild search/ from the searchable pages in data when their entries changed"""
+        from cms_search import SEARCH_DIR, write_index  # cms_search imports this module
+        return write_index(data, os.path.join(self.base_dir, SEARCH_DIR), force=self.force)
+
+    def page_file(self, spec: PageSpec, page: int) -> str:
+        """Output path of a numbered page: work.html, work-2.html, ..."""
+        if page == 1:
+            return os.path.join(self.base_dir, spec.output)
+        base, ext = os.path.splitext(spec.output)
+        return os.path.join(self.base_dir, f'{base}-{page}{ext}')
+
+    def pagination_html(self, spec: PageSpec, page: int, pages: int) -> str:
+        if pages <= 1:
+            return ''
+        link_template = self.templates['pagination_link']
         
-        # Use replace() rather than str.format(): the template's <style> block
-        # contains literal CSS braces that format() would misparse as fields.
-        return (self.templates['work']
-                .replace('{page_title}', title)
-                .replace('{page_description}', description)
-                .replace('{entries_content}', entries_html))
-
-    def update_from_json(self, json_file: str):
+        def href(number: int) -> str:
+            return spec.canonical_path if number == 1 else f'{spec.canonical_path.rstrip("/")}-{number}'
+        
+        return self.templates['pagination'].render({
+            'newer_html': link_template.render({'href': href(page - 1), 'label': '← Newer'}) if page > 1 else '',
+            'older_html': link_template.render({'href': href(page + 1), 'label': 'Older →'}) if page < pages else '',
+            'page': page,
+            'pages': pages
+        })
+
+    def stream_page(self, spec: PageSpec, data_file: str, page_size: int = 0) -> List[Dict[str, Any]]:
+        """Render a page straight from a data file, one entry in memory at a time.
+
+        Entries are rendered into one temporary body file per output page, so
+        settings may appear anywhere in the input. Each body is then wrapped in
+        the page shell and pagination links. page_size 0 means a single page.
+        No tag pages are written, so tag badges are left unlinked.
+        """
+        import filecmp
+        import shutil
+        import tempfile
+        from cms_stream import iter_data_file
+        
+        settings_data: Dict[str, Any] = {}
+        bodies: List[str] = []
+        counts: List[int] = []
+        # Bytes of each page body as rendered and as written (minified)
+        weights: List[List[int]] = []
+        body = None
+        self.link_tags = False
+        try:
+            for key, value in iter_data_file(data_file, spec.entries_key, spec.settings_key):
+                if key == spec.settings_key:
+                    settings_data[key] = value
+                    continue
+                if body is None or (page_size and counts[-1] == page_size):
+                    if body is not None:
+                        body.close()
+                    fd, body_path = tempfile.mkstemp(prefix='.cms_stream_', suffix='.html', dir=self.base_dir)
+                    body = open(fd, 'w', encoding='utf-8')
+                    bodies.append(body_path)
+                    counts.append(0)
+                    weights.append([0, 0])
+                raw_html = self.render_entry(spec, value)
+                entry_html = self.finish_html(raw_html)
+                body.write(entry_html)
+                counts[-1] += 1
+                weights[-1][0] += len(raw_html.encode('utf-8'))
+                weights[-1][1] += len(entry_html.encode('utf-8'))
+                self.build_stats['rendered'] += 1
+            if body is not None:
+                body.close()
+            
+            raw_prefix, raw_suffix = self.page_shell(spec, self.page_settings(spec, settings_data))
+            prefix, suffix = self.finish_html(raw_prefix), self.finish_html(raw_suffix)
+            shell_weight = self.assets.page_weight(raw_prefix + raw_suffix, prefix + suffix)
+            pages = max(1, len(bodies))
+            results = []
+            for page in range(1, pages + 1):
+                page_file = self.page_file(spec, page)
+                tmp_path = f'{page_file}.{os.getpid()}.tmp'
+                raw_pagination = self.pagination_html(spec, page, pages)
+                pagination = self.finish_html(raw_pagination)
+                with open(tmp_path, 'w', encoding='utf-8') as out:
+                    out.write(prefix)
+                    if bodies:
+                        with open(bodies[page - 1], 'r', encoding='utf-8') as src:
+                            shutil.copyfileobj(src, out)
+                    out.write(pagination)
+                    out.write(suffix)
+                body_weight = weights[page - 1] if weights else [0, 0]
+                
+                # Keep the old file (and its mtime) when nothing changed
+                written = not (os.path.exists(page_file) and filecmp.cmp(tmp_path, page_file, shallow=False))
+                if written:
+                    os.replace(tmp_path, page_file)
+                else:
+                    os.remove(tmp_path)
+                if self.precompress and (written or not os.path.exists(page_file + '.gz')):
+                    write_precompressed(page_file)
+                results.append({
+                    'page': spec.name,
+                    'file': page_file,
+                    'written': written,
+                    'files': [page_file] if written else [],
+                    'entries': counts[page - 1] if counts else 0,
+                    'bytes': [shell_weight[0] + len(raw_pagination.encode('utf-8')) + body_weight[0],
+                              shell_weight[1] + len(pagination.encode('utf-8')) + body_weight[1]]
+                })
+        finally:
+            self.link_tags = True
+            if body is not None and not body.closed:
+                body.close()
+            for body_path in bodies:
+                if os.path.exists(body_path):
+                    os.remove(body_path)
+        
+        # Drop pages left over from a previous run that had more entries
+        stale = pages + 1
+        while os.path.exists(self.page_file(spec, stale)):
+            for path in (self.page_file(spec, stale), self.page_file(spec, stale) + '.gz',
+                         self.page_file(spec, stale) + '.br'):
+                if os.path.exists(path):
+                    os.remove(path)
+            print(f"🗑️  Removed stale {self.page_file(spec, stale)}")
+            stale += 1
+        return results
+
+    def update_from_json(self, json_file: str, jobs: int = 1) -> List[Dict[str, Any]]:
         """Update HTML files from JSON data"""
         try:
             with open(json_file, 'r', encoding='utf-8') as f:
                 data = json.load(f)
             
-            # Generate work.html
-            if 'workEntries' in data or 'pageSettings' in data:
-                work_html = self.generate_work_html(data)
-                work_file = os.path.join(self.base_dir, 'work.html')
-                
-                with open(work_file, 'w', encoding='utf-8') as f:
-                    f.write(work_html)
-                print(f"✅ Updated {work_file}")
+            # Variants first: pages embed their srcsets
+            if self.resize_images:
+                print_image_result(self.build_images(jobs if jobs > 1 else None))
+            # Then assets: pages embed their fingerprinted names
+            if self.minify:
+                print_asset_result(self.build_assets())
+            
+            results = self.build_site(data, jobs)
+            for result in results:
+                if result['written']:
+                    print(f"✅ Updated {result['file']}")
+                else:
+                    print(f"⏭️  {result['file']} unchanged, skipped write")
+                if result['tag_files']:
+                    print(f"🏷️  Updated {len(result['tag_files'])} tag file(s) in "
+                          f"{os.path.dirname(result['tag_files'][0])}")
             
-            # TODO: Add other page types
+            print(f"🧩 Entries rendered: {self.build_stats['rendered']}, "
+                  f"reused: {self.build_stats['reused']}")
+            if self.minify:
+                print_page_weights(results, self.assets.pages)
+            
+            if self.search:
+                search = self.build_search_index(data)
+                if search['written']:
+                    print(f"🔎 Search index: {search['documents']} documents, {search['terms']} terms, "
+                          f"{search['shards']} shards, {search['bytes'] / 1024:.1f} KB")
+                else:
+                    print(f"⏭️  Search index unchanged ({search['documents']} documents)")
+            return results
             
         except Exception as e:
             print(f"❌ Error updating HTML files: {e}")
+            return []
 
     def backup_current_files(self):
-        """Create backup copies of current HTML files"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        backup_dir = os.path.join(self.base_dir, f"backup_{timestamp}")
-        
-        if not os.path.exists(backup_dir):
-            os.makedirs(backup_dir)
+        """Snapshot the current HTML files into the content-addressed backup store"""
+        from cms_backup import BackupStore, print_snapshot_result
         
-        files_to_backup = ['work.html']  # the only file this generator writes
+        print_snapshot_result(BackupStore(self.base_dir).snapshot())
+
+def print_image_result(result: Dict[str, Any]):
+    if not result['sources']:
+        return
+    for src, error in result['errors'].items():
+        print(f"⚠️  Skipped {src}: {error}")
+    if not result['pillow']:
+        print("⚠️  Pillow is not installed: images are used as-is (pip install Pillow for responsive variants)")
+    elif result['variants']:
+        print(f"🖼️  Images: {result['variants']} variant(s) written, {result['variant_bytes'] / 1024:.1f} KB "
+              f"from {result['source_bytes'] / 1024:.1f} KB of sources in {result['ms']:.0f} ms")
+    elif result['written']:
+        print(f"🖼️  Images: variant manifest updated ({result['sources']} source(s))")
+    else:
+        print(f"⏭️  Images unchanged ({result['sources']} source(s))")
+
+def print_asset_result(result: Dict[str, Any]):
+    for src, error in result['errors'].items():
+        print(f"⚠️  Skipped {src}: {error}")
+    if result['minified']:
+        print(f"📦 Assets: {result['minified']} file(s) minified and fingerprinted, "
+              f"{result['source_bytes'] / 1024:.1f} KB → {result['dist_bytes'] / 1024:.1f} KB "
+              f"in {result['ms']:.0f} ms")
+    elif result['sources']:
+        print(f"⏭️  Assets unchanged ({result['sources']} file(s))")
+    for path in result['pages']:
+        print(f"🔗 Updated asset references in {path}")
+
+def print_page_weights(results: List[Dict[str, Any]], static_pages: Dict[str, Dict[str, Any]]):
+    """Bytes of each page with its local JS and CSS, before and after minification"""
+    rows = [(os.path.relpath(result['file']), *result['bytes']) for result in results if result.get('bytes')]
+    # Static pages are top-level files; skip those this build just listed as generated pages
+    built = {os.path.basename(result['file']) for result in results}
+    # Hand-written pages only appear when they load an asset
+    rows += [(name, *page['bytes']) for name, page in sorted(static_pages.items())
+             if name not in built and page['bytes'][0] != page['bytes'][1]]
+    if not rows:
+        return
+    print("📦 Page weight (HTML + local JS/CSS)")
+    print(f"  {'page':<24}{'before KB':>11}{'after KB':>10}{'saved':>8}")
+    for name, before, after in rows:
+        saved = (1 - after / before) if before else 0
+        print(f"  {name:<24}{before / 1024:>11.1f}{after / 1024:>10.1f}{saved:>8.1%}")
+
+def print_build_timings(results: List[Dict[str, Any]], jobs: int, wall_ms: float):
+    """Per-page timing breakdown, slowest page first"""
+    print(f"\n📊 Build timings ({jobs} job{'s' if jobs != 1 else ''}, {wall_ms:.1f} ms wall)")
+    print(f"  {'page':<14}{'entries':>8}{'rendered':>10}{'reused':>8}"
+          f"{'render ms':>11}{'write ms':>10}{'total ms':>10}")
+    for result in sorted(results, key=lambda r: r['total_ms'], reverse=True):
+        print(f"  {result['page']:<14}{result['entries']:>8}{result['rendered']:>10}{result['reused']:>8}"
+              f"{result['render_ms']:>11.1f}{result['write_ms']:>10.1f}{result['total_ms']:>10.1f}")
 
-        for file in files_to_backup:
-            src = os.path.join(self.base_dir, file)
-            if os.path.exists(src):
-                dst = os.path.join(backup_dir, file)
-                shutil.copy2(src, dst)
-                print(f"📁 Backed up {file} to {backup_dir}")
+def serve_daemon(socket_path: str):
+    """Run generator commands sent by cms_client.py over a Unix socket.
 
-def main():
+    Each request is the client's working directory and argv joined by NUL;
+    the reply is the command's output followed by NUL and its exit status.
+    Commands run one at a time in this process, so every call after the
+    first skips interpreter startup and imports.
+    """
+    import contextlib
+    import io
+    import socketserver
+    
+    class CommandHandler(socketserver.StreamRequestHandler):
+        def handle(self):
+            request = self.rfile.read().decode('utf-8').split('\0')
+            cwd, argv = request[0], request[1:]
+            out = io.TextIOWrapper(self.wfile, encoding='utf-8', line_buffering=True, write_through=True)
+            status = 0
+            previous = os.getcwd()
+            try:
+                with contextlib.redirect_stdout(out), contextlib.redirect_stderr(out):
+                    if '--watch' in argv or '--daemon' in argv:
+                        print("❌ --watch and --daemon cannot run through the daemon; run cms_generator.py directly")
+                        status = 2
+                    else:
+                        try:
+                            os.chdir(cwd)
+                            main(argv)
+                        except SystemExit as e:
+                            status = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+                            if isinstance(e.code, str):
+                                print(e.code)
+                        except Exception as e:
+                            print(f"❌ {type(e).__name__}: {e}")
+                            status = 1
+                out.flush()
+                self.wfile.write(f'\0{status}'.encode('utf-8'))
+            except (BrokenPipeError, ConnectionResetError):
+                pass  # client went away; the command still ran to completion
+            finally:
+                out.detach()
+                os.chdir(previous)
+    
+    # A socket file left by a daemon that was killed would make bind() fail
+    if os.path.exists(socket_path):
+        import socket
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(socket_path)
+            print(f"❌ A generator daemon is already listening on {socket_path}")
+            sys.exit(1)
+        except (ConnectionRefusedError, FileNotFoundError):
+            os.remove(socket_path)
+        finally:
+            probe.close()
+    
+    server = socketserver.UnixStreamServer(socket_path, CommandHandler)
+    os.chmod(socket_path, 0o600)
+    print(f"🚀 Generator daemon listening on {socket_path} (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n🛑 Daemon stopped")
+    finally:
+        server.server_close()
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(socket_path)
+
+def main(argv: Optional[List[str]] = None):
     import argparse
     
     parser = argparse.ArgumentParser(description='Generate HTML files from CMS JSON data')
-    parser.add_argument('json_file', help='Path to the JSON data file')
-    parser.add_argument('--backup', action='store_true', help='Create backup before updating')
-    parser.add_argument('--base-dir', default='.', help='Base directory for HTML files')
+    parser.add_argument('--daemon', action='store_true',
+                        help='Stay resident and run commands sent by cms_client.py')
+    parser.add_argument('--socket', help='Unix socket for --daemon (default: $CMS_GENERATOR_SOCKET '
+                                         'or cms-generator-<uid>.sock in $XDG_RUNTIME_DIR or /tmp)')
+    subparsers = parser.add_subparsers(dest='command')
+    
+    def add_build_arguments(command_parser):
+        command_parser.add_argument('json_file', help='Path to the JSON data file')
+        command_parser.add_argument('--backup', action='store_true', help='Create backup before updating')
+        command_parser.add_argument('--base-dir', default='.', help='Base directory for HTML files')
+        command_parser.add_argument('--no-precompress', action='store_true',
+                                    help='Skip writing .gz/.br sidecars for generated pages')
+        command_parser.add_argument('--force', action='store_true',
+                                    help='Ignore the build manifest and re-render every entry')
+        command_parser.add_argument('--no-search', action='store_true',
+                                    help='Skip building the search index in search/')
+        command_parser.add_argument('--no-images', action='store_true',
+                                    help='Skip resizing images in assets/img into responsive variants')
+        command_parser.add_argument('--no-assets', action='store_true',
+                                    help='Skip minifying pages and fingerprinting assets/js and assets/css')
+        command_parser.add_argument('--fetch-feed', action='store_true',
+                                    help='Refresh feed.json from the Substack feed first (see cms_feed.py)')
+    
+    def add_watch_argument(command_parser):
+        command_parser.add_argument('--watch', action='store_true',
+                                    help='Keep running and rebuild affected pages when the JSON data '
+                                         'or a template changes')
+    
+    build_parser = subparsers.add_parser('build', help='Build the pages present in the JSON data (default)')
+    add_build_arguments(build_parser)
+    add_watch_argument(build_parser)
     
-    args = parser.parse_args()
+    build_all_parser = subparsers.add_parser(
+        'build-all', help='Build all pages concurrently and print a per-page timing breakdown')
+    add_build_arguments(build_all_parser)
+    add_watch_argument(build_all_parser)
+    build_all_parser.add_argument('--jobs', '-j', type=int, default=os.cpu_count() or 1,
+                                  help='Worker processes (default: number of CPUs)')
     
-    generator = HTMLGenerator(args.base_dir)
+    stream_parser = subparsers.add_parser(
+        'stream', help='Render one page from a large JSON / JSON Lines file with bounded memory')
+    add_build_arguments(stream_parser)
+    stream_parser.add_argument('--page', default='work', choices=sorted(PAGES),
+                               help='Page to render (default: work)')
+    stream_parser.add_argument('--page-size', type=int, default=0,
+                               help='Entries per output page, e.g. 500 gives work.html, work-2.html, ... '
+                                    '(default: 0, a single page)')
+    
+    # `cms_generator.py data.json` predates subcommands and still means `build`
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if argv and argv[0] not in subparsers.choices and argv[0] not in ('-h', '--help', '--daemon', '--socket'):
+        argv = ['build'] + argv
+    
+    args = parser.parse_args(argv)
+    if args.daemon:
+        from cms_client import SOCKET_PATH
+        serve_daemon(args.socket or SOCKET_PATH)
+        return
+    if args.command is None:
+        parser.print_help()
+        return
+    
+    generator = HTMLGenerator(args.base_dir, precompress=not args.no_precompress, force=args.force,
+                              search=not args.no_search, images=not args.no_images,
+                              assets=not args.no_assets)
     
     if args.backup:
         generator.backup_current_files()
     
-    generator.update_from_json(args.json_file)
+    if args.fetch_feed:
+        from cms_feed import FeedStore, print_feed_result  # cms_feed imports this module
+        store = FeedStore(args.base_dir)
+        try:
+            print_feed_result(store.refresh(force=args.force))
+        except (OSError, ValueError) as e:
+            # A stale feed is better than no build
+            print(f"⚠️  Keeping the previous {store.path}: {e}")
+    
+    if args.command == 'stream':
+        try:
+            results = generator.stream_page(PAGES[args.page], args.json_file, args.page_size)
+        except (OSError, ValueError) as e:
+            print(f"❌ Error streaming {args.json_file}: {e}")
+            sys.exit(1)
+        for result in results:
+            status = '✅ Updated' if result['written'] else '⏭️  Unchanged'
+            before, after = result['bytes']
+            print(f"{status} {result['file']} ({result['entries']} entries, "
+                  f"{before / 1024:.1f} KB → {after / 1024:.1f} KB)")
+        print(f"🧩 Entries rendered: {generator.build_stats['rendered']}")
+    elif args.command == 'build-all':
+        start = time.perf_counter()
+        results = generator.update_from_json(args.json_file, jobs=args.jobs)
+        print_build_timings(results, args.jobs, (time.perf_counter() - start) * 1000)
+    else:
+        generator.update_from_json(args.json_file)
+    
+    if getattr(args, 'watch', False):
+        from cms_watch import SiteWatcher
+        generator.force = False  # --force applies to the first build only
+        print(f"👀 Watching {args.json_file} and {generator.templates.directory} (Ctrl+C to stop)")
+        try:
+            SiteWatcher(generator, args.json_file).run()
+        except KeyboardInterrupt:
+            print("\n🛑 Stopped watching")
 
 if __name__ == '__main__':
     main()
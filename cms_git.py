@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+In-process git service for the CMS
+Commits exactly the files the CMS wrote with as few git invocations as possible
+"""
+
+import os
+import re
+import subprocess
+import time
+from datetime import datetime
+
+# Page files mapped to the commit subject used when they change
+PAGE_SUBJECTS = (
+    ('work.html', 'feat: update work log entries via CMS'),
+    ('projects.html', 'feat: update projects via CMS'),
+    ('publications.html', 'feat: update publications via CMS'),
+    ('photography.html', 'feat: update photography via CMS'),
+)
+COMMIT_HASH_RE = re.compile(r'^\[[^\]]*?([0-9a-f]{7,40})\]', re.MULTILINE)
+
+
+class GitError(Exception):
+    """A git command exited with a non-zero status"""
+
+    def __init__(self, args, returncode, stderr):
+        super().__init__(f"git {' '.join(args)} failed ({returncode}): {stderr.strip()}")
+        self.returncode = returncode
+        self.stderr = stderr
+
+
+def get_commit_message(files=None, messages=None):
+    """Generate a commit message from the changed files.
+
+    When several requested messages are merged into one commit, the subject
+    is derived from the files and the distinct messages become the body.
+    """
+    messages = list(dict.fromkeys(message for message in messages or () if message))
+    if len(messages) == 1:
+        return messages[0]
+
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
+    files = files or []
+    subject = f"chore: update content via CMS ({timestamp})"
+    for page, page_subject in PAGE_SUBJECTS:
+        if page in files:
+            subject = f"{page_subject} ({timestamp})"
+            break
+    if not messages:
+        return subject
+    return subject + '\n\n' + '\n'.join(f'- {message}' for message in messages)
+
+
+def parse_status(output):
+    """Parse `git status --porcelain=v2 --branch -z` into branch info and changed paths"""
+    status = {'branch': None, 'upstream': None, 'ahead': 0, 'behind': 0, 'changes': {}}
+    records = output.split('\0')
+    i = 0
+    while i < len(records):
+        record = records[i]
+        i += 1
+        if not record:
+            continue
+        if record.startswith('# branch.head '):
+            head = record[len('# branch.head '):]
+            status['branch'] = None if head == '(detached)' else head
+        elif record.startswith('# branch.upstream '):
+            status['upstream'] = record[len('# branch.upstream '):]
+        elif record.startswith('# branch.ab '):
+            ahead, behind = record[len('# branch.ab '):].split()
+            status['ahead'], status['behind'] = int(ahead), -int(behind)
+        elif record[0] == '1':
+            # 1 XY sub mH mI mW hH hI path
+            fields = record.split(' ', 8)
+            status['changes'][fields[8]] = fields[1]
+        elif record[0] == '2':
+            # 2 XY sub mH mI mW hH hI Xscore path, followed by the original path
+            fields = record.split(' ', 9)
+            status['changes'][fields[9]] = fields[1]
+            i += 1
+        elif record[0] == 'u':
+            fields = record.split(' ', 10)
+            status['changes'][fields[10]] = fields[1]
+        elif record[0] == '?':
+            status['changes'][record[2:]] = '??'
+    return status
+
+
+class GitService:
+    """Runs git for one repository and records how long each phase takes"""
+
+    def __init__(self, repo_dir='.', remote='origin'):
+        self.repo_dir = repo_dir
+        self.remote = remote
+        self.timings = {}
+
+    def run(self, phase, *args):
+        """Run git with an argv list (never a shell) and time it under `phase`"""
+        start = time.perf_counter()
+        try:
+            result = subprocess.run(['git', *args], cwd=self.repo_dir, capture_output=True, text=True)
+        finally:
+            self.timings[phase] = self.timings.get(phase, 0.0) + (time.perf_counter() - start) * 1000
+        if result.returncode != 0:
+            raise GitError(args, result.returncode, result.stderr or result.stdout)
+        return result.stdout
+
+    def status(self):
+        """Branch, upstream, ahead/behind and changed paths from a single git call"""
+        return parse_status(self.run('status', 'status', '--porcelain=v2', '--branch',
+                                     '--untracked-files=all', '-z'))
+
+    def commit(self, message=None, paths=None, push=True):
+        """Stage and commit paths (every changed file when None), then push.
+
+        Returns a result dict with success, commit, branch, files, message,
+        error, pushed and per-phase timings in milliseconds.
+        """
+        self.timings = {}
+        result = {'success': False, 'commit': None, 'branch': None, 'files': [],
+                  'message': message, 'error': '', 'pushed': False, 'timings_ms': self.timings}
+        try:
+            status = self.status()
+            result['branch'] = status['branch']
+            changes = status['changes']
+            if paths is None:
+                files = sorted(changes)
+            else:
+                wanted = {os.path.normpath(path) for path in paths}
+                files = sorted(path for path in changes if os.path.normpath(path) in wanted)
+            result['files'] = files
+            if not files:
+                result['success'] = True
+                return result
+
+            if not message:
+                message = result['message'] = get_commit_message(files)
+            self.run('add', 'add', '--', *files)
+            try:
+                # The pathspec keeps anything else already in the index out of this commit
+                output = self.run('commit', 'commit', '-m', message, '--', *files)
+            except GitError:
+                # Don't leave the files staged for whatever the user commits next
+                try:
+                    self.run('add', 'reset', '-q', '--', *files)
+                except GitError:
+                    pass
+                raise
+            match = COMMIT_HASH_RE.search(output)
+            result['commit'] = match.group(1) if match else None
+
+            if push:
+                if not status['branch']:
+                    result['error'] = 'Detached HEAD; commit was not pushed'
+                    return result
+                self.run('push', 'push', self.remote, status['branch'])
+                result['pushed'] = True
+            result['success'] = True
+        except (GitError, OSError) as e:
+            result['error'] = str(e)
+        finally:
+            self.timings['total'] = sum(ms for phase, ms in self.timings.items() if phase != 'total')
+        return result
@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+"""
+Responsive image variants for the site
+Resizes the images in assets/img to several widths and formats for srcset markup
+"""
+
+import hashlib
+import io
+import json
+import os
+import re
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from cms_generator import atomic_write_bytes, content_hash
+
+IMAGE_DIR = 'assets/img'
+VARIANT_DIR = IMAGE_DIR + '/variants'
+MANIFEST_NAME = 'images.json'
+# Per-checkout size and mtime of each source, so unchanged sources are not hashed; not committed
+STAT_CACHE_FILE = '.cms_images.json'
+PIPELINE_VERSION = 1
+SOURCE_EXTENSIONS = ('.jpg', '.jpeg', '.png')
+# Widths cover an 80 px avatar at 1x-3x up to full-width photos on large screens
+VARIANT_WIDTHS = (80, 160, 240, 320, 480, 640, 960, 1280, 1920)
+# Browsers use the first <source> type they support, so the smallest format comes first
+MODERN_FORMATS = ('avif', 'webp')
+FORMAT_EXTENSIONS = {'jpeg': 'jpg', 'png': 'png', 'webp': 'webp', 'avif': 'avif'}
+FORMAT_TYPES = {'jpeg': 'image/jpeg', 'png': 'image/png', 'webp': 'image/webp', 'avif': 'image/avif'}
+SAVE_OPTIONS = {
+    'jpeg': {'quality': 82, 'optimize': True, 'progressive': True},
+    'png': {'optimize': True},
+    'webp': {'quality': 80, 'method': 6},
+    'avif': {'quality': 55, 'speed': 6}
+}
+# EXIF orientations that rotate the image by 90 degrees
+TRANSPOSED_ORIENTATIONS = (5, 6, 7, 8)
+VARIANT_RE = re.compile(r'.+-[0-9a-f]{10}-\d+\.(jpg|png|webp|avif)$')
+
+
+def has_pillow() -> bool:
+    try:
+        import PIL  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def available_formats() -> List[str]:
+    """Modern formats the installed Pillow can encode, best first; empty without Pillow"""
+    try:
+        from PIL import features
+    except ImportError:
+        return []
+    supported = {name for name in MODERN_FORMATS if features.check(name)}
+    if 'avif' not in supported:
+        try:
+            import pillow_avif  # noqa: F401  registers the AVIF plugin on Pillow before 11.2
+            supported.add('avif')
+        except ImportError:
+            pass
+    return [name for name in MODERN_FORMATS if name in supported]
+
+
+def variant_widths(source_width: int) -> List[int]:
+    """VARIANT_WIDTHS up to the source width, plus the source width itself when it is smaller
+    than the largest variant (never upscale)"""
+    widths = [width for width in VARIANT_WIDTHS if width <= source_width]
+    if source_width < VARIANT_WIDTHS[-1] and source_width not in widths:
+        widths.append(source_width)
+    return widths
+
+
+def variant_key(digest: str) -> str:
+    """The hash in a source's variant names: its content plus everything that affects encoding"""
+    return content_hash([PIPELINE_VERSION, SAVE_OPTIONS, digest])[:10]
+
+
+def render_variant(source: str, destination: str, width: int, image_format: str) -> int:
+    """Process-pool entry point: write one resized variant and return its size in bytes"""
+    from PIL import Image, ImageOps
+
+    with Image.open(source) as image:
+        # JPEGs decode straight at 1/2, 1/4 or 1/8 scale when that is still large enough
+        image.draft('RGB', (width, width))
+        image = ImageOps.exif_transpose(image)
+        has_alpha = 'A' in image.getbands() or 'transparency' in image.info
+        mode = 'RGBA' if has_alpha and image_format != 'jpeg' else 'RGB'
+        if image.mode != mode:
+            image = image.convert(mode)
+        height = max(1, round(image.height * width / image.width))
+        resized = image.resize((width, height), Image.Resampling.LANCZOS, reducing_gap=3.0)
+    buffer = io.BytesIO()
+    resized.save(buffer, image_format.upper(), **SAVE_OPTIONS[image_format])
+    atomic_write_bytes(destination, buffer.getvalue())
+    return buffer.tell()
+
+
+class ImagePipeline:
+    """Variants of every image in assets/img, and the manifest that describes them.
+
+    Variant names carry a hash of the source bytes and encoder settings
+    (``pavan-<hash>-320.webp``), so they never change once written and can be
+    cached forever. ``variants/images.json`` maps each source to its content
+    hash, dimensions and variants, and holds nothing specific to a checkout.
+    Sizes and mtimes live in the untracked ``.cms_images.json``: a source
+    whose size and mtime match skips hashing, and one whose hash matches the
+    manifest is skipped.
+    """
+
+    def __init__(self, base_dir: str = '.'):
+        self.base_dir = base_dir
+        self.source_dir = os.path.join(base_dir, IMAGE_DIR)
+        self.variant_dir = os.path.join(base_dir, VARIANT_DIR)
+        self.manifest_path = os.path.join(self.variant_dir, MANIFEST_NAME)
+        self.stat_cache_path = os.path.join(base_dir, STAT_CACHE_FILE)
+        self.images: Dict[str, Dict[str, Any]] = {}
+        self._rewrite = False
+        self.stats: Dict[str, Dict[str, Any]] = {}
+        self._saved_stats: Dict[str, Dict[str, Any]] = {}
+        self.load()
+
+    def load(self):
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+            self.images = manifest['images'] if manifest.get('version') == PIPELINE_VERSION else {}
+            # Older manifests kept each checkout's size and mtime here; drop them on the next build
+            for record in self.images.values():
+                if record.pop('mtime_ns', None) is not None:
+                    record.pop('size', None)
+                    self._rewrite = True
+        except (OSError, ValueError, KeyError):
+            self.images = {}
+        try:
+            with open(self.stat_cache_path, 'r', encoding='utf-8') as f:
+                self.stats = json.load(f)
+        except (OSError, ValueError):
+            self.stats = {}
+        self._saved_stats = dict(self.stats)
+
+    def _source_hash(self, src: str, path: str, st: os.stat_result) -> str:
+        """SHA-256 of a source, read again only when its size or mtime changed"""
+        cached = self.stats.get(src)
+        if cached and cached['size'] == st.st_size and cached['mtime_ns'] == st.st_mtime_ns:
+            return cached['sha256']
+        with open(path, 'rb') as f:
+            digest = hashlib.sha256(f.read()).hexdigest()
+        self.stats[src] = {'size': st.st_size, 'mtime_ns': st.st_mtime_ns, 'sha256': digest}
+        return digest
+
+    def key(self) -> str:
+        """Hash of every variant list; changes whenever the markup would"""
+        return content_hash(self.images)
+
+    def sources(self) -> List[str]:
+        """Site-relative paths of the source images, e.g. assets/img/pavan.jpg"""
+        try:
+            names = sorted(os.listdir(self.source_dir))
+        except OSError:
+            return []
+        return [f'{IMAGE_DIR}/{name}' for name in names
+                if name.lower().endswith(SOURCE_EXTENSIONS)
+                and os.path.isfile(os.path.join(self.source_dir, name))]
+
+    def lookup(self, src: str) -> Optional[Dict[str, Any]]:
+        """The manifest record for an image URL or path, or None if it has no variants"""
+        return self.images.get(src.lstrip('/').split('?')[0])
+
+    @staticmethod
+    def srcset(record: Dict[str, Any], image_format: str) -> str:
+        return ', '.join(f'/{VARIANT_DIR}/{name} {width}w'
+                         for width, _, name in record['formats'][image_format])
+
+    @staticmethod
+    def fallback_variant(record: Dict[str, Any], width: Optional[int] = None) -> Tuple[int, int, str]:
+        """The fallback-format variant for browsers without srcset: the smallest at
+        least `width` wide, or the middle one"""
+        variants = record['formats'][record['fallback']]
+        if width:
+            return next((v for v in variants if v[0] >= width), variants[-1])
+        return variants[len(variants) // 2]
+
+    def _describe(self, path: str, digest: str) -> Dict[str, Any]:
+        """Read a source's dimensions without decoding it"""
+        from PIL import Image
+
+        with Image.open(path) as image:
+            width, height = image.size
+            # Opaque PNG photos get a JPEG fallback: a fraction of the size
+            has_alpha = 'A' in image.getbands() or 'transparency' in image.info
+            image_format = 'png' if has_alpha else 'jpeg'
+            if image.getexif().get(0x0112) in TRANSPOSED_ORIENTATIONS:
+                width, height = height, width
+        return {
+            'sha256': digest,
+            'key': variant_key(digest),
+            'width': width,
+            'height': height,
+            'fallback': image_format
+        }
+
+    @staticmethod
+    def _outcome(call, *args) -> Tuple[int, Optional[str]]:
+        """(bytes written, None) or (0, error message) for a variant render"""
+        try:
+            return call(*args), None
+        except (OSError, ValueError) as e:
+            return 0, str(e)
+
+    def _files(self, record: Dict[str, Any]) -> List[str]:
+        return [os.path.join(self.variant_dir, name)
+                for variants in record['formats'].values() for _, _, name in variants]
+
+    def _complete(self, record: Dict[str, Any], formats: List[str]) -> bool:
+        """Whether a record has every wanted format and all its files still exist"""
+        return (set(record['formats']) == set(formats + [record['fallback']])
+                and all(os.path.exists(file) for file in self._files(record)))
+
+    def build(self, jobs: Optional[int] = None, force: bool = False) -> Dict[str, Any]:
+        """Write missing variants for every source, then the manifest, then drop stale variants.
+
+        Shaped like a page build result ('page', 'file', 'written', 'files')
+        so watchers and the server can publish it alongside pages.
+        """
+        start = time.perf_counter()
+        sources = self.sources()
+        result = {'page': 'images', 'file': self.manifest_path, 'written': False, 'files': [],
+                  'sources': len(sources), 'variants': 0, 'source_bytes': 0, 'variant_bytes': 0,
+                  'pillow': has_pillow(), 'errors': {}}
+        if not sources or not result['pillow']:
+            return result
+        formats = available_formats()
+
+        images: Dict[str, Dict[str, Any]] = {}
+        tasks: List[Tuple[str, str, str, int, str]] = []
+        for src in sources:
+            path = os.path.join(self.base_dir, src)
+            previous = self.images.get(src)
+            try:
+                st = os.stat(path)
+                digest = self._source_hash(src, path, st)
+                if (not force and previous is not None and previous['key'] == variant_key(digest)
+                        and self._complete(previous, formats)):
+                    images[src] = previous
+                    continue
+                record = self._describe(path, digest)
+            except (OSError, ValueError) as e:
+                # Often a file still being written; its next change triggers another build
+                result['errors'][src] = str(e)
+                if previous is not None:
+                    images[src] = previous
+                continue
+            stem = os.path.splitext(os.path.basename(src))[0]
+            record['formats'] = {}
+            for image_format in formats + [record['fallback']]:
+                variants = record['formats'][image_format] = []
+                for width in variant_widths(record['width']):
+                    name = f"{stem}-{record['key']}-{width}.{FORMAT_EXTENSIONS[image_format]}"
+                    height = max(1, round(record['height'] * width / record['width']))
+                    variants.append([width, height, name])
+                    destination = os.path.join(self.variant_dir, name)
+                    if force or not os.path.exists(destination):
+                        tasks.append((src, path, destination, width, image_format))
+            images[src] = record
+            result['source_bytes'] += st.st_size
+
+        if tasks:
+            os.makedirs(self.variant_dir, exist_ok=True)
+            jobs = min(jobs or os.cpu_count() or 1, len(tasks))
+            if jobs > 1:
+                from concurrent.futures import ProcessPoolExecutor
+                with ProcessPoolExecutor(max_workers=jobs) as pool:
+                    outcomes = [pool.submit(render_variant, *task[1:]) for task in tasks]
+                    outcomes = [self._outcome(future.result) for future in outcomes]
+            else:
+                outcomes = [self._outcome(render_variant, *task[1:]) for task in tasks]
+            for (src, _, destination, _, _), (size, error) in zip(tasks, outcomes):
+                if error:
+                    result['errors'][src] = error
+                    continue
+                result['files'].append(destination)
+                result['variants'] += 1
+                result['variant_bytes'] += size
+            # A source with any failed variant keeps its previous variants, if it had any
+            for src in {task[0] for task in tasks} & result['errors'].keys():
+                if src in self.images:
+                    images[src] = self.images[src]
+                else:
+                    del images[src]
+
+        if images != self.images or result['variants'] or self._rewrite:
+            os.makedirs(self.variant_dir, exist_ok=True)
+            body = json.dumps({'version': PIPELINE_VERSION, 'images': images}, indent=1) + '\n'
+            atomic_write_bytes(self.manifest_path, body.encode('utf-8'))
+            result['files'].append(self.manifest_path)
+            result['written'] = True
+            self.images = images
+            self._rewrite = False
+        stats = {src: self.stats[src] for src in sources if src in self.stats}
+        if stats != self._saved_stats:
+            atomic_write_bytes(self.stat_cache_path, json.dumps(stats, indent=1).encode('utf-8'))
+            self._saved_stats = stats
+        self.stats = stats
+
+        # Variants of replaced or deleted sources
+        current = {os.path.basename(file) for record in images.values() for file in self._files(record)}
+        if os.path.isdir(self.variant_dir):
+            for name in sorted(os.listdir(self.variant_dir)):
+                if VARIANT_RE.match(name) and name not in current:
+                    os.remove(os.path.join(self.variant_dir, name))
+                    result['files'].append(os.path.join(self.variant_dir, name))
+                    result['written'] = True
+        result['ms'] = (time.perf_counter() - start) * 1000
+        return result
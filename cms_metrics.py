@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Request metrics and a sampling profiler for the CMS server
+Rendered as Prometheus text at /metrics and as JSON at /stats
+"""
+
+import bisect
+import collections
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+# Histogram bucket upper bounds in seconds
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# Recent latencies kept per endpoint for exact percentiles in /stats
+LATENCY_WINDOW = 2048
+PROFILE_INTERVAL = 0.005
+MAX_PROFILE_SECONDS = 60
+# Threads whose innermost frame is in one of these are waiting, not working
+IDLE_MODULES = ('threading.py', 'queue.py', 'selectors.py', 'socketserver.py', 'socket.py', 'thread.py')
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+
+def endpoint_label(path):
+    """Collapse a request path into a bounded set of endpoint names"""
+    path = path.split('?')[0]
+    if path.startswith('/api/entries/'):
+        return '/api/entries/:hash'
+    if path.startswith('/git-jobs/'):
+        return '/git-jobs/:id'
+    if path in ('/api/entries', '/api/search', '/save-file', '/git-commit', '/stats', '/metrics',
+                '/events', '/debug/profile'):
+        return path
+    return 'static'
+
+
+class EndpointStats:
+    def __init__(self):
+        self.requests = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.seconds = 0.0
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.statuses = collections.Counter()
+        self.recent = collections.deque(maxlen=LATENCY_WINDOW)
+
+
+class ServerMetrics:
+    """Thread-safe request counters, latency histograms and phase timers"""
+
+    def __init__(self, access_log=None):
+        self._lock = threading.Lock()
+        self.started = time.time()
+        self.endpoints = collections.defaultdict(EndpointStats)
+        self.phases = collections.defaultdict(lambda: {'count': 0, 'seconds': 0.0})
+        self.access_log = access_log
+
+    def observe_request(self, method, path, status, seconds, bytes_in, bytes_out, client=None):
+        endpoint = endpoint_label(path)
+        with self._lock:
+            stats = self.endpoints[(method, endpoint)]
+            stats.requests += 1
+            stats.bytes_in += bytes_in
+            stats.bytes_out += bytes_out
+            stats.seconds += seconds
+            stats.buckets[bisect.bisect_left(LATENCY_BUCKETS, seconds)] += 1
+            stats.statuses[status] += 1
+            stats.recent.append(seconds)
+        if self.access_log is not None:
+            record = {
+                'ts': round(time.time(), 3), 'client': client, 'method': method, 'path': path,
+                'endpoint': endpoint, 'status': status, 'ms': round(seconds * 1000, 3),
+                'bytes_in': bytes_in, 'bytes_out': bytes_out
+            }
+            line = json.dumps(record) + '\n'
+            with self._lock:
+                self.access_log.write(line)
+                self.access_log.flush()
+
+    def observe_phase(self, phase, seconds):
+        """Add time spent in a phase such as file_io or git"""
+        with self._lock:
+            counters = self.phases[phase]
+            counters['count'] += 1
+            counters['seconds'] += seconds
+
+    @contextmanager
+    def phase(self, phase):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe_phase(phase, time.perf_counter() - start)
+
+    def stats(self):
+        with self._lock:
+            endpoints = []
+            for (method, endpoint), stats in sorted(self.endpoints.items()):
+                recent = sorted(stats.recent)
+                endpoints.append({
+                    'method': method,
+                    'endpoint': endpoint,
+                    'requests': stats.requests,
+                    'bytes_in': stats.bytes_in,
+                    'bytes_out': stats.bytes_out,
+                    'statuses': {str(status): count for status, count in sorted(stats.statuses.items())},
+                    'mean_ms': stats.seconds / stats.requests * 1000 if stats.requests else 0.0,
+                    'p50_ms': percentile(recent, 0.50) * 1000,
+                    'p95_ms': percentile(recent, 0.95) * 1000,
+                    'p99_ms': percentile(recent, 0.99) * 1000
+                })
+            phases = {phase: {'count': counters['count'], 'ms': counters['seconds'] * 1000}
+                      for phase, counters in sorted(self.phases.items())}
+            return {'uptime_seconds': time.time() - self.started, 'endpoints': endpoints, 'phases': phases}
+
+    def prometheus(self, cache_stats=None):
+        """Render every metric in the Prometheus text exposition format"""
+        lines = [
+            '# HELP cms_uptime_seconds Seconds since the server started',
+            '# TYPE cms_uptime_seconds gauge',
+            f'cms_uptime_seconds {time.time() - self.started:.3f}',
+            '# HELP cms_requests_total Requests by method, endpoint and status',
+            '# TYPE cms_requests_total counter',
+        ]
+        with self._lock:
+            endpoints = sorted(self.endpoints.items())
+            for (method, endpoint), stats in endpoints:
+                for status, count in sorted(stats.statuses.items()):
+                    lines.append(f'cms_requests_total{{method="{method}",endpoint="{endpoint}",'
+                                 f'status="{status}"}} {count}')
+
+            lines += ['# HELP cms_request_duration_seconds Request latency',
+                      '# TYPE cms_request_duration_seconds histogram']
+            for (method, endpoint), stats in endpoints:
+                labels = f'method="{method}",endpoint="{endpoint}"'
+                cumulative = 0
+                for bound, count in zip(LATENCY_BUCKETS + (float('inf'),), stats.buckets):
+                    cumulative += count
+                    le = '+Inf' if bound == float('inf') else repr(bound)
+                    lines.append(f'cms_request_duration_seconds_bucket{{{labels},le="{le}"}} {cumulative}')
+                lines.append(f'cms_request_duration_seconds_sum{{{labels}}} {stats.seconds:.6f}')
+                lines.append(f'cms_request_duration_seconds_count{{{labels}}} {stats.requests}')
+
+            for name, attribute, help_text in (('cms_request_bytes_total', 'bytes_in', 'Request body bytes'),
+                                               ('cms_response_bytes_total', 'bytes_out', 'Response bytes sent')):
+                lines += [f'# HELP {name} {help_text}', f'# TYPE {name} counter']
+                for (method, endpoint), stats in endpoints:
+                    lines.append(f'{name}{{method="{method}",endpoint="{endpoint}"}} {getattr(stats, attribute)}')
+
+            lines += ['# HELP cms_phase_seconds_total Time spent in file I/O, git and page builds',
+                      '# TYPE cms_phase_seconds_total counter']
+            for phase, counters in sorted(self.phases.items()):
+                lines.append(f'cms_phase_seconds_total{{phase="{phase}"}} {counters["seconds"]:.6f}')
+            lines += ['# TYPE cms_phase_operations_total counter']
+            for phase, counters in sorted(self.phases.items()):
+                lines.append(f'cms_phase_operations_total{{phase="{phase}"}} {counters["count"]}')
+
+        if cache_stats:
+            lines += ['# HELP cms_static_cache_lookups_total Static file cache lookups',
+                      '# TYPE cms_static_cache_lookups_total counter',
+                      f'cms_static_cache_lookups_total{{result="hit"}} {cache_stats["hits"]}',
+                      f'cms_static_cache_lookups_total{{result="miss"}} {cache_stats["misses"]}',
+                      '# TYPE cms_static_cache_hit_ratio gauge',
+                      f'cms_static_cache_hit_ratio {cache_stats["hit_rate"]:.6f}',
+                      '# TYPE cms_static_cache_bytes gauge',
+                      f'cms_static_cache_bytes {cache_stats["bytes"]}']
+        return '\n'.join(lines) + '\n'
+
+
+def sample_profile(seconds, interval=PROFILE_INTERVAL, top=25):
+    """Sample every other thread's stack for `seconds` and return the hottest functions.
+
+    A sampling profiler sees all worker threads at once, unlike cProfile, which
+    only follows the thread that enabled it. Idle threads are not counted.
+    """
+    own = threading.get_ident()
+    names = {thread.ident: thread.name for thread in threading.enumerate()}
+    self_counts = collections.Counter()
+    total_counts = collections.Counter()
+    thread_counts = collections.Counter()
+    samples = 0
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        for ident, frame in sys._current_frames().items():
+            if ident == own or os.path.basename(frame.f_code.co_filename) in IDLE_MODULES:
+                continue
+            samples += 1
+            thread_counts[names.get(ident, str(ident))] += 1
+            leaf = True
+            seen = set()
+            while frame is not None:
+                code = frame.f_code
+                key = f'{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})'
+                if leaf:
+                    self_counts[key] += 1
+                    leaf = False
+                if key not in seen:
+                    total_counts[key] += 1
+                    seen.add(key)
+                frame = frame.f_back
+        time.sleep(interval)
+
+    def ranked(counter):
+        return [{'function': key, 'samples': count, 'percent': count * 100 / samples}
+                for key, count in counter.most_common(top)]
+
+    return {
+        'seconds': seconds,
+        'interval_ms': interval * 1000,
+        'busy_samples': samples,
+        'threads': dict(thread_counts.most_common()),
+        'self': ranked(self_counts) if samples else [],
+        'cumulative': ranked(total_counts) if samples else []
+    }
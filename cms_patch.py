@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Line-based patches for /save-file delta saves
+Applies an ops list or a unified diff to the previous version of a file
+"""
+
+import re
+from typing import Any, Dict, List
+
+HUNK_RE = re.compile(r'^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@')
+
+
+class PatchError(ValueError):
+    """A patch is malformed or does not match the base text"""
+
+
+def apply_ops(text: str, ops: List[Dict[str, Any]]) -> str:
+    """Apply replace ops to text split on newlines.
+
+    Each op is {"start": i, "end": j, "lines": [...]} and replaces base lines
+    [i, j) (0-based). Ops refer to the base text, must be sorted and must not
+    overlap; an insert has start == end.
+    """
+    lines = text.split('\n')
+    previous_end = 0
+    for op in ops:
+        try:
+            start, end, new_lines = int(op['start']), int(op['end']), op['lines']
+        except (KeyError, TypeError, ValueError) as e:
+            raise PatchError(f"Malformed op {op!r}") from e
+        if not isinstance(new_lines, list) or not all(isinstance(line, str) for line in new_lines):
+            raise PatchError("Op lines must be a list of strings")
+        if not previous_end <= start <= end <= len(lines):
+            raise PatchError(f"Op range {start}-{end} is out of order or past the end of the file")
+        previous_end = end
+
+    for op in reversed(ops):
+        lines[int(op['start']):int(op['end'])] = op['lines']
+    return '\n'.join(lines)
+
+
+def apply_unified_diff(text: str, diff: str) -> str:
+    """Apply a unified diff (as produced by diff -u or difflib) to text"""
+    lines = text.split('\n')
+    result: List[str] = []
+    position = 0
+    diff_lines = diff.split('\n')
+    i = 0
+    while i < len(diff_lines):
+        match = HUNK_RE.match(diff_lines[i])
+        i += 1
+        if not match:
+            continue  # ---/+++ headers and anything before the first hunk
+        old_start = int(match.group(1))
+        # A zero-length hunk's start line is the line *before* the change
+        hunk_start = old_start - 1 if match.group(2) != '0' else old_start
+        if hunk_start < position:
+            raise PatchError(f"Overlapping hunk at line {old_start}")
+        result.extend(lines[position:hunk_start])
+        position = hunk_start
+
+        while i < len(diff_lines) and not diff_lines[i].startswith('@@'):
+            line = diff_lines[i]
+            i += 1
+            if not line:
+                # Trailing newline of the diff itself, or an empty context line from a lax tool
+                if i == len(diff_lines):
+                    break
+                line = ' '
+            tag, body = line[0], line[1:]
+            if tag == '\\':
+                continue  # "\ No newline at end of file"
+            if tag in ' -':
+                if position >= len(lines) or lines[position] != body:
+                    raise PatchError(f"Hunk does not match the base text at line {position + 1}")
+                position += 1
+                if tag == ' ':
+                    result.append(body)
+            elif tag == '+':
+                result.append(body)
+            else:
+                raise PatchError(f"Unexpected diff line {line[:40]!r}")
+
+    result.extend(lines[position:])
+    return '\n'.join(result)
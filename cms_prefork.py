@@ -0,0 +1,358 @@
+#!/usr/bin/env python3
+"""
+Pre-fork process management for cms_server.py
+Runs several server processes on one port and relays cache invalidations between them
+"""
+
+import json
+import os
+import selectors
+import shutil
+import signal
+import socket
+import sys
+import tempfile
+import threading
+import time
+import traceback
+from typing import Any, Callable, Dict, Optional, Tuple
+
+# Datagrams between the master and a worker; a changed-files message for a full rebuild fits easily
+MAX_MESSAGE = 256 * 1024
+# A worker that dies sooner than this after starting counts as a crash loop and is restarted with backoff
+MIN_LIFETIME = 5.0
+RESPAWN_DELAY = 0.5
+MAX_RESPAWN_DELAY = 30.0
+READY_TIMEOUT = 15.0
+GRACEFUL_TIMEOUT = 30.0
+ORPHAN_CHECK_INTERVAL = 1.0
+
+
+def reuse_port_supported() -> bool:
+    return hasattr(socket, 'SO_REUSEPORT') and hasattr(os, 'fork')
+
+
+class ProcessLock:
+    """A lock that one thread in one process holds at a time.
+
+    A thread lock for the threads of this process plus flock() on `path` for
+    the other processes. flock() locks belong to an open file, which forked
+    children share, so create it in the process that uses it, never before
+    fork().
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+
+    def __enter__(self):
+        import fcntl
+
+        self._lock.acquire()
+        try:
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+        except OSError:
+            self._lock.release()
+            raise
+        return self
+
+    def __exit__(self, *exc_info):
+        import fcntl
+
+        fcntl.flock(self._fd, fcntl.LOCK_UN)
+        self._lock.release()
+
+
+class PeerLink:
+    """A worker's channel to its sibling processes, relayed by the master.
+
+    publish() sends a JSON message of a given kind to every other worker;
+    subscribe() registers the handler that runs, on the link's reader thread,
+    for each message of a kind received. A link whose master has gone away
+    delivers one 'stop' message so the worker can shut down.
+    """
+
+    def __init__(self, sock: socket.socket, index: int, master_pid: int):
+        self.sock = sock
+        self.index = index
+        self.master_pid = master_pid
+        self.handlers: Dict[str, Callable[[Dict[str, Any]], None]] = {}
+        self._thread: Optional[threading.Thread] = None
+
+    def subscribe(self, kind: str, handler: Callable[[Dict[str, Any]], None]):
+        self.handlers[kind] = handler
+
+    def publish(self, kind: str, payload: Optional[Dict[str, Any]] = None):
+        message = json.dumps(dict(payload or {}, kind=kind)).encode('utf-8')
+        if len(message) > MAX_MESSAGE:
+            print(f"⚠️  Peer message '{kind}' is {len(message)} bytes, over {MAX_MESSAGE}; not sent")
+            return
+        try:
+            self.sock.send(message)
+        except OSError as e:
+            print(f"⚠️  Could not reach the other server processes: {e}")
+
+    def start(self) -> threading.Thread:
+        self._thread = threading.Thread(target=self._listen, name='cms-peers', daemon=True)
+        self._thread.start()
+        return self._thread
+
+    def _dispatch(self, message: Dict[str, Any]):
+        handler = self.handlers.get(message.get('kind'))
+        if handler is None:
+            return
+        try:
+            handler(message)
+        except Exception:
+            traceback.print_exc()
+
+    def _listen(self):
+        self.sock.settimeout(ORPHAN_CHECK_INTERVAL)
+        while True:
+            try:
+                data = self.sock.recv(MAX_MESSAGE)
+            except socket.timeout:
+                if os.getppid() != self.master_pid:
+                    self._dispatch({'kind': 'stop'})
+                    return
+                continue
+            except OSError:
+                return
+            try:
+                message = json.loads(data)
+            except ValueError:
+                continue
+            self._dispatch(message)
+
+
+class WorkerProcess:
+    def __init__(self, pid: int, slot: int, channel: socket.socket, replaces: Optional[int] = None):
+        self.pid = pid
+        self.slot = slot
+        self.channel = channel
+        self.replaces = replaces
+        self.started = time.monotonic()
+        self.ready = False
+        self.retiring = False
+
+
+class PreforkMaster:
+    """Keeps `processes` forked copies of a server running on one port.
+
+    Every worker binds its own listening socket with SO_REUSEPORT, so the
+    kernel spreads new connections across them and one worker can be
+    replaced while the rest keep serving. The master holds the port with a
+    bound, non-listening socket, which also resolves port 0 before forking,
+    and never accepts connections itself. It:
+
+    - relays PeerLink messages from each worker to all the others;
+    - replaces a worker that exits, backing off when one keeps crashing;
+    - on SIGHUP starts a fresh set of workers and stops each old one
+      (SIGTERM, so it finishes its in-flight requests) once its replacement
+      reports ready;
+    - on SIGTERM or Ctrl+C stops every worker gracefully and exits.
+
+    run_worker(index, link, lock_dir) runs in each child and returns when the
+    worker has stopped. lock_dir is a private directory for ProcessLock files.
+    """
+
+    def __init__(self, processes: int, address: Tuple[str, int],
+                 run_worker: Callable[[int, PeerLink, str], None]):
+        self.processes = processes
+        self.run_worker = run_worker
+        self.reserved = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.reserved.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.reserved.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        self.reserved.bind(address)
+        self.address = self.reserved.getsockname()[:2]
+        self.lock_dir = tempfile.mkdtemp(prefix='cms-prefork-')
+        self.workers: Dict[int, WorkerProcess] = {}
+        self.slots: Dict[int, int] = {}
+        self.failures: Dict[int, int] = {}
+        self.respawn_at: Dict[int, float] = {}
+        self.restarts = 0
+        self.stopping = False
+        self._stop_requested = False
+        self._stop_deadline = 0.0
+        self._restart_requested = False
+        self._selector = selectors.DefaultSelector()
+        self._wakeup_r, self._wakeup_w = socket.socketpair()
+
+    @property
+    def port(self) -> int:
+        return self.address[1]
+
+    def spawn(self, slot: int, replaces: Optional[int] = None) -> int:
+        parent_end, child_end = socket.socketpair(socket.AF_UNIX, socket.SOCK_DGRAM)
+        master_pid = os.getpid()
+        sys.stdout.flush()
+        sys.stderr.flush()
+        pid = os.fork()
+        if pid == 0:
+            status = 0
+            try:
+                self._become_worker(parent_end)
+                self.run_worker(slot, PeerLink(child_end, slot, master_pid), self.lock_dir)
+            except BaseException:
+                traceback.print_exc()
+                status = 1
+            finally:
+                sys.stdout.flush()
+                sys.stderr.flush()
+                os._exit(status)
+        child_end.close()
+        parent_end.setblocking(False)
+        self.workers[pid] = WorkerProcess(pid, slot, parent_end, replaces)
+        self._selector.register(parent_end, selectors.EVENT_READ, pid)
+        if replaces is None:
+            self.slots[slot] = pid
+        return pid
+
+    def _become_worker(self, own_channel: socket.socket):
+        """In the child: drop the master's sockets and signal handling"""
+        signal.set_wakeup_fd(-1)
+        for signum in (signal.SIGTERM, signal.SIGCHLD):
+            signal.signal(signum, signal.SIG_DFL)
+        # Ctrl+C and terminal hangups reach the whole process group; the master decides how workers stop
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        signal.signal(signal.SIGHUP, signal.SIG_IGN)
+        own_channel.close()
+        for worker in self.workers.values():
+            worker.channel.close()
+        self._selector.close()
+        self._wakeup_r.close()
+        self._wakeup_w.close()
+        self.reserved.close()
+
+    def run(self):
+        self._wakeup_w.setblocking(False)
+        signal.set_wakeup_fd(self._wakeup_w.fileno(), warn_on_full_buffer=False)
+        signal.signal(signal.SIGCHLD, lambda *_: None)
+        signal.signal(signal.SIGHUP, self._on_hup)
+        signal.signal(signal.SIGTERM, self._on_stop)
+        signal.signal(signal.SIGINT, self._on_stop)
+        self._selector.register(self._wakeup_r, selectors.EVENT_READ, None)
+        try:
+            for slot in range(self.processes):
+                self.spawn(slot)
+            while self.workers or not self.stopping:
+                self._tick()
+                if self._stop_requested and not self.stopping:
+                    self.stopping = True
+                    self._stop_deadline = time.monotonic() + GRACEFUL_TIMEOUT
+                    for worker in self.workers.values():
+                        self._terminate(worker)
+        finally:
+            self._selector.close()
+            self._wakeup_r.close()
+            self._wakeup_w.close()
+            self.reserved.close()
+            shutil.rmtree(self.lock_dir, ignore_errors=True)
+
+    def _on_hup(self, *_):
+        self._restart_requested = True
+
+    def _on_stop(self, *_):
+        self._stop_requested = True
+
+    def _terminate(self, worker: WorkerProcess, signum: int = signal.SIGTERM):
+        worker.retiring = True
+        try:
+            os.kill(worker.pid, signum)
+        except ProcessLookupError:
+            pass
+
+    def _tick(self):
+        timeout = 1.0
+        if self.respawn_at:
+            timeout = max(0.0, min(timeout, min(self.respawn_at.values()) - time.monotonic()))
+        for key, _ in self._selector.select(timeout):
+            if key.data is None:
+                try:
+                    self._wakeup_r.recv(4096)
+                except BlockingIOError:
+                    pass
+            else:
+                self._relay(key.data)
+        self._reap()
+        now = time.monotonic()
+        if self.stopping:
+            if now > self._stop_deadline:
+                for worker in self.workers.values():
+                    self._terminate(worker, signal.SIGKILL)
+            return
+        if self._restart_requested:
+            self._restart_requested = False
+            self.restarts += 1
+            print(f"🔄 Restarting {len(self.slots)} worker process(es)")
+            for slot, pid in list(self.slots.items()):
+                if slot not in self.respawn_at:
+                    self.spawn(slot, replaces=pid)
+        for slot, due in list(self.respawn_at.items()):
+            if now >= due:
+                del self.respawn_at[slot]
+                self.spawn(slot)
+        for worker in list(self.workers.values()):
+            if worker.replaces is not None and not worker.ready and now - worker.started > READY_TIMEOUT:
+                print(f"⚠️  Replacement for worker {worker.slot} never became ready; keeping the old one")
+                self._terminate(worker, signal.SIGKILL)
+
+    def _relay(self, pid: int):
+        sender = self.workers.get(pid)
+        while sender is not None:
+            try:
+                data = sender.channel.recv(MAX_MESSAGE)
+            except (BlockingIOError, InterruptedError):
+                return
+            except OSError:
+                return
+            try:
+                kind = json.loads(data).get('kind')
+            except ValueError:
+                continue
+            if kind == 'ready':
+                self._ready(sender)
+                continue
+            for worker in self.workers.values():
+                if worker.pid != pid:
+                    try:
+                        worker.channel.send(data)
+                    except OSError as e:
+                        # Caches still revalidate by mtime; only entries/SSE/git state can lag
+                        print(f"⚠️  Dropped a peer message for worker {worker.slot} (pid {worker.pid}): {e}")
+
+    def _ready(self, worker: WorkerProcess):
+        worker.ready = True
+        if worker.replaces is not None:
+            old = self.workers.get(worker.replaces)
+            self.slots[worker.slot] = worker.pid
+            worker.replaces = None
+            if old is not None:
+                self._terminate(old)
+
+    def _reap(self):
+        while self.workers:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                return
+            if pid == 0:
+                return
+            worker = self.workers.pop(pid, None)
+            if worker is None:
+                continue
+            self._selector.unregister(worker.channel)
+            worker.channel.close()
+            if worker.retiring or self.stopping:
+                continue
+            code = os.waitstatus_to_exitcode(status)
+            how = f"signal {-code}" if code < 0 else f"exit code {code}"
+            if self.slots.get(worker.slot) != pid:
+                print(f"⚠️  Replacement for worker {worker.slot} exited ({how}); keeping the old one")
+                continue
+            lifetime = time.monotonic() - worker.started
+            self.failures[worker.slot] = self.failures.get(worker.slot, 0) + 1 if lifetime < MIN_LIFETIME else 0
+            delay = min(MAX_RESPAWN_DELAY, RESPAWN_DELAY * 2 ** self.failures[worker.slot])
+            print(f"💥 Worker {worker.slot} (pid {pid}) died ({how}); restarting in {delay:g}s")
+            self.respawn_at[worker.slot] = time.monotonic() + delay
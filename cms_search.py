@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+Static search index for the site
+Builds sharded, delta-encoded postings at build time and answers queries from them
+"""
+
+import heapq
+import itertools
+import json
+import os
+import re
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from cms_generator import PAGES, atomic_write_bytes, content_hash
+
+SEARCH_DIR = 'search'
+MANIFEST_NAME = 'index.json'
+INDEX_VERSION = 1
+SEARCH_PAGES = ('work', 'projects', 'publications', 'blogs')
+# Score added per occurrence of a term in each field
+FIELD_WEIGHTS = (('title', 3), ('tags', 2), ('text', 1))
+PREFIX_LENGTH = 2
+MAX_PREFIX_LENGTH = 4
+TARGET_SHARD_BYTES = 32 * 1024
+# Small chunks: ten results usually land in ten different chunks
+DOCS_PER_CHUNK = 50
+SNIPPET_CHARS = 160
+TOKEN_RE = re.compile(r'[a-z0-9]+')
+TAG_RE = re.compile(r'<[^>]+>')
+STOPWORDS = frozenset('''a an and are as at be but by for from has have i in is it its of on or so that the
+this to was we were what when which with you my me our not no'''.split())
+
+
+def tokenize(text: str) -> List[str]:
+    return [token for token in TOKEN_RE.findall(text.lower()) if len(token) > 1 and token not in STOPWORDS]
+
+
+def delta_encode(ids: List[int]) -> List[int]:
+    """Sorted ids as gaps: [3, 7, 8] -> [3, 4, 1], which keeps the JSON short"""
+    return [current - previous for previous, current in zip([0] + ids, ids)]
+
+
+def delta_decode(gaps: List[int]) -> List[int]:
+    return list(itertools.accumulate(gaps))
+
+
+def extract_documents(data: Dict[str, Any]) -> Tuple[List[Dict[str, Any]], Dict[str, List[int]]]:
+    """Searchable documents from every indexed page, plus each page's [start, end) id range"""
+    documents = []
+    ranges = {}
+    for name in SEARCH_PAGES:
+        spec = PAGES[name]
+        start = len(documents)
+        for entry in data.get(spec.entries_key) or []:
+            if not isinstance(entry, dict):
+                continue
+            text = TAG_RE.sub(' ', str(entry.get('description') or entry.get('excerpt') or ''))
+            text = ' '.join(text.split())
+            extra = ' '.join(str(entry.get(key) or '') for key in ('authors', 'venue', 'organization'))
+            documents.append({
+                'page': name,
+                'title': str(entry.get('title') or ''),
+                'url': entry.get('link') or entry.get('url') or spec.canonical_path,
+                'snippet': text[:SNIPPET_CHARS],
+                'tags': [str(tag) for tag in entry.get('tags') or []],
+                'text': f'{text} {extra}'
+            })
+        if len(documents) > start:
+            ranges[name] = [start, len(documents)]
+    return documents, ranges
+
+
+def build_postings(documents: List[Dict[str, Any]]) -> Dict[str, Dict[int, int]]:
+    """Inverted index: term -> {document id: weighted term frequency}"""
+    postings: Dict[str, Dict[int, int]] = {}
+    for doc_id, document in enumerate(documents):
+        for field, weight in FIELD_WEIGHTS:
+            value = document[field]
+            for term in tokenize(' '.join(value) if isinstance(value, list) else value):
+                scores = postings.setdefault(term, {})
+                scores[doc_id] = scores.get(doc_id, 0) + weight
+    return postings
+
+
+def group_terms(terms: Dict[str, Any], length: int = PREFIX_LENGTH) -> List[Tuple[str, Dict[str, Any], int]]:
+    """(prefix, terms, encoded size) groups in term order; a group over
+    TARGET_SHARD_BYTES is split on one more character, up to MAX_PREFIX_LENGTH"""
+    groups: Dict[str, Dict[str, Any]] = {}
+    for term, value in terms.items():
+        groups.setdefault(term[:length], {})[term] = value
+    result = []
+    for prefix, members in groups.items():
+        size = len(json.dumps(members, separators=(',', ':')))
+        if size > TARGET_SHARD_BYTES and length < MAX_PREFIX_LENGTH and len(members) > 1:
+            result += group_terms(members, length + 1)
+        else:
+            result.append((prefix, members, size))
+    return result
+
+
+def shards_for(prefixes: Dict[str, int], term: str, prefix_match: bool = False) -> List[int]:
+    """Shards holding term, or with prefix_match every term starting with it"""
+    owners = [prefix for prefix in prefixes if term.startswith(prefix)]
+    numbers = {prefixes[max(owners, key=len)]} if owners else set()
+    if prefix_match or len(term) < PREFIX_LENGTH:
+        numbers |= {number for prefix, number in prefixes.items() if prefix.startswith(term)}
+    return sorted(numbers)
+
+
+def encode_shards(postings: Dict[str, Dict[int, int]]) -> Tuple[Dict[str, int], List[Dict[str, Any]]]:
+    """Group terms by prefix and pack consecutive prefixes into shards of about TARGET_SHARD_BYTES.
+
+    Each term maps to [gaps, scores]: delta-encoded document ids and the
+    matching scores. Returns the prefix -> shard map and the shards.
+    """
+    encoded = {}
+    for term in sorted(postings):
+        ids = sorted(postings[term])
+        encoded[term] = [delta_encode(ids), [postings[term][i] for i in ids]]
+    prefixes: Dict[str, int] = {}
+    shards: List[Dict[str, Any]] = []
+    size = TARGET_SHARD_BYTES
+    for prefix, terms, group_size in group_terms(encoded):
+        if size + group_size > TARGET_SHARD_BYTES and (not shards or shards[-1]):
+            shards.append({})
+            size = 0
+        shards[-1].update(terms)
+        prefixes[prefix] = len(shards) - 1
+        size += group_size
+    return prefixes, shards
+
+
+def dump_json(value: Any) -> bytes:
+    return json.dumps(value, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def write_index(data: Dict[str, Any], directory: str = SEARCH_DIR, force: bool = False) -> Dict[str, Any]:
+    """Build the index for data into directory unless it already matches.
+
+    Shard and document files carry the index key in their names, so browsers
+    can cache them forever and a reader never mixes files from two builds:
+    the manifest is replaced last and old files are deleted after it.
+    """
+    start = time.perf_counter()
+    documents, ranges = extract_documents(data)
+    key = content_hash([INDEX_VERSION, FIELD_WEIGHTS, TARGET_SHARD_BYTES, documents])
+    manifest_path = os.path.join(directory, MANIFEST_NAME)
+    # Shaped like a page build result so watchers and the server can publish it alongside pages
+    result = {'page': 'search', 'file': manifest_path, 'written': False, 'files': [],
+              'documents': len(documents), 'key': key}
+    if not force:
+        try:
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                if json.load(f).get('key') == key:
+                    return result
+        except (OSError, ValueError):
+            pass
+
+    postings = build_postings(documents)
+    prefixes, shards = encode_shards(postings)
+    os.makedirs(directory, exist_ok=True)
+    files = []
+    total_bytes = 0
+    for number, shard in enumerate(shards):
+        path = os.path.join(directory, f'terms-{key[:8]}-{number}.json')
+        body = dump_json(shard)
+        atomic_write_bytes(path, body)
+        files.append(path)
+        total_bytes += len(body)
+    chunks = range(0, len(documents), DOCS_PER_CHUNK)
+    for number, offset in enumerate(chunks):
+        rows = [[doc['page'], doc['title'], doc['url'], doc['snippet'], doc['tags']]
+                for doc in documents[offset:offset + DOCS_PER_CHUNK]]
+        path = os.path.join(directory, f'docs-{key[:8]}-{number}.json')
+        body = dump_json(rows)
+        atomic_write_bytes(path, body)
+        files.append(path)
+        total_bytes += len(body)
+
+    manifest = {
+        'version': INDEX_VERSION,
+        'key': key,
+        'documents': len(documents),
+        'terms': len(postings),
+        'pages': ranges,
+        'docs_per_chunk': DOCS_PER_CHUNK,
+        'shards': len(shards),
+        'prefixes': prefixes
+    }
+    body = dump_json(manifest)
+    atomic_write_bytes(manifest_path, body)
+    files.append(manifest_path)
+    total_bytes += len(body)
+
+    # Files from earlier builds (reported in files too); keep anything that is not ours
+    current = {os.path.basename(path) for path in files}
+    for name in os.listdir(directory):
+        if re.match(r'(terms|docs)-[0-9a-f]{8}-\d+\.json$', name) and name not in current:
+            os.remove(os.path.join(directory, name))
+            files.append(os.path.join(directory, name))
+
+    result.update(written=True, files=files, terms=len(postings), shards=len(shards),
+                  bytes=total_bytes, build_ms=(time.perf_counter() - start) * 1000)
+    return result
+
+
+class SearchIndex:
+    """Answers queries from a built index directory, loading shards on demand.
+
+    The manifest is re-read whenever its mtime changes, so a running server
+    picks up rebuilds without restarting.
+    """
+
+    def __init__(self, directory: str = SEARCH_DIR):
+        self.directory = directory
+        self._lock = threading.Lock()
+        self._mtime: Optional[int] = None
+        self.manifest: Dict[str, Any] = {}
+        self._shards: Dict[int, Dict[str, Any]] = {}
+        self._docs: Dict[int, List[Any]] = {}
+
+    def _refresh(self):
+        """Load the manifest if it changed; FileNotFoundError when no index was built"""
+        mtime = os.stat(os.path.join(self.directory, MANIFEST_NAME)).st_mtime_ns
+        if mtime != self._mtime:
+            with open(os.path.join(self.directory, MANIFEST_NAME), 'r', encoding='utf-8') as f:
+                self.manifest = json.load(f)
+            self._mtime = mtime
+            self._shards = {}
+            self._docs = {}
+
+    def _load(self, kind: str, number: int, cache: Dict[int, Any]) -> Any:
+        value = cache.get(number)
+        if value is None:
+            path = os.path.join(self.directory, f"{kind}-{self.manifest['key'][:8]}-{number}.json")
+            with open(path, 'r', encoding='utf-8') as f:
+                value = cache[number] = json.load(f)
+        return value
+
+    def _postings(self, term: str, prefix_match: bool = False) -> Dict[int, int]:
+        """Document scores for a term, or for every term starting with it"""
+        scores: Dict[int, int] = {}
+        for number in shards_for(self.manifest['prefixes'], term, prefix_match):
+            shard = self._load('terms', number, self._shards)
+            terms = [name for name in shard if name.startswith(term)] if prefix_match else [term]
+            for name in terms:
+                if name not in shard:
+                    continue
+                gaps, weights = shard[name]
+                for doc_id, weight in zip(delta_decode(gaps), weights):
+                    scores[doc_id] = scores.get(doc_id, 0) + weight
+        return scores
+
+    def document(self, doc_id: int) -> Dict[str, Any]:
+        per_chunk = self.manifest['docs_per_chunk']
+        page, title, url, snippet, tags = self._load('docs', doc_id // per_chunk, self._docs)[doc_id % per_chunk]
+        return {'id': doc_id, 'page': page, 'title': title, 'url': url, 'snippet': snippet, 'tags': tags}
+
+    def search(self, query: str, limit: int = 10, page: Optional[str] = None) -> Dict[str, Any]:
+        """Documents containing every term, best first; the last term also matches as a prefix
+        unless the query ends with a space"""
+        start = time.perf_counter()
+        terms = tokenize(query)
+        with self._lock:
+            self._refresh()
+            scores: Optional[Dict[int, int]] = None
+            for position, term in enumerate(terms):
+                prefix_match = position == len(terms) - 1 and not query[-1:].isspace()
+                matches = self._postings(term, prefix_match)
+                if scores is None:
+                    scores = matches
+                else:
+                    scores = {doc_id: score + matches[doc_id] for doc_id, score in scores.items()
+                              if doc_id in matches}
+                if not scores:
+                    break
+            scores = scores or {}
+            if page is not None:
+                first, end = self.manifest['pages'].get(page, (0, 0))
+                scores = {doc_id: score for doc_id, score in scores.items() if first <= doc_id < end}
+            best = heapq.nlargest(limit, scores.items(), key=lambda item: (item[1], -item[0]))
+            results = [dict(self.document(doc_id), score=score) for doc_id, score in best]
+        return {
+            'query': query,
+            'terms': terms,
+            'total': len(scores),
+            'results': results,
+            'ms': (time.perf_counter() - start) * 1000
+        }
@@ -4,14 +4,660 @@ Simple HTTP server for CMS file operations
 Handles saving files directly to the project directory
 """
 
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import formatdate, parsedate_to_datetime
 from http.server import HTTPServer, BaseHTTPRequestHandler
+import gzip
+import hashlib
+import itertools
 import json
+import mimetypes
 import os
+import select
+import socket
+import stat
+import sys
+import threading
+import time
 import urllib.parse
 
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+from cms_assets import DIST_DIR, MANIFEST_NAME as ASSET_MANIFEST
+from cms_feed import (DEFAULT_FEED_URL, DEFAULT_MAX_AGE, FEED_FILE, STALE_WHILE_REVALIDATE, FeedRefresher,
+                      FeedStore)
+from cms_generator import PAGES, HTMLGenerator, atomic_write_bytes, content_hash
+from cms_git import GitService, get_commit_message
+from cms_images import VARIANT_DIR, MANIFEST_NAME as IMAGE_MANIFEST
+from cms_metrics import MAX_PROFILE_SECONDS, ServerMetrics, sample_profile
+from cms_patch import PatchError, apply_ops, apply_unified_diff
+from cms_search import SEARCH_DIR, MANIFEST_NAME as SEARCH_MANIFEST, SearchIndex
+from cms_store import STORE_FILE, ConflictError, EntryStore
+
+DEFAULT_WORKERS = 8
+MAX_FINISHED_JOBS = 100
+DEFAULT_COMMIT_WINDOW = 2.0
+DEFAULT_COMMIT_BATCH = 20
+DEFAULT_CACHE_BYTES = 32 * 1024 * 1024
+DEFAULT_CACHE_ENTRIES = 256
+DEFAULT_STREAM_THRESHOLD = 256 * 1024
+STREAM_CHUNK_SIZE = 64 * 1024
+MIN_COMPRESS_SIZE = 1024
+COMPRESSIBLE_TYPES = ('text/', 'application/javascript', 'application/json', 'image/svg+xml')
+# Preference order when the client rates several encodings equally
+ENCODING_PREFERENCE = ('br', 'gzip')
+SIDECAR_SUFFIXES = {'br': '.br', 'gzip': '.gz'}
+# Files whose names change whenever their content does, so browsers may keep them for a year
+IMMUTABLE_PREFIXES = (VARIANT_DIR + '/', DIST_DIR + '/', SEARCH_DIR + '/')
+# ...except the manifests in those directories, which are rewritten in place
+MUTABLE_MANIFESTS = frozenset((f'{VARIANT_DIR}/{IMAGE_MANIFEST}', f'{DIST_DIR}/{ASSET_MANIFEST}',
+                               f'{SEARCH_DIR}/{SEARCH_MANIFEST}'))
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+SSE_KEEPALIVE = 15.0
+SSE_SEND_TIMEOUT = 5.0
+
+
+def guess_content_type(file_path):
+    """Map a file extension to the Content-Type the CMS serves it with"""
+    if file_path.endswith('.html'):
+        return 'text/html'
+    elif file_path.endswith('.js'):
+        return 'application/javascript'
+    elif file_path.endswith('.css'):
+        return 'text/css'
+    elif file_path.endswith('.json'):
+        return 'application/json'
+    elif file_path.endswith('.webp'):
+        return 'image/webp'
+    elif file_path.endswith('.avif'):
+        return 'image/avif'
+    else:
+        return mimetypes.guess_type(file_path)[0] or 'text/plain'
+
+
+def content_etag(body):
+    """Strong validator for a file body; /save-file base hashes use the same value"""
+    return hashlib.sha1(body).hexdigest()[:20]
+
+def stat_etag(st):
+    """Validator for files too large to hash on every request"""
+    return f'{st.st_mtime_ns:x}-{st.st_size:x}'
+
+def normalize_etag(value):
+    """Strip quotes, a weak prefix and an encoding suffix from an ETag or base hash"""
+    value = value.strip()
+    if value.startswith('W/'):
+        value = value[2:]
+    value = value.strip('"')
+    for coding in ENCODING_PREFERENCE:
+        if value.endswith('-' + coding):
+            return value[:-len(coding) - 1]
+    return value
+
+def file_validators(file_path, st):
+    """Describe a file for streaming: validators and type, but no body"""
+    return {
+        'body': None,
+        'size': st.st_size,
+        'mtime_ns': st.st_mtime_ns,
+        'etag': '"' + stat_etag(st) + '"',
+        'last_modified': formatdate(st.st_mtime, usegmt=True),
+        'content_type': guess_content_type(file_path),
+        'encoding': None,
+        'variants': {}
+    }
+
+
+def is_compressible(entry):
+    return (entry['body'] is not None and entry['size'] >= MIN_COMPRESS_SIZE
+            and entry['content_type'].startswith(COMPRESSIBLE_TYPES))
+
+
+def negotiate_encoding(accept_encoding, available):
+    """Pick the best content-coding from an Accept-Encoding header, or None for identity"""
+    if not accept_encoding:
+        return None
+    weights = {}
+    for item in accept_encoding.split(','):
+        coding, _, params = item.strip().partition(';')
+        coding = coding.strip().lower()
+        weight = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                weight = float(params[2:])
+            except ValueError:
+                weight = 0.0
+        if coding:
+            weights[coding] = weight
+    best, best_weight = None, 0.0
+    for coding in ENCODING_PREFERENCE:
+        if coding not in available:
+            continue
+        weight = weights.get(coding, weights.get('*', 0.0))
+        if weight > best_weight:
+            best, best_weight = coding, weight
+    return best
+
+
+def parse_range(header, size):
+    """Parse a single-range Range header into (start, end) inclusive.
+
+    Returns None when the header should be ignored (absent, malformed or
+    multi-range) and raises ValueError when the range is unsatisfiable.
+    """
+    if not header or not header.startswith('bytes=') or ',' in header:
+        return None
+    start_text, sep, end_text = header[len('bytes='):].strip().partition('-')
+    if not sep or not (start_text or end_text):
+        return None
+    if (start_text and not start_text.isdigit()) or (end_text and not end_text.isdigit()):
+        return None
+    if start_text:
+        start = int(start_text)
+        end = int(end_text) if end_text else size - 1
+        if start >= size:
+            raise ValueError('range starts past end of file')
+        if end < start:
+            return None
+    else:
+        suffix = int(end_text)
+        if suffix == 0 or size == 0:
+            raise ValueError('unsatisfiable suffix range')
+        start, end = max(0, size - suffix), size - 1
+    return start, min(end, size - 1)
+
+
+class StaticFileCache:
+    """Bounded LRU cache of static file bodies, revalidated against mtime and size"""
+
+    def __init__(self, max_bytes=DEFAULT_CACHE_BYTES, max_entries=DEFAULT_CACHE_ENTRIES):
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.compression = {
+            coding: {'responses': 0, 'bytes_original': 0, 'bytes_sent': 0}
+            for coding in ENCODING_PREFERENCE
+        }
+
+    def get(self, file_path, st=None):
+        """Return the cached entry for file_path, reading it from disk on a miss"""
+        key = os.path.normpath(file_path)
+        if st is None:
+            st = os.stat(key)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry['mtime_ns'] == st.st_mtime_ns and entry['size'] == st.st_size:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+            self.misses += 1
+
+        with open(key, 'rb') as f:
+            body = f.read()
+        entry = {
+            'body': body,
+            'size': len(body),
+            'mtime_ns': st.st_mtime_ns,
+            'etag': '"' + content_etag(body) + '"',
+            'last_modified': formatdate(st.st_mtime, usegmt=True),
+            'content_type': guess_content_type(key),
+            'encoding': None,
+            'variants': {}
+        }
+        self._store(key, entry)
+        return entry
+
+    def available_encodings(self, file_path):
+        """Encodings we can produce for file_path: gzip always, br via sidecar or module"""
+        available = {'gzip'}
+        if brotli is not None or os.path.exists(file_path + SIDECAR_SUFFIXES['br']):
+            available.add('br')
+        return available
+
+    def encoded(self, file_path, entry, coding):
+        """Return the compressed variant of a cached entry, preferring a fresh sidecar file"""
+        variant = entry['variants'].get(coding)
+        if variant is not None:
+            return variant
+
+        body = None
+        sidecar = file_path + SIDECAR_SUFFIXES[coding]
+        try:
+            if os.stat(sidecar).st_mtime_ns >= entry['mtime_ns']:
+                with open(sidecar, 'rb') as f:
+                    body = f.read()
+        except OSError:
+            pass
+        if body is None:
+            if coding == 'gzip':
+                body = gzip.compress(entry['body'], compresslevel=6, mtime=0)
+            elif brotli is not None:
+                body = brotli.compress(entry['body'])
+            else:
+                return entry
+
+        variant = dict(entry, body=body, size=len(body), encoding=coding, variants={},
+                       etag=entry['etag'][:-1] + '-' + coding + '"')
+        key = os.path.normpath(file_path)
+        with self._lock:
+            # Another thread may have compressed the same coding meanwhile; count it once
+            stored = entry['variants'].get(coding)
+            if stored is not None:
+                return stored
+            entry['variants'][coding] = variant
+            if self._entries.get(key) is entry:
+                self._bytes += variant['size']
+                self._evict()
+        return variant
+
+    def record_compression(self, coding, original_size, sent_size):
+        with self._lock:
+            counters = self.compression[coding]
+            counters['responses'] += 1
+            counters['bytes_original'] += original_size
+            counters['bytes_sent'] += sent_size
+
+    def invalidate(self, file_path):
+        """Forget a file, e.g. after /save-file rewrote it"""
+        key = os.path.normpath(file_path)
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry:
+                self._bytes -= self._cost(entry)
+                self.invalidations += 1
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'invalidations': self.invalidations,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'compression': {
+                    coding: dict(
+                        counters,
+                        bytes_saved=counters['bytes_original'] - counters['bytes_sent'],
+                        bytes_saved_per_response=(
+                            (counters['bytes_original'] - counters['bytes_sent']) / counters['responses']
+                            if counters['responses'] else 0.0
+                        )
+                    )
+                    for coding, counters in self.compression.items()
+                }
+            }
+
+    @staticmethod
+    def _cost(entry):
+        return entry['size'] + sum(variant['size'] for variant in entry['variants'].values())
+
+    def _store(self, key, entry):
+        if entry['size'] > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old:
+                self._bytes -= self._cost(old)
+            self._entries[key] = entry
+            self._bytes += entry['size']
+            self._evict()
+
+    def _evict(self):
+        while self._bytes > self.max_bytes or len(self._entries) > self.max_entries:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= self._cost(evicted)
+
+
+class GitJobQueue:
+    """Coalesces commit requests into batched commits on a single background worker.
+
+    A batch is committed once `window` seconds have passed since its first
+    request or `max_batch` requests are waiting, whichever comes first. Commits
+    and pushes never overlap, so requests cannot race on the index.
+    """
+
+    def __init__(self, service=None, window=DEFAULT_COMMIT_WINDOW, max_batch=DEFAULT_COMMIT_BATCH,
+                 metrics=None):
+        self.service = service or GitService()
+        self.metrics = metrics
+        # Set by join_peers() when several server processes share the repository
+        self.id_prefix = ''
+        self.commit_lock = None
+        self.on_change = None
+        self.window = window
+        self.max_batch = max(1, max_batch)
+        self._jobs = {}
+        self._pending = []
+        self._written = set()
+        self._batches = []
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._closed = False
+        self._ids = itertools.count(1)
+        self._batch_ids = itertools.count(1)
+        self._worker = threading.Thread(target=self._work, name='git-job', daemon=True)
+        self._worker.start()
+
+    def track(self, path):
+        """Remember a file the CMS wrote so the next commit stages it"""
+        with self._lock:
+            self._written.add(os.path.normpath(path))
+
+    def submit(self, message, files=None):
+        """Queue a commit request for `files` plus every tracked file and return its job record"""
+        with self._lock:
+            job_id = f'{self.id_prefix}{next(self._ids)}'
+            job = {
+                'id': job_id,
+                'status': 'queued',
+                'message': message,
+                'files': sorted(self._written.union(os.path.normpath(path) for path in files or ())),
+                'batch': None,
+                'absorbed': None,
+                'commit': None,
+                'output': '',
+                'error': '',
+                'timings_ms': {},
+                'created': time.time(),
+                'started': None,
+                'finished': None
+            }
+            self._written.clear()
+            self._jobs[job_id] = job
+            self._pending.append(job_id)
+            self._prune()
+            self._wakeup.notify()
+        if self.on_change:
+            self.on_change([dict(job)])
+        return dict(job)
+
+    def get(self, job_id):
+        """Return a snapshot of a job, or None if unknown"""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return dict(job) if job else None
+
+    def mirror(self, jobs):
+        """Record jobs queued by another server process so /git-jobs/<id> can answer for them"""
+        with self._lock:
+            for job in jobs:
+                self._jobs[job['id']] = job
+            self._prune()
+
+    def stats(self):
+        with self._lock:
+            commits = [batch for batch in self._batches if batch['commit']]
+            absorbed = sum(batch['absorbed'] for batch in commits)
+            return {
+                'window_seconds': self.window,
+                'max_batch': self.max_batch,
+                'pending_requests': len(self._pending),
+                'commits': len(commits),
+                'requests_committed': absorbed,
+                'mean_absorbed': absorbed / len(commits) if commits else 0.0,
+                'recent_batches': self._batches[-10:]
+            }
+
+    def shutdown(self, wait=True):
+        """Commit whatever is queued now instead of waiting out the window"""
+        with self._lock:
+            self._closed = True
+            self._wakeup.notify()
+        if wait:
+            self._worker.join()
+
+    def _next_batch(self):
+        """Block until a batch is due and claim its jobs; None once shut down and drained"""
+        with self._lock:
+            while not self._pending and not self._closed:
+                self._wakeup.wait()
+            if not self._pending:
+                return None
+            deadline = self._jobs[self._pending[0]]['created'] + self.window
+            while len(self._pending) < self.max_batch and not self._closed:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    break
+                self._wakeup.wait(remaining)
+
+            batch = self._pending[:self.max_batch]
+            del self._pending[:self.max_batch]
+            files = set().union(*(self._jobs[job_id]['files'] for job_id in batch))
+            started = time.time()
+            for job_id in batch:
+                self._jobs[job_id].update(status='running', started=started)
+            return batch, sorted(files), [self._jobs[job_id]['message'] for job_id in batch]
+
+    def _work(self):
+        while True:
+            claimed = self._next_batch()
+            if claimed is None:
+                return
+            self._commit_batch(*claimed)
+
+    def _commit_batch(self, job_ids, files, messages):
+        batch_id = next(self._batch_ids)
+        message = get_commit_message(files, messages)
+        if self.commit_lock is not None:
+            with self.commit_lock:
+                result = self.service.commit(message, paths=files)
+        else:
+            result = self.service.commit(message, paths=files)
+        if self.metrics is not None:
+            for phase, ms in result['timings_ms'].items():
+                self.metrics.observe_phase('git' if phase == 'total' else f'git_{phase}', ms / 1000)
+        timings = ', '.join(f"{phase} {ms:.0f} ms" for phase, ms in result['timings_ms'].items())
+        absorbed = len(job_ids)
+
+        fields = {'batch': batch_id, 'absorbed': absorbed, 'commit': result['commit'],
+                  'timings_ms': result['timings_ms'], 'finished': time.time()}
+        if result['success']:
+            fields['status'] = 'succeeded'
+            fields['output'] = (f"Committed {result['commit']} ({len(result['files'])} files, "
+                                f"{absorbed} request{'s' if absorbed != 1 else ''})"
+                                if result['files'] else 'No CMS changes to commit')
+            print(f"✅ Git commit successful: {message.splitlines()[0]} "
+                  f"[{absorbed} request{'s' if absorbed != 1 else ''}; {timings}]")
+        else:
+            fields['status'] = 'failed'
+            fields['error'] = result['error']
+            print(f"❌ Git commit failed: {result['error']} [{timings}]")
+
+        with self._lock:
+            if not result['success'] and not result['commit']:
+                # Nothing was committed; keep the files for the next attempt
+                self._written.update(files)
+            for job_id in job_ids:
+                self._jobs[job_id].update(fields)
+            jobs = [dict(self._jobs[job_id]) for job_id in job_ids]
+            self._batches.append({'batch': batch_id, 'commit': result['commit'], 'absorbed': absorbed,
+                                  'files': result['files'], 'jobs': job_ids})
+            del self._batches[:-MAX_FINISHED_JOBS]
+        if self.on_change:
+            self.on_change(jobs)
+
+    def _prune(self):
+        """Drop the oldest finished jobs once the history grows past MAX_FINISHED_JOBS"""
+        finished = [job_id for job_id, job in self._jobs.items() if job['finished']]
+        for job_id in finished[:max(0, len(finished) - MAX_FINISHED_JOBS)]:
+            del self._jobs[job_id]
+
+
+class SaveStats:
+    """Upload volume and apply time of CMS saves, per save mode"""
+
+    MODES = ('full', 'ops', 'diff', 'entry', 'page')
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.modes = {mode: {'requests': 0, 'request_bytes': 0, 'file_bytes': 0, 'apply_ms': 0.0}
+                      for mode in self.MODES}
+        self.conflicts = 0
+
+    def record(self, mode, request_bytes, file_bytes, apply_ms):
+        with self._lock:
+            counters = self.modes[mode]
+            counters['requests'] += 1
+            counters['request_bytes'] += request_bytes
+            counters['file_bytes'] += file_bytes
+            counters['apply_ms'] += apply_ms
+
+    def conflict(self):
+        with self._lock:
+            self.conflicts += 1
+
+    def stats(self):
+        with self._lock:
+            modes = {}
+            for mode, counters in self.modes.items():
+                requests = counters['requests']
+                modes[mode] = dict(
+                    counters,
+                    mean_request_bytes=counters['request_bytes'] / requests if requests else 0.0,
+                    mean_apply_ms=counters['apply_ms'] / requests if requests else 0.0,
+                    # Bytes uploaded per byte of resulting file; well below 1 for delta saves
+                    upload_ratio=counters['request_bytes'] / counters['file_bytes'] if counters['file_bytes'] else 0.0
+                )
+            return {'conflicts': self.conflicts, 'modes': modes}
+
+
+class LiveReloadBroadcaster:
+    """Pushes Server-Sent Events to open CMS tabs without holding a worker per tab"""
+
+    def __init__(self, keepalive=SSE_KEEPALIVE):
+        self.keepalive = keepalive
+        self._clients = []
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._closed = threading.Event()
+        self._pinger = None
+
+    def attach(self, sock):
+        """Take ownership of a socket whose SSE response headers have been sent"""
+        sock.settimeout(SSE_SEND_TIMEOUT)
+        with self._lock:
+            self._clients.append(sock)
+            if self._pinger is None:
+                self._pinger = threading.Thread(target=self._ping, name='sse-keepalive', daemon=True)
+                self._pinger.start()
+
+    def publish(self, event, payload):
+        message = f"id: {next(self._ids)}\nevent: {event}\ndata: {json.dumps(payload)}\n\n"
+        self._send(message.encode('utf-8'))
+
+    def client_count(self):
+        with self._lock:
+            return len(self._clients)
+
+    def close(self):
+        self._closed.set()
+        with self._lock:
+            clients, self._clients = self._clients, []
+        for sock in clients:
+            self._close_client(sock)
+
+    def _send(self, data):
+        with self._lock:
+            clients = list(self._clients)
+        for sock in clients:
+            try:
+                sock.sendall(data)
+            except OSError:
+                # Tab closed or too slow to keep up; EventSource will reconnect
+                with self._lock:
+                    if sock in self._clients:
+                        self._clients.remove(sock)
+                self._close_client(sock)
+
+    def _ping(self):
+        """Comment lines keep idle connections open and reveal closed tabs"""
+        while not self._closed.wait(self.keepalive):
+            self._send(b': ping\n\n')
+
+    @staticmethod
+    def _close_client(sock):
+        try:
+            sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        sock.close()
+
+
+class CountingWriter:
+    """Wraps a handler's output stream to count the bytes written to it"""
+
+    def __init__(self, raw):
+        self.raw = raw
+        self.count = 0
+
+    def write(self, data):
+        self.count += len(data)
+        return self.raw.write(data)
+
+    def __getattr__(self, name):
+        return getattr(self.raw, name)
+
+
 class CMSHandler(BaseHTTPRequestHandler):
     def do_GET(self):
-        """Serve static files"""
+        """Serve static files, git job status, server stats and live reload events"""
+        if self.path.split('?')[0] == '/events':
+            self.open_event_stream()
+            return
+
+        if self.path.split('?')[0] == '/api/entries':
+            self.send_entries()
+            return
+
+        if self.path.split('?')[0] == '/api/search':
+            self.send_search()
+            return
+
+        if self.path.startswith('/git-jobs/'):
+            self.send_git_job_status(self.path[len('/git-jobs/'):].split('?')[0])
+            return
+
+        if self.path.split('?')[0] == '/stats':
+            self.send_json(200, {
+                'requests': self.server.metrics.stats(),
+                'static_cache': self.server.static_cache.stats(),
+                'saves': self.server.save_stats.stats(),
+                'git': self.server.git_jobs.stats(),
+                'feed': self.server.feed.stats() if self.server.feed else None,
+                'process': {'pid': os.getpid(), 'worker': self.server.peers.index if self.server.peers else None}
+            })
+            return
+
+        if self.path.split('?')[0] == '/metrics':
+            body = self.server.metrics.prometheus(self.server.static_cache.stats()).encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+
+        if self.path.split('?')[0] == '/debug/profile':
+            self.send_profile()
+            return
+
+        if self.path.split('?')[0] == '/' + FEED_FILE and self.server.feed:
+            # Serves the stale copy while a background fetch runs; waits only if there is none
+            self.server.feed.maybe_refresh()
+
         if self.path == '/':
             self.path = '/cms.html'
         
@@ -26,36 +672,148 @@ class CMSHandler(BaseHTTPRequestHandler):
             
         # Serve the file if it exists
         try:
-            if os.path.exists(file_path):
-                with open(file_path, 'rb') as f:
-                    content = f.read()
-                
-                # Set appropriate content type
-                if file_path.endswith('.html'):
-                    content_type = 'text/html'
-                elif file_path.endswith('.js'):
-                    content_type = 'application/javascript'
-                elif file_path.endswith('.css'):
-                    content_type = 'text/css'
-                elif file_path.endswith('.json'):
-                    content_type = 'application/json'
+            try:
+                st = os.stat(file_path)
+            except OSError:
+                st = None
+            if st is not None and stat.S_ISREG(st.st_mode):
+                # Small files come from the cache; large ones stream from disk
+                if st.st_size > self.server.stream_threshold:
+                    entry = file_validators(file_path, st)
                 else:
-                    content_type = 'text/plain'
+                    with self.server.metrics.phase('file_read'):
+                        entry = self.server.static_cache.get(file_path, st)
+                
+                # Compress text responses; ranges always address the identity body
+                vary = False
+                if is_compressible(entry):
+                    vary = True
+                    coding = None
+                    if not self.headers.get('Range'):
+                        cache = self.server.static_cache
+                        coding = negotiate_encoding(self.headers.get('Accept-Encoding'),
+                                                    cache.available_encodings(file_path))
+                    if coding:
+                        original_size = entry['size']
+                        with self.server.metrics.phase('file_read'):
+                            entry = cache.encoded(file_path, entry, coding)
+                
+                if self.is_not_modified(entry):
+                    self.send_response(304)
+                    self.send_cache_headers(entry, file_path)
+                    if vary:
+                        self.send_header('Vary', 'Accept-Encoding')
+                    self.end_headers()
+                    return
+                
+                try:
+                    byte_range = self.requested_range(entry)
+                except ValueError:
+                    self.send_response(416)
+                    self.send_header('Content-Range', f"bytes */{entry['size']}")
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
                 
-                self.send_response(200)
-                self.send_header('Content-Type', content_type)
-                self.send_header('Content-Length', str(len(content)))
+                if byte_range:
+                    start, end = byte_range
+                    self.send_response(206)
+                    self.send_header('Content-Range', f"bytes {start}-{end}/{entry['size']}")
+                else:
+                    start, end = 0, entry['size'] - 1
+                    self.send_response(200)
+                length = end - start + 1
+                self.send_header('Content-Type', entry['content_type'])
+                self.send_header('Content-Length', str(length))
+                self.send_header('Accept-Ranges', 'bytes')
+                if entry['encoding']:
+                    self.send_header('Content-Encoding', entry['encoding'])
+                    self.server.static_cache.record_compression(entry['encoding'], original_size, length)
+                if vary:
+                    self.send_header('Vary', 'Accept-Encoding')
+                self.send_cache_headers(entry, file_path)
                 # Add CORS headers for local development
                 self.send_header('Access-Control-Allow-Origin', '*')
-                self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
+                self.send_header('Access-Control-Allow-Methods', 'GET, POST, PUT, PATCH, OPTIONS')
                 self.send_header('Access-Control-Allow-Headers', 'Content-Type')
                 self.end_headers()
-                self.wfile.write(content)
+                
+                if entry['body'] is not None:
+                    self.wfile.write(memoryview(entry['body'])[start:end + 1])
+                else:
+                    with self.server.metrics.phase('stream'):
+                        self.stream_file(file_path, start, length)
             else:
                 self.send_error(404, f"File not found: {file_path}")
+        except (BrokenPipeError, ConnectionResetError):
+            # Client went away mid-download (e.g. a cancelled resume)
+            self.close_connection = True
         except Exception as e:
             self.send_error(500, f"Server error: {str(e)}")
 
+    def requested_range(self, entry):
+        """Return the (start, end) the client asked for, honouring If-Range"""
+        if_range = self.headers.get('If-Range')
+        if if_range and if_range.strip() not in (entry['etag'], entry['last_modified']):
+            return None
+        return parse_range(self.headers.get('Range'), entry['size'])
+
+    def stream_file(self, file_path, offset, length):
+        """Copy part of a file to the socket without holding it in memory"""
+        with open(file_path, 'rb') as f:
+            if hasattr(os, 'sendfile'):
+                out_fd = self.connection.fileno()
+                while length > 0:
+                    try:
+                        sent = os.sendfile(out_fd, f.fileno(), offset, min(length, 1 << 30))
+                    except (BrokenPipeError, ConnectionResetError):
+                        raise
+                    except OSError:
+                        # Not supported for this socket/file; finish with plain copies
+                        break
+                    if sent == 0:
+                        return
+                    self.bytes_sendfile += sent
+                    offset += sent
+                    length -= sent
+            
+            f.seek(offset)
+            while length > 0:
+                chunk = f.read(min(length, STREAM_CHUNK_SIZE))
+                if not chunk:
+                    return
+                self.wfile.write(chunk)
+                length -= len(chunk)
+
+    def is_not_modified(self, entry):
+        """Evaluate If-None-Match / If-Modified-Since against a file's validators"""
+        if_none_match = self.headers.get('If-None-Match')
+        if if_none_match:
+            tags = [tag.strip() for tag in if_none_match.split(',')]
+            return '*' in tags or entry['etag'] in tags
+        
+        if_modified_since = self.headers.get('If-Modified-Since')
+        if if_modified_since:
+            try:
+                since = parsedate_to_datetime(if_modified_since).timestamp()
+            except (TypeError, ValueError):
+                return False
+            return entry['mtime_ns'] // 1_000_000_000 <= since
+        return False
+
+    def send_cache_headers(self, entry, file_path=''):
+        self.send_header('ETag', entry['etag'])
+        self.send_header('Last-Modified', entry['last_modified'])
+        if file_path.startswith(IMMUTABLE_PREFIXES) and file_path not in MUTABLE_MANIFESTS:
+            self.send_header('Cache-Control', IMMUTABLE_CACHE_CONTROL)
+        elif file_path == FEED_FILE and self.server.feed:
+            # Browsers and CDNs may show an old feed.json while they refetch it in the background
+            self.send_header('Cache-Control', f'public, max-age={self.server.feed.max_age:g}, '
+                                              f'stale-while-revalidate={STALE_WHILE_REVALIDATE}')
+        else:
+            # Always revalidate: the CMS rewrites these files in place
+            self.send_header('Cache-Control', 'no-cache')
+
     def do_POST(self):
         """Handle file saving and git operations"""
         if self.path == '/save-file':
@@ -66,35 +824,74 @@ class CMSHandler(BaseHTTPRequestHandler):
                 data = json.loads(post_data.decode('utf-8'))
                 
                 filename = data.get('filename')
-                content = data.get('content')
+                mode = 'ops' if 'ops' in data else 'diff' if 'diff' in data else 'full'
+                base_hash = data.get('base_hash') or self.headers.get('If-Match')
                 
-                if not filename or content is None:
+                if not filename or (mode == 'full' and data.get('content') is None):
                     self.send_error(400, "Missing filename or content")
                     return
+                if mode != 'full' and not base_hash:
+                    self.send_error(400, "Patch saves need a base_hash")
+                    return
                 
                 # Security check - no path traversal
                 if '..' in filename or '/' in filename:
                     self.send_error(400, "Invalid filename")
                     return
                 
-                # Save the file
-                with open(filename, 'w', encoding='utf-8') as f:
-                    f.write(content)
+                start = time.perf_counter()
+                with self.server.save_lock:
+                    try:
+                        with open(filename, 'rb') as f:
+                            current = f.read()
+                            # Large files are served with an mtime-size ETag; accept either form
+                            current_hashes = {content_etag(current), stat_etag(os.fstat(f.fileno()))}
+                    except FileNotFoundError:
+                        current, current_hashes = None, set()
+                    current_hash = content_etag(current) if current is not None else None
+                    
+                    # Optimistic concurrency: the client must have seen the current file
+                    if base_hash and normalize_etag(base_hash) not in current_hashes:
+                        self.server.save_stats.conflict()
+                        self.send_json(409, {
+                            'success': False,
+                            'error': f'{filename} changed since base_hash',
+                            'filename': filename,
+                            'current_hash': current_hash
+                        })
+                        return
+                    
+                    try:
+                        if mode == 'ops':
+                            content = apply_ops(current.decode('utf-8'), data['ops'])
+                        elif mode == 'diff':
+                            content = apply_unified_diff(current.decode('utf-8'), data['diff'])
+                        else:
+                            content = data['content']
+                    except PatchError as e:
+                        self.send_json(400, {'success': False, 'error': f'Could not apply patch: {e}'})
+                        return
+                    
+                    # Save the file
+                    body = content.encode('utf-8')
+                    with self.server.metrics.phase('file_write'):
+                        atomic_write_bytes(filename, body, fsync=True)
+                apply_ms = (time.perf_counter() - start) * 1000
                 
-                # Send success response
-                self.send_response(200)
-                self.send_header('Content-Type', 'application/json')
-                self.send_header('Access-Control-Allow-Origin', '*')
-                self.end_headers()
+                publish_changes(self.server, [filename])
+                self.server.save_stats.record(mode, content_length, len(body), apply_ms)
                 
-                response = {
+                self.send_json(200, {
                     'success': True,
                     'message': f'File {filename} saved successfully',
-                    'filename': filename
-                }
-                self.wfile.write(json.dumps(response).encode('utf-8'))
+                    'filename': filename,
+                    'mode': mode,
+                    'hash': content_etag(body),
+                    'request_bytes': content_length,
+                    'apply_ms': apply_ms
+                })
                 
-                print(f"✅ Saved file: {filename}")
+                print(f"✅ Saved file: {filename} ({mode}, {content_length} bytes received)")
                 
             except Exception as e:
                 self.send_error(500, f"Error saving file: {str(e)}")
@@ -107,72 +904,505 @@ class CMSHandler(BaseHTTPRequestHandler):
                 data = json.loads(post_data.decode('utf-8'))
                 
                 commit_message = data.get('message', 'feat: update content via CMS')
+                files = data.get('files') or []
+                if any('..' in name or os.path.isabs(name) for name in files):
+                    self.send_error(400, "Invalid filename")
+                    return
                 
-                # Run git commit script
-                import subprocess
-                result = subprocess.run(
-                    ['python3', 'git_commit.py', '-m', commit_message],
-                    capture_output=True,
-                    text=True,
-                    cwd=os.getcwd()
-                )
+                # Commit and push in the background; the client polls /git-jobs/<id>
+                job = self.server.git_jobs.submit(commit_message, files)
+                self.send_json(202, {
+                    'success': True,
+                    'message': 'Git commit queued',
+                    'job_id': job['id'],
+                    'status_url': f"/git-jobs/{job['id']}"
+                })
                 
-                if result.returncode == 0:
-                    # Send success response
-                    self.send_response(200)
-                    self.send_header('Content-Type', 'application/json')
-                    self.send_header('Access-Control-Allow-Origin', '*')
-                    self.end_headers()
-                    
-                    response = {
-                        'success': True,
-                        'message': 'Changes committed and pushed successfully',
-                        'output': result.stdout
-                    }
-                    self.wfile.write(json.dumps(response).encode('utf-8'))
-                    
-                    print(f"✅ Git commit successful: {commit_message}")
-                else:
-                    self.send_error(500, f"Git commit failed: {result.stderr}")
+                print(f"📦 Queued git commit job {job['id']}: {commit_message}")
                     
             except Exception as e:
-                self.send_error(500, f"Error running git commit: {str(e)}")
+                self.send_error(500, f"Error queuing git commit: {str(e)}")
                 
         else:
             self.send_error(404, "Endpoint not found")
 
+    def do_PUT(self):
+        """Replace one page's entries in the store and re-render it"""
+        if self.path.split('?')[0] != '/api/entries':
+            self.send_error(404, "Endpoint not found")
+            return
+        start = time.perf_counter()
+        with self.server.save_lock:
+            try:
+                page = self.query_page()
+                data = self.read_json()
+                self.server.entries.refresh()
+                with self.server.metrics.phase('file_write'):
+                    self.server.entries.replace_page(page, data.get('entries'), data.get('settings'))
+            except (KeyError, ValueError, AttributeError) as e:
+                self.send_json(400, {'success': False, 'error': str(e)})
+                return
+            except OSError as e:
+                self.send_json(500, {'success': False, 'error': f'Error saving entries: {e}'})
+                return
+            self.save_entries(page, {'count': len(self.server.entries.entries(page))}, 'page', start)
+
+    def do_PATCH(self):
+        """Update a single stored entry by commit hash and re-render its page"""
+        path = self.path.split('?')[0]
+        if not path.startswith('/api/entries/'):
+            self.send_error(404, "Endpoint not found")
+            return
+        key = urllib.parse.unquote(path[len('/api/entries/'):])
+        base_hash = self.headers.get('If-Match')
+        start = time.perf_counter()
+        # The lock and refresh() keep another server process's edit from being overwritten
+        with self.server.save_lock:
+            try:
+                page = self.query_page(required=False)
+                self.server.entries.refresh()
+                fields = self.read_json()
+                with self.server.metrics.phase('file_write'):
+                    page, entry = self.server.entries.update(key, fields, page,
+                                                             normalize_etag(base_hash) if base_hash else None)
+            except KeyError:
+                self.send_json(404, {'success': False, 'error': f'No entry with hash {key}'})
+                return
+            except ConflictError as e:
+                self.server.save_stats.conflict()
+                self.send_json(409, {'success': False, 'error': str(e), 'current_hash': e.current_hash})
+                return
+            except ValueError as e:
+                self.send_json(400, {'success': False, 'error': str(e)})
+                return
+            except OSError as e:
+                self.send_json(500, {'success': False, 'error': f'Error saving entries: {e}'})
+                return
+            self.save_entries(page, {'entry': entry, 'hash': content_hash(entry)}, 'entry', start)
+
+    def query_page(self, required=True):
+        """The page= query parameter, checked against the page registry"""
+        query = urllib.parse.parse_qs(urllib.parse.urlsplit(self.path).query)
+        page = query.get('page', [None])[0]
+        if page is None and required:
+            page = 'work'
+        if page is not None and page not in PAGES:
+            raise ValueError(f"Unknown page '{page}'")
+        return page
+
+    def read_json(self):
+        content_length = int(self.headers.get('Content-Length') or 0)
+        return json.loads(self.rfile.read(content_length).decode('utf-8'))
+
+    def send_entries(self):
+        """GET /api/entries?page=&tag= from the in-memory store"""
+        try:
+            page = self.query_page()
+        except ValueError as e:
+            self.send_json(400, {'success': False, 'error': str(e)})
+            return
+        query = urllib.parse.parse_qs(urllib.parse.urlsplit(self.path).query)
+        store = self.server.entries
+        store.refresh()
+        entries = store.entries(page, query.get('tag', [None])[0])
+        self.send_json(200, {
+            'page': page,
+            'stored': page in store.pages(),
+            'settings': store.settings(page),
+            'entries': entries,
+            # Send one back as If-Match with PATCH to detect concurrent edits
+            'hashes': [content_hash(entry) for entry in entries],
+            'count': len(entries)
+        })
+
+    def send_search(self):
+        """Answer ?q=&limit=&page= from the same prebuilt index the browser uses"""
+        query = urllib.parse.parse_qs(urllib.parse.urlsplit(self.path).query)
+        text = query.get('q', [''])[0]
+        page = query.get('page', [None])[0]
+        try:
+            limit = min(int(query.get('limit', ['10'])[0]), 100)
+        except ValueError:
+            self.send_json(400, {'success': False, 'error': 'limit must be an integer'})
+            return
+        if page is not None and page not in PAGES:
+            self.send_json(400, {'success': False, 'error': f'Unknown page {page!r}'})
+            return
+        try:
+            self.send_json(200, self.server.search.search(text, limit, page))
+        except FileNotFoundError:
+            self.send_json(404, {'success': False,
+                                 'error': f'No search index in {SEARCH_DIR}/; run cms_generator.py first'})
+
+    def save_entries(self, page, payload, mode, start):
+        """Rebuild a page from the just-saved store and report the result"""
+        store = self.server.entries
+        publish_changes(self.server, [store.path])
+        try:
+            with self.server.build_lock, self.server.metrics.phase('build'):
+                result = self.server.site.build_from_store(store, [page])[0]
+                search = self.server.site.build_search_index(
+                    {key: value for name in store.pages() for key, value in store.page_data(name).items()})
+        except (OSError, KeyError, ValueError) as e:
+            self.send_json(500, {'success': False, 'error': f'Error rebuilding {page}: {e}'})
+            return
+        publish_rebuild(self.server, [result, search])
+        self.server.save_stats.record(mode, int(self.headers.get('Content-Length') or 0),
+                                      os.path.getsize(result['file']), (time.perf_counter() - start) * 1000)
+        payload.update(success=True, page=page, file=os.path.relpath(result['file']),
+                       written=result['written'])
+        self.send_json(200, payload)
+        print(f"✅ Saved {page} entries to {store.path}"
+              f"{' and rebuilt ' + os.path.relpath(result['file']) if result['written'] else ''}")
+
+    def open_event_stream(self):
+        """Start an SSE response and hand the socket to the broadcaster"""
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.send_header('Cache-Control', 'no-cache')
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.end_headers()
+        self.wfile.write(b'retry: 1000\n\n')
+        self.wfile.flush()
+        self.close_connection = True
+        self.server.detach_request(self.request)
+        self.server.live_reload.attach(self.request)
+
+    def send_git_job_status(self, job_id):
+        """Report the state of a queued git commit"""
+        job = self.server.git_jobs.get(job_id)
+        if job is None:
+            self.send_error(404, f"Unknown git job: {job_id}")
+            return
+        self.send_json(200, job)
+
+    def send_json(self, status, payload):
+        """Send a JSON response with the CORS header the CMS UI expects"""
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.end_headers()
+        self.wfile.write(body)
+
     def do_OPTIONS(self):
         """Handle CORS preflight requests"""
         self.send_response(200)
         self.send_header('Access-Control-Allow-Origin', '*')
-        self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
+        self.send_header('Access-Control-Allow-Methods', 'GET, POST, PUT, PATCH, OPTIONS')
         self.send_header('Access-Control-Allow-Headers', 'Content-Type')
         self.end_headers()
 
+    def send_profile(self):
+        """Sample live traffic for ?seconds=N (default 5) and return the hot spots"""
+        if not self.server.profiling:
+            self.send_json(403, {'success': False, 'error': 'Start the server with --enable-profiling'})
+            return
+        query = urllib.parse.parse_qs(urllib.parse.urlsplit(self.path).query)
+        try:
+            seconds = float(query.get('seconds', ['5'])[0])
+        except ValueError:
+            seconds = -1
+        if not 0 < seconds <= MAX_PROFILE_SECONDS:
+            self.send_json(400, {'success': False, 'error': f'seconds must be in (0, {MAX_PROFILE_SECONDS}]'})
+            return
+        self.send_json(200, sample_profile(seconds))
+
+    def setup(self):
+        super().setup()
+        self.wfile = CountingWriter(self.wfile)
+
+    def handle_one_request(self):
+        """Handle one request and record its endpoint, status, latency and bytes"""
+        self.response_status = None
+        self.bytes_sendfile = 0
+        self.wfile.count = 0
+        start = time.perf_counter()
+        super().handle_one_request()
+        if self.response_status is None:
+            return  # connection closed before a request arrived
+        headers = getattr(self, 'headers', None)
+        self.server.metrics.observe_request(
+            self.command or '-', getattr(self, 'path', '-'), self.response_status,
+            time.perf_counter() - start,
+            int(headers.get('Content-Length') or 0) if headers else 0,
+            self.wfile.count + self.bytes_sendfile,
+            self.client_address[0]
+        )
+
+    def send_response(self, code, message=None):
+        self.response_status = code
+        super().send_response(code, message)
+
     def log_message(self, format, *args):
-        """Override to reduce logging noise"""
+        """Override to reduce logging noise; use --access-log for structured logs"""
         pass
 
-def run_server(port=8000):
-    """Run the CMS server"""
-    server_address = ('', port)
-    httpd = HTTPServer(server_address, CMSHandler)
+class CMSHTTPServer(HTTPServer):
+    """HTTPServer that lets a handler keep its connection open after returning"""
+
+    def __init__(self, server_address, handler_class, reuse_port=False):
+        # SO_REUSEPORT lets --processes workers each listen on the same port
+        self.reuse_port = reuse_port
+        super().__init__(server_address, handler_class)
+        self._detached = set()
+        self._detached_lock = threading.Lock()
+
+    def server_bind(self):
+        if self.reuse_port:
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        super().server_bind()
+
+    def drain(self):
+        """Handle connections already waiting to be accepted; call after serve_forever() returns"""
+        self.timeout = 0
+        while select.select([self.socket], [], [], 0)[0]:
+            self.handle_request()
+
+    def detach_request(self, request):
+        with self._detached_lock:
+            self._detached.add(request)
+
+    def shutdown_request(self, request):
+        with self._detached_lock:
+            if request in self._detached:
+                self._detached.discard(request)
+                return
+        super().shutdown_request(request)
+
+
+class PooledHTTPServer(CMSHTTPServer):
+    """HTTPServer that hands each connection to a fixed-size worker pool"""
+
+    def __init__(self, server_address, handler_class, workers=DEFAULT_WORKERS, reuse_port=False):
+        super().__init__(server_address, handler_class, reuse_port)
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='cms-worker')
+
+    def process_request(self, request, client_address):
+        self._pool.submit(self._process_request_worker, request, client_address)
+
+    def _process_request_worker(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+    def server_close(self):
+        """Stop listening, then wait for in-flight requests so their saves and git jobs land"""
+        super().server_close()
+        self._pool.shutdown(wait=True)
+
+
+def create_server(port=8000, workers=DEFAULT_WORKERS, host='', cache_bytes=DEFAULT_CACHE_BYTES,
+                  stream_threshold=DEFAULT_STREAM_THRESHOLD, commit_window=DEFAULT_COMMIT_WINDOW,
+                  commit_batch=DEFAULT_COMMIT_BATCH, store_file=STORE_FILE, access_log=None,
+                  profiling=False, feed_url=DEFAULT_FEED_URL, feed_max_age=DEFAULT_MAX_AGE, reuse_port=False):
+    """Build the CMS server; workers <= 1 gives the classic single-threaded server"""
+    server_address = (host, port)
+    if workers > 1:
+        httpd = PooledHTTPServer(server_address, CMSHandler, workers, reuse_port)
+    else:
+        httpd = CMSHTTPServer(server_address, CMSHandler, reuse_port)
+    httpd.metrics = ServerMetrics(access_log)
+    httpd.profiling = profiling
+    httpd.git_jobs = GitJobQueue(window=commit_window, max_batch=commit_batch, metrics=httpd.metrics)
+    httpd.static_cache = StaticFileCache(max_bytes=cache_bytes)
+    httpd.stream_threshold = stream_threshold
+    httpd.live_reload = LiveReloadBroadcaster()
+    httpd.entries = EntryStore(store_file)
+    httpd.site = HTMLGenerator('.')
+    httpd.search = SearchIndex(SEARCH_DIR)
+    httpd.build_lock = threading.Lock()
+    httpd.save_lock = threading.Lock()
+    httpd.save_stats = SaveStats()
+    httpd.peers = None
+    httpd.feed = None
+    if feed_url:
+        httpd.feed = FeedRefresher(FeedStore('.', feed_url), feed_max_age,
+                                   on_update=lambda result: publish_rebuild(httpd, [result]))
+    return httpd
+
+def publish_rebuild(httpd, results):
+    """Evict rebuilt pages from the cache, queue them for commit and tell open tabs"""
+    # Every build result lists the files it wrote or removed: a page with its tag pages, search
+    # shards, image variants, assets. Commit them together so no page links to an uncommitted file
+    files = [os.path.relpath(path) for result in results for path in result['files']]
+    publish_changes(httpd, files, reload=True)
+
+def publish_changes(httpd, files, reload=False):
+    """Evict written files from the cache and queue them for commit, in this process and in
+    every other --processes worker; reload=True also sends open tabs a rebuild event"""
+    apply_changes(httpd, files, reload)
+    if httpd.peers and files:
+        httpd.peers.publish('changed', {'files': files, 'reload': reload})
+
+def apply_changes(httpd, files, reload=False):
+    for path in files:
+        httpd.static_cache.invalidate(path)
+        httpd.git_jobs.track(path)
+    if reload and files:
+        httpd.live_reload.publish('rebuild', {'files': files})
+
+def join_peers(httpd, link, lock_dir):
+    """Make one --processes worker share saves, rebuilds and git jobs with the others"""
+    from cms_prefork import ProcessLock
+
+    httpd.peers = link
+    httpd.save_lock = ProcessLock(os.path.join(lock_dir, 'save.lock'))
+    httpd.build_lock = ProcessLock(os.path.join(lock_dir, 'build.lock'))
+    # One git index: commits from different processes must not overlap
+    httpd.git_jobs.commit_lock = ProcessLock(os.path.join(lock_dir, 'git.lock'))
+    httpd.git_jobs.id_prefix = f'{os.getpid()}-'
+    httpd.git_jobs.on_change = lambda jobs: link.publish('git-jobs', {'jobs': jobs})
+    link.subscribe('changed', lambda message: apply_changes(httpd, message['files'], message['reload']))
+    link.subscribe('git-jobs', lambda message: httpd.git_jobs.mirror(message['jobs']))
+    link.start()
+
+def start_watcher(httpd, data_file):
+    """Rebuild pages when data_file or a template changes and tell open tabs to reload"""
+    from cms_watch import SiteWatcher
+
+    watcher = SiteWatcher(HTMLGenerator('.'), data_file,
+                          on_rebuild=lambda results: publish_rebuild(httpd, results))
+    watcher.start()
+    return watcher
+
+def stop_on_sigterm(httpd):
+    """Make SIGTERM stop serve() gracefully, like Ctrl+C; returns the stop callback"""
+    import signal
+
+    stop = lambda *_: threading.Thread(target=httpd.shutdown, daemon=True).start()
+    signal.signal(signal.SIGTERM, stop)
+    return stop
+
+def serve(httpd, watcher=None):
+    """Serve until Ctrl+C or httpd.shutdown(), then answer connections already queued, wait
+    for in-flight requests, flush pending commits and close"""
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        print("\n🛑 Server stopped")
+    finally:
+        httpd.drain()
+        httpd.server_close()
+        if watcher:
+            watcher.stop()
+        httpd.live_reload.close()
+        httpd.git_jobs.shutdown()
+
+def run_worker(index, link, lock_dir, make_server, watch=None):
+    """One --processes worker: serve until the master sends SIGTERM, then finish in-flight requests"""
+    httpd = make_server(reuse_port=True)
+    join_peers(httpd, link, lock_dir)
+    # One watcher is enough; its rebuilds reach the other workers through publish_rebuild
+    watcher = start_watcher(httpd, watch) if watch and index == 0 else None
+    link.subscribe('stop', stop_on_sigterm(httpd))
+    link.publish('ready')
+    serve(httpd, watcher)
+
+def run_server(port=8000, workers=DEFAULT_WORKERS, cache_bytes=DEFAULT_CACHE_BYTES,
+               stream_threshold=DEFAULT_STREAM_THRESHOLD, watch=None,
+               commit_window=DEFAULT_COMMIT_WINDOW, commit_batch=DEFAULT_COMMIT_BATCH,
+               store_file=STORE_FILE, access_log=None, profiling=False, feed_url=DEFAULT_FEED_URL,
+               feed_max_age=DEFAULT_MAX_AGE, processes=1):
+    """Run the CMS server; processes > 1 pre-forks that many server processes on one port"""
+    log_file = None
+    if access_log == '-':
+        log_file = sys.stdout
+    elif access_log:
+        log_file = open(access_log, 'a', encoding='utf-8')
+    
+    def make_server(reuse_port=False):
+        return create_server(port, workers, cache_bytes=cache_bytes, stream_threshold=stream_threshold,
+                             commit_window=commit_window, commit_batch=commit_batch, store_file=store_file,
+                             access_log=log_file, profiling=profiling, feed_url=feed_url,
+                             feed_max_age=feed_max_age, reuse_port=reuse_port)
+    
+    if processes > 1:
+        from cms_prefork import PreforkMaster, reuse_port_supported
+        if not reuse_port_supported():
+            print("❌ --processes needs fork() and SO_REUSEPORT (Linux, BSD or macOS)")
+            sys.exit(1)
+        master = PreforkMaster(processes, ('', port),
+                               lambda index, link, lock_dir: run_worker(index, link, lock_dir, make_server, watch))
+        port = master.port
+        stored = EntryStore(store_file).pages()
+    else:
+        httpd = make_server()
+        watcher = start_watcher(httpd, watch) if watch else None
+        stored = httpd.entries.pages()
     
     print(f"🚀 CMS Server running on http://localhost:{port}")
     print(f"📝 Open http://localhost:{port}/cms.html to use the CMS")
     print(f"📁 Files will be saved to: {os.getcwd()}")
+    if processes > 1:
+        print(f"🍴 Worker processes: {processes} sharing the port (SO_REUSEPORT); "
+              f"kill -HUP {os.getpid()} restarts them gracefully")
+    print(f"🧵 Worker threads: {workers if workers > 1 else 1}{' per process' if processes > 1 else ''}")
+    print(f"🗂️  Entries store: {store_file} ({', '.join(stored) or 'empty'})")
+    print(f"📊 Metrics at /metrics (Prometheus) and /stats (JSON)"
+          f"{'; profiling at /debug/profile?seconds=N' if profiling else ''}")
+    print(f"📦 Git commits coalesce over {commit_window:g}s or {commit_batch} requests")
+    if feed_url:
+        print(f"📰 /{FEED_FILE} refreshes from {feed_url} when older than {feed_max_age:g}s")
+    if watch:
+        print(f"👀 Watching {watch} and templates; open CMS tabs reload on rebuild")
     print("Press Ctrl+C to stop the server")
     
     try:
-        httpd.serve_forever()
-    except KeyboardInterrupt:
-        print("\n🛑 Server stopped")
+        if processes > 1:
+            master.run()
+            print("\n🛑 Server stopped")
+        else:
+            stop_on_sigterm(httpd)
+            serve(httpd, watcher)
+    finally:
+        if log_file not in (None, sys.stdout):
+            log_file.close()
 
 if __name__ == '__main__':
     import argparse
     
     parser = argparse.ArgumentParser(description='Run CMS development server')
     parser.add_argument('--port', '-p', type=int, default=8000, help='Port to run server on (default: 8000)')
+    parser.add_argument('--workers', '-w', type=int, default=DEFAULT_WORKERS,
+                        help=f'Request worker threads; 1 disables concurrency (default: {DEFAULT_WORKERS})')
+    parser.add_argument('--processes', type=int, default=1,
+                        help='Server processes sharing the port via SO_REUSEPORT, each with --workers '
+                             'threads; SIGHUP restarts them gracefully (default: 1)')
+    parser.add_argument('--cache-mb', type=float, default=DEFAULT_CACHE_BYTES / (1024 * 1024),
+                        help='Static file cache size in MB; 0 disables caching (default: 32)')
+    parser.add_argument('--stream-threshold-kb', type=int, default=DEFAULT_STREAM_THRESHOLD // 1024,
+                        help='Files larger than this are streamed from disk instead of cached (default: 256)')
+    parser.add_argument('--watch', metavar='JSON_FILE',
+                        help='Rebuild pages when this CMS data file or a template changes '
+                             'and push reload events to open CMS tabs')
+    
+    parser.add_argument('--commit-window', type=float, default=DEFAULT_COMMIT_WINDOW,
+                        help='Seconds to gather /git-commit requests into one commit; 0 commits '
+                             f'as soon as the git worker is free (default: {DEFAULT_COMMIT_WINDOW:g})')
+    parser.add_argument('--commit-batch', type=int, default=DEFAULT_COMMIT_BATCH,
+                        help='Commit early once this many requests are waiting '
+                             f'(default: {DEFAULT_COMMIT_BATCH})')
+    parser.add_argument('--store', default=STORE_FILE,
+                        help=f'Entries store served by /api/entries (default: {STORE_FILE})')
+    parser.add_argument('--access-log', metavar='PATH',
+                        help='Write one JSON line per request to PATH ("-" for stdout)')
+    parser.add_argument('--enable-profiling', action='store_true',
+                        help='Serve /debug/profile?seconds=N, a sampling profile of live traffic')
+    parser.add_argument('--feed-url', default=DEFAULT_FEED_URL,
+                        help=f'Feed (URL or local RSS/Atom file) behind /{FEED_FILE}; "" serves the file as is '
+                             f'(default: {DEFAULT_FEED_URL})')
+    parser.add_argument('--feed-max-age', type=float, default=DEFAULT_MAX_AGE,
+                        help=f'Seconds before /{FEED_FILE} is refetched in the background '
+                             f'(default: {DEFAULT_MAX_AGE})')
     
     args = parser.parse_args()
-    run_server(args.port)
+    run_server(args.port, args.workers, int(args.cache_mb * 1024 * 1024),
+               args.stream_threshold_kb * 1024, watch=args.watch,
+               commit_window=args.commit_window, commit_batch=args.commit_batch,
+               store_file=args.store, access_log=args.access_log, profiling=args.enable_profiling,
+               feed_url=args.feed_url, feed_max_age=args.feed_max_age, processes=args.processes)
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Canonical entries store for the CMS
+Keeps every page's entries and settings in one JSON file, indexed by commit hash
+"""
+
+import json
+import os
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from cms_generator import PAGES, atomic_write_bytes, content_hash
+
+STORE_FILE = 'cms_data.json'
+
+
+class ConflictError(Exception):
+    """An update was based on a version of the entry that is no longer current"""
+
+    def __init__(self, current_hash: str):
+        super().__init__(f"Entry changed since it was read (current hash {current_hash})")
+        self.current_hash = current_hash
+
+
+def entry_key(entry: Any) -> str:
+    """An entry's commit hash, or a content hash for entries that have none"""
+    if isinstance(entry, dict) and entry.get('commitHash'):
+        return str(entry['commitHash'])
+    return content_hash(entry)[:12]
+
+
+class EntryStore:
+    """Entries for every page, loaded once and looked up by commit hash.
+
+    The file uses the same layout as a CMS export (workEntries, pageSettings,
+    projectsEntries, ...), so cms_generator.py can build from it directly.
+    """
+
+    def __init__(self, path: str = STORE_FILE):
+        self.path = path
+        self.data: Dict[str, Any] = {}
+        self._index: Dict[str, List[str]] = {}
+        self._lock = threading.RLock()
+        self._mtime_ns: Optional[int] = None
+        self.load()
+
+    def _stat_mtime(self) -> Optional[int]:
+        try:
+            return os.stat(self.path).st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def load(self):
+        mtime_ns = self._stat_mtime()
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            data = {}
+        if not isinstance(data, dict):
+            raise ValueError(f"{self.path}: expected a JSON object")
+        with self._lock:
+            self.data = data
+            self._mtime_ns = mtime_ns
+            self._reindex()
+
+    def refresh(self) -> bool:
+        """Reload if another process rewrote the file since it was loaded or saved here"""
+        with self._lock:
+            if self._stat_mtime() == self._mtime_ns:
+                return False
+            self.load()
+            return True
+
+    def save(self):
+        with self._lock:
+            self._commit(self.data)
+
+    def _commit(self, data: Dict[str, Any]):
+        """Write data to disk and only then make it the store's data, so a failed write changes nothing"""
+        payload = json.dumps(data, indent=2, ensure_ascii=False) + '\n'
+        atomic_write_bytes(self.path, payload.encode('utf-8'), fsync=True)
+        self.data = data
+        self._mtime_ns = self._stat_mtime()
+
+    def _reindex(self):
+        self._index = {}
+        for name in self.pages():
+            for entry in self.data.get(PAGES[name].entries_key) or []:
+                self._index.setdefault(entry_key(entry), []).append(name)
+
+    def pages(self) -> List[str]:
+        """Registered pages that have entries or settings in the store"""
+        return [name for name, spec in PAGES.items()
+                if spec.entries_key in self.data or spec.settings_key in self.data]
+
+    def entries(self, page: str, tag: Optional[str] = None) -> List[Any]:
+        spec = PAGES[page]
+        with self._lock:
+            entries = list(self.data.get(spec.entries_key) or [])
+        if tag is not None:
+            tag = tag.lower()
+            entries = [entry for entry in entries if isinstance(entry, dict)
+                       and any(str(t).lower() == tag for t in entry.get('tags') or [])]
+        return entries
+
+    def settings(self, page: str) -> Dict[str, Any]:
+        with self._lock:
+            return dict(self.data.get(PAGES[page].settings_key) or {})
+
+    def page_data(self, page: str) -> Dict[str, Any]:
+        """The slice of the store HTMLGenerator.build_one expects for a page"""
+        spec = PAGES[page]
+        with self._lock:
+            return {key: self.data[key] for key in (spec.entries_key, spec.settings_key) if key in self.data}
+
+    def find(self, key: str, page: Optional[str] = None) -> Tuple[str, Any]:
+        """Return (page, entry) for a commit hash; KeyError if unknown"""
+        with self._lock:
+            pages = self._index.get(key, [])
+            if page is not None:
+                pages = [name for name in pages if name == page]
+            if not pages:
+                raise KeyError(key)
+            if len(set(pages)) > 1:
+                raise ValueError(f"{key} is used on several pages ({', '.join(sorted(set(pages)))}); "
+                                 f"pass page=")
+            for entry in self.data[PAGES[pages[0]].entries_key]:
+                if entry_key(entry) == key:
+                    return pages[0], entry
+        raise KeyError(key)
+
+    def update(self, key: str, fields: Dict[str, Any], page: Optional[str] = None,
+               base_hash: Optional[str] = None) -> Tuple[str, Any]:
+        """Merge fields into one entry, save the store and return (page, entry).
+
+        When base_hash is given it must match content_hash() of the entry as it
+        is now, otherwise ConflictError is raised and nothing changes. The
+        change is made to a copy that replaces the store's data only once it
+        is on disk, so an OSError from the write leaves the store as it was.
+        """
+        if not isinstance(fields, dict):
+            raise ValueError("Entry update must be a JSON object")
+        with self._lock:
+            page, entry = self.find(key, page)
+            spec = PAGES[page]
+            if not isinstance(entry, dict):
+                raise ValueError(f"{spec.entries_key} entries cannot be updated by field")
+            if base_hash is not None and content_hash(entry) != base_hash:
+                raise ConflictError(content_hash(entry))
+            updated = dict(entry)
+            updated.update(fields)
+            entries = [updated if item is entry else item for item in self.data[spec.entries_key]]
+            self._commit(dict(self.data, **{spec.entries_key: entries}))
+            if 'commitHash' in fields:
+                self._reindex()
+            return page, updated
+
+    def replace_page(self, page: str, entries: List[Any], settings: Optional[Dict[str, Any]] = None):
+        """Replace a page's entries (and settings, when given) wholesale and save the store;
+        like update(), a failed write leaves the store as it was"""
+        if not isinstance(entries, list):
+            raise ValueError("entries must be a JSON array")
+        spec = PAGES[page]
+        with self._lock:
+            data = dict(self.data, **{spec.entries_key: entries})
+            if settings is not None:
+                data[spec.settings_key] = settings
+            self._commit(data)
+            self._reindex()
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Streaming readers for large CMS data files
+Yields entries one at a time from a JSON export or a JSON Lines file
+"""
+
+import json
+import re
+from typing import Any, Collection, IO, Iterator, Tuple
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+WHITESPACE = ' \t\n\r'
+# What skip_value() has to look at: whole strings and brackets, or a lone quote for a string cut at the
+# chunk end, whose rest is scanned for its closing quote or an escape. A number or literal runs to SCALAR_END_RE
+SKIP_TOKEN_RE = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"|[\[\]{}]|"')
+STRING_SPECIAL_RE = re.compile(r'["\\]')
+SCALAR_END_RE = re.compile(r'[\s,\]}]')
+
+
+class JSONStreamReader:
+    """Incremental reader for one JSON document that never holds more than one value"""
+
+    def __init__(self, fp: IO[str], chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self.fp = fp
+        self.chunk_size = chunk_size
+        self.decoder = json.JSONDecoder()
+        self.buffer = ''
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self, size: int = 0) -> bool:
+        """Read another chunk (at least `size` characters), dropping what has been consumed;
+        False at EOF"""
+        if self.eof:
+            return False
+        chunk = self.fp.read(max(size, self.chunk_size))
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character without consuming it ('' at EOF)"""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill():
+                return ''
+
+    def _expect(self, char: str):
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Expected '{char}' at offset {self.pos}, found {found or 'end of file'!r}")
+        self.pos += 1
+
+    def decode_value(self) -> Any:
+        """Decode the next complete JSON value, reading more input as needed"""
+        if self.peek() not in '"[{':
+            # A number cut at the chunk end ("12." of "12.5") would decode early
+            while not SCALAR_END_RE.search(self.buffer, self.pos) and self._fill():
+                pass
+        while True:
+            # Each retry parses from the value's start, so at least double what is buffered:
+            # the total work for a large value stays linear in its size
+            pending = len(self.buffer) - self.pos
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                # Probably cut off mid-value; read more and retry
+                if self._fill(pending):
+                    continue
+                raise
+            # A number at the very end of the buffer may continue in the next chunk
+            if end == len(self.buffer) and self._fill(pending):
+                continue
+            self.pos = end
+            return value
+
+    def skip_value(self):
+        """Step over the next JSON value without building it, holding one chunk at a time"""
+        first = self.peek()
+        if first == '':
+            raise ValueError("Expected a value, found end of file")
+        if first not in '"[{':
+            # Number, true, false or null: runs to the next delimiter
+            while True:
+                match = SCALAR_END_RE.search(self.buffer, self.pos)
+                if match:
+                    self.pos = match.start()
+                    return
+                self.pos = len(self.buffer)
+                if not self._fill():
+                    return
+        depth = 0
+        in_string = False
+        escaped = False
+        while True:
+            if in_string:
+                # Rest of a string that did not fit in the buffer
+                if escaped:
+                    if self.pos >= len(self.buffer) and not self._fill():
+                        break
+                    self.pos += 1
+                    escaped = False
+                match = STRING_SPECIAL_RE.search(self.buffer, self.pos)
+                if match is None:
+                    self.pos = len(self.buffer)
+                    if not self._fill():
+                        break
+                    continue
+                self.pos = match.end()
+                if match.group() == '\\':
+                    escaped = True
+                    continue
+                in_string = False
+                if depth == 0:
+                    return
+                continue
+            for match in SKIP_TOKEN_RE.finditer(self.buffer, self.pos):
+                token = match.group()
+                if token == '"':
+                    in_string = True
+                elif token[0] != '"':
+                    depth += 1 if token in '[{' else -1
+                if in_string or depth == 0:
+                    self.pos = match.end()
+                    if in_string:
+                        break
+                    return
+            else:
+                self.pos = len(self.buffer)
+                if not self._fill():
+                    break
+        raise ValueError("Unterminated JSON value at end of file")
+
+    def iter_array(self) -> Iterator[Any]:
+        """Yield the elements of the array at the current position one by one"""
+        self._expect('[')
+        if self.peek() == ']':
+            self.pos += 1
+            return
+        while True:
+            yield self.decode_value()
+            separator = self.peek()
+            self.pos += 1
+            if separator == ']':
+                return
+            if separator != ',':
+                raise ValueError(f"Expected ',' or ']' in array, found {separator or 'end of file'!r}")
+
+    def iter_object(self, stream_key: str, keep: Collection[str] = ()) -> Iterator[Tuple[str, Any]]:
+        """Yield (key, item) for each item of the array under stream_key and (key, value) for
+        the members named in keep; every other member is skipped without being decoded"""
+        self._expect('{')
+        if self.peek() == '}':
+            self.pos += 1
+            return
+        while True:
+            key = self.decode_value()
+            self._expect(':')
+            if key == stream_key and self.peek() == '[':
+                for item in self.iter_array():
+                    yield key, item
+            elif key == stream_key or key in keep:
+                yield key, self.decode_value()
+            else:
+                self.skip_value()
+            separator = self.peek()
+            self.pos += 1
+            if separator == '}':
+                return
+            if separator != ',':
+                raise ValueError(f"Expected ',' or '}}' in object, found {separator or 'end of file'!r}")
+
+
+def iter_data_file(path: str, entries_key: str, settings_key: str) -> Iterator[Tuple[str, Any]]:
+    """Yield (key, value) pairs from a CMS data file without loading it whole.
+
+    Each entry is yielded separately as (entries_key, entry), and the page
+    settings as (settings_key, settings). JSON files may be the usual export
+    object or a bare array of entries; other pages' members of an export are
+    skipped without being decoded. In JSON Lines files
+    (.jsonl / .ndjson) every line is an entry, except a line holding only
+    {settings_key: {...}}, which sets the page settings.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        if path.endswith(('.jsonl', '.ndjson')):
+            for line_number, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    value = json.loads(line)
+                except json.JSONDecodeError as e:
+                    raise ValueError(f"{path}:{line_number}: {e}") from e
+                if isinstance(value, dict) and list(value) == [settings_key]:
+                    yield settings_key, value[settings_key]
+                else:
+                    yield entries_key, value
+            return
+
+        reader = JSONStreamReader(f)
+        first = reader.peek()
+        if first == '[':
+            for item in reader.iter_array():
+                yield entries_key, item
+        elif first == '{':
+            yield from reader.iter_object(entries_key, keep=(settings_key,))
+        else:
+            raise ValueError(f"{path}: expected a JSON object or array")
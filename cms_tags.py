@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Tag registry and inverted tag index for the CMS generator
+Colors come from _templates/tags.json; the index maps each tag to its entries
+"""
+
+import hashlib
+import json
+import re
+from typing import Any, Dict, List, Optional
+
+TAGS_FILE = 'tags.json'
+DEFAULT_TAG_COLOR = 'bg-gray-100 text-gray-700'
+
+
+def tag_slug(tag: str) -> str:
+    """URL-safe name for a tag: 'LLaMA 3.1' -> 'llama-3-1'"""
+    slug = re.sub(r'[^a-z0-9]+', '-', tag.lower()).strip('-')
+    return slug or 'tag-' + hashlib.sha256(tag.encode('utf-8')).hexdigest()[:8]
+
+
+class TagRegistry:
+    """Tag colors read from a JSON config once, then looked up per badge.
+
+    The file holds {"default": "...", "colors": {"Python": "bg-blue-100 text-blue-700", ...}}.
+    A missing file gives every tag the default color.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._colors: Optional[Dict[str, str]] = None
+        self.default = DEFAULT_TAG_COLOR
+        self._key = ''
+
+    def load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                source = f.read()
+        except FileNotFoundError:
+            source = '{}'
+        config = json.loads(source)
+        self.default = config.get('default', DEFAULT_TAG_COLOR)
+        self._colors = dict(config.get('colors') or {})
+        self._key = hashlib.sha256(source.encode('utf-8')).hexdigest()[:16]
+
+    def reload(self):
+        """Forget the loaded config; the next lookup reads the file again"""
+        self._colors = None
+
+    @property
+    def colors(self) -> Dict[str, str]:
+        if self._colors is None:
+            self.load()
+        return self._colors
+
+    def color_class(self, tag: str) -> str:
+        return self.colors.get(tag, self.default)
+
+    def config_key(self) -> str:
+        """Hash of the config, so builds re-render badges when colors change"""
+        if self._colors is None:
+            self.load()
+        return self._key
+
+
+class TagIndex:
+    """Inverted index from tag slug to the positions of the entries carrying it"""
+
+    def __init__(self):
+        self.names: Dict[str, str] = {}
+        self.postings: Dict[str, List[int]] = {}
+
+    @classmethod
+    def from_entries(cls, entries: List[Any]) -> 'TagIndex':
+        index = cls()
+        for position, entry in enumerate(entries):
+            if isinstance(entry, dict):
+                index.add(position, entry.get('tags') or [])
+        return index
+
+    def add(self, position: int, tags: List[str]):
+        seen = set()
+        for tag in tags:
+            slug = tag_slug(str(tag))
+            if slug in seen:
+                continue
+            seen.add(slug)
+            self.names.setdefault(slug, str(tag))
+            self.postings.setdefault(slug, []).append(position)
+
+    def slugs(self) -> List[str]:
+        """Tags by entry count, most used first"""
+        return sorted(self.postings, key=lambda slug: (-len(self.postings[slug]), slug))
+
+    def to_json(self, registry: TagRegistry, url_prefix: str) -> Dict[str, Any]:
+        """Compact index: tag metadata plus entry positions in the full page"""
+        return {
+            'tags': {
+                slug: {
+                    'name': self.names[slug],
+                    'count': len(self.postings[slug]),
+                    'color': registry.color_class(self.names[slug]),
+                    'url': f'{url_prefix}/{slug}.html'
+                }
+                for slug in self.slugs()
+            },
+            'entries': {slug: self.postings[slug] for slug in self.slugs()}
+        }
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Compiled HTML templates for the CMS generator
+Templates are parsed once into literal/placeholder segments and rendered by joining them
+"""
+
+import marshal
+import os
+import re
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '_templates')
+# Compiled segments are cached next to the templates, like .pyc files
+TEMPLATE_CACHE_DIR = '__pycache__'
+TEMPLATE_CACHE_VERSION = 1
+
+# {name} is HTML-escaped on render, {name|raw} is inserted as-is. Only bare
+# identifiers match, so CSS blocks like "body { ... }" pass through untouched.
+PLACEHOLDER_RE = re.compile(r'\{([A-Za-z_][A-Za-z0-9_]*)(\|raw)?\}')
+NEEDS_ESCAPE_RE = re.compile(r'[&<>"\']')
+
+
+def escape(value: Any) -> str:
+    """Escape a value for use in HTML text or a quoted attribute"""
+    if not isinstance(value, str):
+        value = str(value)
+    # Most field values are plain text; skip the five replace() passes
+    if NEEDS_ESCAPE_RE.search(value) is None:
+        return value
+    # Same output as html.escape(value, quote=True), without importing html.entities
+    return (value.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+            .replace('"', '&quot;').replace("'", '&#x27;'))
+
+
+class Template:
+    """A template compiled into alternating literal and placeholder segments"""
+
+    def __init__(self, source: str, name: str = '<string>',
+                 segments: Optional[List[Tuple[str, Optional[str], bool]]] = None):
+        self.source = source
+        self.name = name
+        if segments is None:
+            segments = []
+            position = 0
+            for match in PLACEHOLDER_RE.finditer(source):
+                segments.append((source[position:match.start()], match.group(1), bool(match.group(2))))
+                position = match.end()
+            segments.append((source[position:], None, False))
+        self.segments = segments
+        self.placeholders = {name for _, name, _ in self.segments if name}
+
+        # Compile to a str.format pattern with positional fields so render()
+        # does the joining in C rather than in a Python loop
+        pattern = []
+        self._fields: List[Tuple[str, bool]] = []
+        for literal, name, raw in self.segments:
+            pattern.append(literal.replace('{', '{{').replace('}', '}}'))
+            if name is not None:
+                pattern.append('{%d}' % len(self._fields))
+                self._fields.append((name, raw))
+        self._pattern = ''.join(pattern)
+
+    def render_parts(self, context: Dict[str, Any]) -> Iterator[str]:
+        """Yield the rendered output piece by piece"""
+        for literal, name, raw in self.segments:
+            if literal:
+                yield literal
+            if name is not None:
+                value = context[name]
+                yield value if raw else escape(value)
+
+    def render(self, context: Dict[str, Any]) -> str:
+        return self._pattern.format(*[
+            context[name] if raw else escape(context[name]) for name, raw in self._fields
+        ])
+
+    def render_around(self, slot: str, context: Dict[str, Any]) -> Tuple[str, str]:
+        """Render everything before and after a single placeholder, leaving it open"""
+        before: List[str] = []
+        after: List[str] = []
+        target = before
+        for literal, name, raw in self.segments:
+            target.append(literal)
+            if name == slot:
+                target = after
+            elif name is not None:
+                value = context[name]
+                target.append(value if raw else escape(value))
+        return ''.join(before), ''.join(after)
+
+
+class TemplateLoader:
+    """Loads templates from a directory, compiling each file once.
+
+    Compiled segments are also cached on disk (marshal, keyed by the file's
+    mtime and size) so a fresh process skips parsing unchanged templates.
+    """
+
+    def __init__(self, directory: str = TEMPLATE_DIR, disk_cache: bool = True):
+        self.directory = directory
+        self.disk_cache = disk_cache
+        self._cache: Dict[str, Template] = {}
+
+    def get(self, name: str) -> Template:
+        template = self._cache.get(name)
+        if template is None:
+            template = self._cache[name] = self._load(name)
+        return template
+
+    def _load(self, name: str) -> Template:
+        path = os.path.join(self.directory, name)
+        cache_path = os.path.join(self.directory, TEMPLATE_CACHE_DIR, name + '.segments')
+        st = os.stat(path)
+        key = (TEMPLATE_CACHE_VERSION, st.st_mtime_ns, st.st_size)
+        if self.disk_cache:
+            try:
+                with open(cache_path, 'rb') as f:
+                    cached_key, source, segments = marshal.load(f)
+                if tuple(cached_key) == key:
+                    return Template(source, name, [tuple(segment) for segment in segments])
+            except (OSError, EOFError, ValueError, TypeError):
+                pass
+
+        with open(path, 'r', encoding='utf-8') as f:
+            source = f.read()
+        # Editors add a final newline; it is not part of the template
+        if source.endswith('\n'):
+            source = source[:-1]
+        template = Template(source, name)
+        if self.disk_cache:
+            try:
+                os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+                tmp_path = f'{cache_path}.{os.getpid()}.tmp'
+                with open(tmp_path, 'wb') as f:
+                    marshal.dump((key, source, template.segments), f)
+                os.replace(tmp_path, cache_path)
+            except OSError:
+                pass  # read-only checkout: compile every time
+        return template
+
+    def clear(self):
+        """Forget compiled templates so edited files are read again"""
+        self._cache.clear()
+
+    def __getitem__(self, name: str) -> Template:
+        return self.get(name + '.html')
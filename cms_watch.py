@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Watch mode for the CMS generator
+Polls the data file and templates and rebuilds only the pages an edit affects
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from cms_assets import SOURCE_DIRS
+from cms_generator import PAGES, HTMLGenerator, content_hash, split_page_data
+from cms_tags import TAGS_FILE
+
+DEFAULT_POLL_INTERVAL = 0.02
+DEFAULT_DEBOUNCE = 0.03
+
+
+class FileWatcher:
+    """Detects changes to a set of files by polling their mtime and size"""
+
+    def __init__(self, paths_fn: Callable[[], List[str]]):
+        self.paths_fn = paths_fn
+        self.snapshot = self._scan()
+
+    def _scan(self) -> Dict[str, Tuple[int, int]]:
+        state = {}
+        for path in self.paths_fn():
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            state[path] = (st.st_mtime_ns, st.st_size)
+        return state
+
+    def changed(self) -> Set[str]:
+        """Paths created, modified or deleted since the last call"""
+        current = self._scan()
+        changed = {path for path in current.keys() | self.snapshot.keys()
+                   if current.get(path) != self.snapshot.get(path)}
+        self.snapshot = current
+        return changed
+
+    def quiet_for(self, paths: Set[str]) -> float:
+        """Seconds since the most recent modification among paths"""
+        newest = max((self.snapshot[path][0] for path in paths if path in self.snapshot), default=0)
+        return time.time() - newest / 1e9
+
+
+class SiteWatcher:
+    """Rebuilds affected pages whenever the data file or a template changes"""
+
+    def __init__(self, generator: HTMLGenerator, data_file: str,
+                 interval: float = DEFAULT_POLL_INTERVAL, debounce: float = DEFAULT_DEBOUNCE,
+                 on_rebuild: Optional[Callable[[List[Dict[str, Any]]], None]] = None):
+        self.generator = generator
+        self.data_file = os.path.abspath(data_file)
+        self.template_dir = os.path.abspath(generator.templates.directory)
+        self.interval = interval
+        self.debounce = debounce
+        self.on_rebuild = on_rebuild
+        self.page_hashes: Dict[str, str] = {}
+        self.files = FileWatcher(self.watched_files)
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def watched_files(self) -> List[str]:
+        files = [self.data_file]
+        try:
+            files += [os.path.join(self.template_dir, name) for name in os.listdir(self.template_dir)
+                      if name.endswith('.html') or name == TAGS_FILE]
+        except OSError:
+            pass
+        if self.generator.resize_images:
+            files += self.image_files()
+        if self.generator.minify:
+            files += self.asset_files()
+        return files
+
+    def image_files(self) -> List[str]:
+        return [os.path.abspath(os.path.join(self.generator.base_dir, src))
+                for src in self.generator.images.sources()]
+
+    def asset_files(self) -> List[str]:
+        return [os.path.abspath(os.path.join(self.generator.base_dir, src))
+                for src in self.generator.assets.sources()]
+
+    def load_data(self) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self.data_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            # Usually an editor caught mid-save; the next write triggers another pass
+            print(f"❌ Could not read {self.data_file}: {e}")
+            return None
+
+    def build(self, changed: Set[str]) -> List[Dict[str, Any]]:
+        """Rebuild the pages whose data slice or templates are among the changed files"""
+        data = self.load_data()
+        if data is None:
+            return []
+
+        results = []
+        image_dir = os.path.abspath(self.generator.images.source_dir)
+        changed_images = {path for path in changed if os.path.dirname(path) == image_dir}
+        if changed_images and self.generator.resize_images:
+            images = self.generator.build_images()
+            for src, error in images['errors'].items():
+                print(f"⚠️  Skipped {src}: {error}")
+            if images['written']:
+                results.append(images)
+
+        asset_dirs = {os.path.abspath(os.path.join(self.generator.base_dir, directory))
+                      for directory in SOURCE_DIRS}
+        changed_assets = {path for path in changed if os.path.dirname(path) in asset_dirs}
+        if changed_assets and self.generator.minify:
+            assets = self.generator.build_assets()
+            for src, error in assets['errors'].items():
+                print(f"⚠️  Skipped {src}: {error}")
+            if assets['written']:
+                results.append(assets)
+        # New fingerprints change every page that loads the asset
+        refingerprinted = any(result['page'] == 'assets' for result in results)
+
+        changed_templates = {os.path.splitext(os.path.basename(path))[0]
+                             for path in changed - changed_images - changed_assets if path != self.data_file}
+        if os.path.splitext(TAGS_FILE)[0] in changed_templates:
+            changed_templates.add('tag')  # tag colors affect every page with badges
+        if changed_templates:
+            self.generator.reload_templates()
+        if any(result['page'] == 'images' for result in results):
+            changed_templates.add('picture')  # new variants change every page's markup
+
+        for name, subset in split_page_data(data).items():
+            page_hash = content_hash(subset)
+            if (not refingerprinted and self.page_hashes.get(name) == page_hash
+                    and changed_templates.isdisjoint(PAGES[name].template_names())):
+                continue
+            try:
+                results.append(self.generator.build_one(name, subset))
+            except (KeyError, OSError, ValueError) as e:
+                print(f"❌ Error rebuilding {PAGES[name].output}: {e}")
+                continue
+            self.page_hashes[name] = page_hash
+
+        if any(result['page'] in PAGES for result in results):
+            self.generator.manifest.save()
+            if self.generator.search:
+                search = self.generator.build_search_index(data)
+                if search['written']:
+                    results.append(search)
+        return results
+
+    def poll(self) -> List[Dict[str, Any]]:
+        """Check for changes once, waiting out a burst of writes before rebuilding"""
+        changed = self.files.changed()
+        if not changed:
+            return []
+        # Wait until nothing has been written for `debounce` seconds, measured
+        # from the files' own mtimes so a save that is already settled builds at once
+        while True:
+            remaining = self.debounce - self.files.quiet_for(changed)
+            if remaining > 0:
+                time.sleep(remaining)
+            more = self.files.changed()
+            if not more:
+                break
+            changed |= more
+
+        start = time.perf_counter()
+        results = self.build(changed)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        for result in results:
+            if result['page'] == 'search':
+                print(f"🔎 Rebuilt search index ({result['documents']} documents, {result['shards']} shards)")
+            elif result['page'] == 'images':
+                print(f"🖼️  Rebuilt {result['variants']} image variant(s)")
+            elif result['page'] == 'assets':
+                print(f"📦 Rebuilt {result['minified']} asset(s)"
+                      + (f", updated references in {len(result['pages'])} page(s)" if result['pages'] else ''))
+            elif result['written']:
+                print(f"🔁 Rebuilt {result['file']} ({result['rendered']} rendered, "
+                      f"{result['reused']} reused, {result['total_ms']:.1f} ms)")
+        if results:
+            print(f"👀 {len(changed)} file{'s' if len(changed) != 1 else ''} changed, "
+                  f"rebuild took {elapsed_ms:.1f} ms")
+            if self.on_rebuild:
+                self.on_rebuild(results)
+        return results
+
+    def run(self):
+        """Build once, then poll until stop() is called"""
+        self.build({self.data_file})
+        while not self._stop.wait(self.interval):
+            self.poll()
+
+    def start(self) -> threading.Thread:
+        self._thread = threading.Thread(target=self.run, name='cms-watch', daemon=True)
+        self._thread.start()
+        return self._thread
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
@@ -4,129 +4,78 @@ Git automation script for CMS updates
 Automatically commits and pushes changes to the repository
 """
 
-import subprocess
 import sys
-import os
-from datetime import datetime
 
-def run_command(command, check=True):
-    """Run a shell command and return the result"""
-    try:
-        result = subprocess.run(command, shell=True, capture_output=True, text=True, check=check)
-        return result.stdout.strip(), result.stderr.strip()
-    except subprocess.CalledProcessError as e:
-        print(f"❌ Command failed: {command}")
-        print(f"Error: {e.stderr}")
-        return None, e.stderr
-
-def check_git_status():
+from cms_git import GitError, GitService
+
+def check_git_status(service=None):
     """Check if there are any changes to commit"""
-    stdout, stderr = run_command("git status --porcelain", check=False)
-    if stdout:
+    service = service or GitService()
+    try:
+        status = service.status()
+    except GitError:
+        print("❌ Not in a git repository")
+        return False
+
+    if status['changes']:
         print("📝 Changes detected:")
-        for line in stdout.split('\n'):
-            if line.strip():
-                print(f"  {line}")
+        for path, code in sorted(status['changes'].items()):
+            print(f"  {code} {path}")
         return True
     else:
         print("✅ No changes to commit")
         return False
 
-def get_commit_message():
-    """Generate or get commit message"""
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
-    
-    # Check what files were modified
-    stdout, _ = run_command("git diff --name-only", check=False)
-    if not stdout:
-        stdout, _ = run_command("git diff --cached --name-only", check=False)
-    
-    files = stdout.split('\n') if stdout else []
-    
-    if 'work.html' in files:
-        return f"feat: update work log entries via CMS ({timestamp})"
-    elif 'projects.html' in files:
-        return f"feat: update projects via CMS ({timestamp})"
-    elif 'publications.html' in files:
-        return f"feat: update publications via CMS ({timestamp})"
-    elif 'photography.html' in files:
-        return f"feat: update photography via CMS ({timestamp})"
-    else:
-        return f"chore: update content via CMS ({timestamp})"
-
-def commit_and_push(message=None, push=True):
-    """Commit changes and optionally push to remote"""
-    
-    # Check if we're in a git repository
-    stdout, stderr = run_command("git rev-parse --git-dir", check=False)
-    if not stdout:
-        print("❌ Not in a git repository")
-        return False
-    
-    # Check for changes
-    if not check_git_status():
+def print_timings(timings):
+    print("⏱️  " + ", ".join(f"{phase} {ms:.1f} ms" for phase, ms in timings.items()))
+
+def commit_and_push(message=None, push=True, files=None):
+    """Commit changes (only `files` when given) and optionally push to remote"""
+    service = GitService()
+    result = service.commit(message, paths=files, push=push)
+
+    if not result['files'] and result['success']:
+        print("✅ No changes to commit")
+        print_timings(result['timings_ms'])
         return True
-    
-    # Add all changes
-    print("📦 Adding changes...")
-    stdout, stderr = run_command("git add .")
-    if stderr:
-        print(f"⚠️  Warning during git add: {stderr}")
-    
-    # Generate commit message if not provided
-    if not message:
-        message = get_commit_message()
-    
-    print(f"💾 Committing with message: {message}")
-    
-    # Commit changes
-    commit_cmd = f'git commit -m "{message}"'
-    stdout, stderr = run_command(commit_cmd)
-    if stderr and "nothing to commit" not in stderr:
-        print(f"❌ Commit failed: {stderr}")
-        return False
-    
-    print("✅ Changes committed successfully")
-    
-    # Push to remote if requested
-    if push:
-        print("🚀 Pushing to remote...")
-        
-        # Get current branch
-        branch_stdout, _ = run_command("git branch --show-current")
-        branch = branch_stdout if branch_stdout else "main"
-        
-        push_cmd = f"git push origin {branch}"
-        stdout, stderr = run_command(push_cmd, check=False)
-        
-        if stderr and "error" in stderr.lower():
-            print(f"❌ Push failed: {stderr}")
+
+    print(f"📦 Committed {len(result['files'])} file(s): {', '.join(result['files'])}")
+    if result['commit']:
+        print(f"💾 {result['commit']} {result['message']}")
+
+    if not result['success']:
+        print(f"❌ {result['error']}")
+        if result['commit']:
             print("💡 You may need to run 'git push' manually")
-            return False
-        else:
-            print("✅ Changes pushed to remote successfully")
-    
+        print_timings(result['timings_ms'])
+        return False
+
+    if result['pushed']:
+        print(f"✅ Changes pushed to {service.remote}/{result['branch']}")
+    print_timings(result['timings_ms'])
     return True
 
 def main():
     import argparse
-    
+
     parser = argparse.ArgumentParser(description='Automate git commit and push for CMS updates')
+    parser.add_argument('files', nargs='*', help='Only commit these files (default: every changed file)')
     parser.add_argument('-m', '--message', help='Custom commit message')
     parser.add_argument('--no-push', action='store_true', help='Commit only, do not push')
     parser.add_argument('--status', action='store_true', help='Show git status only')
-    
+
     args = parser.parse_args()
-    
+
     if args.status:
         check_git_status()
         return
-    
+
     success = commit_and_push(
         message=args.message,
-        push=not args.no_push
+        push=not args.no_push,
+        files=args.files or None
     )
-    
+
     if success:
         print("\n🎉 All done! Your changes are ready.")
     else: